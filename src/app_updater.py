@@ -4,34 +4,93 @@ Checks for new releases on GitHub and notifies users.
 """
 
 import json
+import os
+import time
 import urllib.request
 import urllib.error
+from pathlib import Path
 from typing import Optional, Tuple, Dict
 import re
 
 
+# How long a successful update check is reused across launches
+CHECK_CACHE_TTL = 3600
+# Release notes longer than this are cut before they reach the dialog
+MAX_NOTES_CHARS = 16384
+
+
 class AppUpdater:
     """Checks for FM Reloaded updates on GitHub."""
 
-    def __init__(self, current_version: str, github_repo: str = "jo13310/FM_Reloaded"):
+    def __init__(self, current_version: str, github_repo: str = "jo13310/FM_Reloaded",
+                 cache_file: Optional[Path] = None):
         """
         Initialize the app updater.
 
         Args:
             current_version: Current app version (e.g., "0.5.0")
             github_repo: GitHub repository in format "owner/repo"
+            cache_file: Optional file to remember the last successful check in
         """
         self.current_version = current_version
         self.github_repo = github_repo
         self.api_url = f"https://api.github.com/repos/{github_repo}/releases/latest"
+        self.cache_file = Path(cache_file) if cache_file else None
 
-    def check_for_updates(self) -> Tuple[bool, Optional[Dict]]:
+    def check_for_updates(self, use_cache: bool = False) -> Tuple[bool, Optional[Dict]]:
         """
         Check if a newer version is available.
 
+        Args:
+            use_cache: Reuse a result from cache_file younger than CHECK_CACHE_TTL
+
         Returns:
             Tuple of (update_available: bool, release_info: dict or None)
         """
+        if use_cache:
+            cached = self._load_cached_check()
+            if cached is not None:
+                return cached
+
+        result = self._fetch_update_info()
+        if result is not None:
+            self._save_cached_check(result)
+            return result
+        return False, None
+
+    def _load_cached_check(self) -> Optional[Tuple[bool, Optional[Dict]]]:
+        """Return the last check result if it is fresh and for this version."""
+        if not self.cache_file:
+            return None
+        try:
+            if time.time() - os.path.getmtime(self.cache_file) > CHECK_CACHE_TTL:
+                return None
+            with open(self.cache_file, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if data.get('current_version') != self.current_version or data.get('repo') != self.github_repo:
+            return None
+        return bool(data.get('has_update')), data.get('release_info')
+
+    def _save_cached_check(self, result: Tuple[bool, Optional[Dict]]) -> None:
+        """Remember a successful check; failures are never cached."""
+        if not self.cache_file:
+            return
+        try:
+            self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.cache_file, 'w', encoding='utf-8') as f:
+                json.dump({
+                    'current_version': self.current_version,
+                    'repo': self.github_repo,
+                    'has_update': result[0],
+                    'release_info': result[1],
+                }, f)
+        except OSError as e:
+            print(f"Warning: Could not cache update check: {e}")
+
+    def _fetch_update_info(self) -> Optional[Tuple[bool, Optional[Dict]]]:
+        """Query GitHub; returns None when the check itself failed."""
         try:
             # Fetch latest release info from GitHub API
             request = urllib.request.Request(
@@ -49,13 +108,16 @@ class AppUpdater:
             if not latest_version:
                 return False, None
 
+            body = data.get('body') or 'No release notes available.'
+
             # Compare versions
             if self._is_newer_version(latest_version, self.current_version):
                 release_info = {
                     'version': latest_version,
                     'tag_name': tag_name,
                     'name': data.get('name', f'Version {latest_version}'),
-                    'body': data.get('body', 'No release notes available.'),
+                    'body': body,
+                    'notes': self.format_release_notes(body),
                     'html_url': data.get('html_url', ''),
                     'download_url': self._find_download_url(data),
                     'published_at': data.get('published_at', '')
@@ -69,13 +131,42 @@ class AppUpdater:
                 print(f"Repository not found: {self.github_repo}")
             else:
                 print(f"HTTP error checking for updates: {e.code}")
-            return False, None
+            return None
         except urllib.error.URLError as e:
             print(f"Network error checking for updates: {e}")
-            return False, None
+            return None
         except Exception as e:
             print(f"Error checking for updates: {e}")
-            return False, None
+            return None
+
+    @staticmethod
+    def format_release_notes(body: str, limit: int = MAX_NOTES_CHARS) -> str:
+        """
+        Turn GitHub release markdown into plain text for the update dialog.
+
+        Args:
+            body: Release body (markdown)
+            limit: Maximum number of characters kept
+
+        Returns:
+            Plain text notes
+        """
+        text = body.replace('\r\n', '\n')
+        truncated = len(text) > limit
+        if truncated:
+            text = text[:limit]
+        lines = []
+        for line in text.split('\n'):
+            stripped = line.lstrip()
+            if stripped.startswith('#'):
+                line = stripped.lstrip('#').strip()
+            elif stripped[:2] in ('- ', '* ', '+ '):
+                line = line[:len(line) - len(stripped)] + '\u2022 ' + stripped[2:]
+            lines.append(line.replace('**', '').replace('__', '').replace('`', ''))
+        text = '\n'.join(lines)
+        if truncated:
+            text += '\n\n\u2026 (see the release page for the full notes)'
+        return text
 
     def _extract_version(self, tag_name: str) -> Optional[str]:
         """
@@ -10,7 +10,6 @@ import subprocess
 from pathlib import Path
 from typing import Dict, List, Optional
 import zipfile
-import rarfile  # Note: Requires rarfile package and WinRAR/UnRAR
 import configparser
 from datetime import datetime
 
@@ -19,7 +18,8 @@ try:
     from core.security_utils import (
         is_protected_system_directory,
         safe_delete_path,
-        safe_delete_with_boundary_check
+        safe_delete_with_boundary_check,
+        safe_extract_zip
     )
 except ImportError:
     # Fallback if module not available
@@ -64,6 +64,11 @@ except ImportError:
         path.resolve().relative_to(allowed_root.resolve())
         return safe_delete_path(path, allow_symlink_delete)
 
+    def safe_extract_zip(zip_path: Path, dest: Path, **kwargs) -> None:
+        """Fallback: plain extraction."""
+        with zipfile.ZipFile(zip_path, 'r') as zf:
+            zf.extractall(dest)
+
 
 class BepInExManager:
     """Manages BepInEx installation and configuration for Football Manager 26."""
@@ -101,6 +106,8 @@ class BepInExManager:
         self.bepinex_dir = self.fm_install_dir / "BepInEx"
         self.config_file = self.bepinex_dir / "config" / "BepInEx.cfg"
         self.latest_log = self.bepinex_dir / "LogOutput.log"
+        # (BepInEx dir mtime_ns, latest log path) from the last lookup
+        self._log_cache = None
 
     def is_installed(self) -> bool:
         """
@@ -180,6 +187,7 @@ class BepInExManager:
                 progress_callback(msg)
             print(msg)
 
+        self._log_cache = None
         try:
             log("Checking FM installation directory...")
             if not self.fm_install_dir.exists():
@@ -253,29 +261,39 @@ class BepInExManager:
 
     def _extract_rar(self, archive_path: Path, dest_dir: Path, log_func) -> None:
         """Extract RAR archive."""
+        # Imported on first use: only the RAR install path needs it, and a
+        # missing rarfile package shouldn't disable the rest of the module
         try:
-            with rarfile.RarFile(archive_path) as rf:
-                rf.extractall(dest_dir)
-        except rarfile.Error as e:
-            # Fallback to WinRAR command line
-            log_func("Trying WinRAR command line...")
-            winrar_paths = [
-                Path(r"C:\Program Files\WinRAR\WinRAR.exe"),
-                Path(r"C:\Program Files (x86)\WinRAR\WinRAR.exe")
-            ]
+            import rarfile  # Note: Requires rarfile package and WinRAR/UnRAR
+        except ImportError:
+            rarfile = None
+
+        if rarfile is not None:
+            try:
+                with rarfile.RarFile(archive_path) as rf:
+                    rf.extractall(dest_dir)
+                return
+            except rarfile.Error:
+                pass
+
+        # Fallback to WinRAR command line
+        log_func("Trying WinRAR command line...")
+        winrar_paths = [
+            Path(r"C:\Program Files\WinRAR\WinRAR.exe"),
+            Path(r"C:\Program Files (x86)\WinRAR\WinRAR.exe")
+        ]
 
-            winrar = next((p for p in winrar_paths if p.exists()), None)
-            if not winrar:
-                raise Exception("WinRAR not found. Please install WinRAR or extract manually.")
+        winrar = next((p for p in winrar_paths if p.exists()), None)
+        if not winrar:
+            raise Exception("WinRAR not found. Please install WinRAR or extract manually.")
 
-            subprocess.run([
-                str(winrar), "x", "-y", str(archive_path), str(dest_dir)
-            ], check=True, capture_output=True)
+        subprocess.run([
+            str(winrar), "x", "-y", str(archive_path), str(dest_dir)
+        ], check=True, capture_output=True)
 
     def _extract_zip(self, archive_path: Path, dest_dir: Path, log_func) -> None:
-        """Extract ZIP archive."""
-        with zipfile.ZipFile(archive_path, 'r') as zf:
-            zf.extractall(dest_dir)
+        """Extract ZIP archive (validated, members decompressed in parallel)."""
+        safe_extract_zip(archive_path, dest_dir)
 
     def _find_bepinex_root(self, search_dir: Path) -> Optional[Path]:
         """
@@ -308,6 +326,7 @@ class BepInExManager:
         if not self.is_installed():
             return True
 
+        self._log_cache = None
         try:
             # Backup plugins if requested
             if keep_plugins and (self.bepinex_dir / "plugins").exists():
@@ -452,21 +471,35 @@ Enabled = true
         Returns:
             Path to latest log or None if not found
         """
+        try:
+            dir_mtime = self.bepinex_dir.stat().st_mtime_ns
+        except OSError:
+            self._log_cache = None
+            return None
+
+        # Log files are only added/removed/renamed by BepInEx itself, which
+        # bumps the folder mtime, so a matching mtime means the same answer
+        cached = self._log_cache
+        if cached is not None and cached[0] == dir_mtime and (cached[1] is None or cached[1].exists()):
+            return cached[1]
+
+        result = None
         # Check for LogOutput.log (standard location)
         if self.latest_log.exists():
-            return self.latest_log
-
-        # Check for timestamped logs in BepInEx folder
-        if self.bepinex_dir.exists():
-            log_files = sorted(
-                self.bepinex_dir.glob("LogOutput.log*"),
-                key=lambda p: p.stat().st_mtime,
-                reverse=True
-            )
-            if log_files:
-                return log_files[0]
-
-        return None
+            result = self.latest_log
+        else:
+            # Check for timestamped logs in BepInEx folder
+            newest = -1
+            for candidate in self.bepinex_dir.glob("LogOutput.log*"):
+                try:
+                    mtime = candidate.stat().st_mtime
+                except OSError:
+                    continue
+                if mtime > newest:
+                    newest, result = mtime, candidate
+
+        self._log_cache = (dir_mtime, result)
+        return result
 
     def get_error_log_path(self) -> Optional[Path]:
         """
@@ -4,8 +4,10 @@ Configuration management for FM Reloaded.
 Handles all config.json operations with caching.
 """
 
+import contextlib
 import json
 import sys
+import threading
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
@@ -50,22 +52,54 @@ class ConfigManager:
         """
         self.config_path = config_path
         self._cache: Dict[str, Any] = {}
+        # Mod jobs and store installs change and save the config from worker
+        # threads; setters hold this across the update and the write
+        self._save_lock = threading.RLock()
+        # Per-thread transaction depth and dirty flag; saves inside one are
+        # deferred to its end
+        self._txn = threading.local()
         self.load()
 
     def load(self) -> Dict[str, Any]:
         """Load configuration from disk."""
-        if self.config_path.exists():
-            try:
-                self._cache = json.loads(self.config_path.read_text(encoding="utf-8"))
-            except Exception:
+        with self._save_lock:
+            if self.config_path.exists():
+                try:
+                    self._cache = json.loads(self.config_path.read_text(encoding="utf-8"))
+                except Exception:
+                    self._cache = {}
+            else:
                 self._cache = {}
-        else:
-            self._cache = {}
-        return self._cache
+            return self._cache
 
     def save(self):
-        """Save current configuration to disk."""
-        self.config_path.write_text(json.dumps(self._cache, indent=2), encoding="utf-8")
+        """Save current configuration to disk (deferred inside transaction())."""
+        if getattr(self._txn, "depth", 0):
+            self._txn.dirty = True
+            return
+        with self._save_lock:
+            data = json.dumps(self._cache, indent=2)
+            self.config_path.write_text(data, encoding="utf-8")
+
+    @contextlib.contextmanager
+    def transaction(self):
+        """
+        Group several setter calls into a single write.
+
+        Setters still update the in-memory values immediately; the file is
+        written once when the outermost transaction on this thread ends.
+        """
+        depth = getattr(self._txn, "depth", 0)
+        if not depth:
+            self._txn.dirty = False
+        self._txn.depth = depth + 1
+        try:
+            yield self
+        finally:
+            self._txn.depth -= 1
+            if not self._txn.depth and self._txn.dirty:
+                self._txn.dirty = False
+                self.save()
 
     def get(self, key: str, default: Any = None) -> Any:
         """Get a configuration value."""
@@ -73,8 +107,9 @@ class ConfigManager:
 
     def set(self, key: str, value: Any):
         """Set a configuration value and save."""
-        self._cache[key] = value
-        self.save()
+        with self._save_lock:
+            self._cache[key] = value
+            self.save()
 
     # Target path property
     @property
@@ -127,8 +162,9 @@ class ConfigManager:
             ValueError: If path is invalid or in protected system directory
         """
         if path is None:
-            self._cache["target_path"] = None
-            self.save()
+            with self._save_lock:
+                self._cache["target_path"] = None
+                self.save()
             return
 
         path_resolved = Path(path).resolve()
@@ -146,8 +182,9 @@ class ConfigManager:
         if not path_resolved.is_dir():
             raise ValueError(f"Path is not a directory: {path_resolved}")
 
-        self._cache["target_path"] = str(path_resolved)
-        self.save()
+        with self._save_lock:
+            self._cache["target_path"] = str(path_resolved)
+            self.save()
 
     # Enabled mods property
     @property
@@ -158,8 +195,9 @@ class ConfigManager:
     @enabled_mods.setter
     def enabled_mods(self, mods: List[str]):
         """Set list of enabled mod names."""
-        self._cache["enabled_mods"] = mods
-        self.save()
+        with self._save_lock:
+            self._cache["enabled_mods"] = mods
+            self.save()
 
     # Load order property
     @property
@@ -170,8 +208,9 @@ class ConfigManager:
     @load_order.setter
     def load_order(self, order: List[str]):
         """Set mod load order."""
-        self._cache["load_order"] = order
-        self.save()
+        with self._save_lock:
+            self._cache["load_order"] = order
+            self.save()
 
     # Last applied mods property
     @property
@@ -182,8 +221,9 @@ class ConfigManager:
     @last_applied_mods.setter
     def last_applied_mods(self, mods: List[str]):
         """Persist list of mods that were last applied to the game files."""
-        self._cache["last_applied_mods"] = list(mods)
-        self.save()
+        with self._save_lock:
+            self._cache["last_applied_mods"] = list(mods)
+            self.save()
 
     # Store URL property
     @property
@@ -197,8 +237,9 @@ class ConfigManager:
     @store_url.setter
     def store_url(self, url: str):
         """Set mod store URL."""
-        self._cache["store_url"] = url
-        self.save()
+        with self._save_lock:
+            self._cache["store_url"] = url
+            self.save()
 
     # Discord webhooks property
     @property
@@ -217,9 +258,10 @@ class ConfigManager:
 
     def set_discord_webhooks(self, error_url: str, mod_url: str):
         """Set Discord webhook URLs."""
-        self._cache["discord_error_webhook"] = error_url
-        self._cache["discord_mod_webhook"] = mod_url
-        self.save()
+        with self._save_lock:
+            self._cache["discord_error_webhook"] = error_url
+            self._cache["discord_mod_webhook"] = mod_url
+            self.save()
 
 
 def asset_path(filename: str) -> Path:
@@ -6,6 +6,7 @@ Handles platform-specific path detection and special directory routing.
 
 import os
 import sys
+from functools import lru_cache
 from pathlib import Path
 from typing import List, Optional
 
@@ -276,18 +277,13 @@ def resolve_target(base: Path, sub: str, config_target: Optional[Path] = None) -
     return validate_path_safety(target, base, "target path")
 
 
-def get_install_dir_for_type(mod_type: str, mod_name: str, config_target: Optional[Path]) -> Path:
+@lru_cache(maxsize=None)
+def _install_dir_for_type(mod_type: str, mod_name: str, config_target: Optional[Path]):
     """
-    Return the appropriate install directory depending on mod type and mod name.
-    Auto-creates /graphics and its subfolders (kits, faces, logos) if missing.
+    Pure routing behind get_install_dir_for_type (no filesystem changes).
 
-    Args:
-        mod_type: Type from manifest ("ui", "graphics", "tactics", etc.)
-        mod_name: Name of the mod (used for graphics subtype detection)
-        config_target: Stored FM26 target path from config
-
-    Returns:
-        Installation directory path
+    Returns (path, create) where ``create`` says whether the folder should
+    be made if it is missing.
     """
     base = fm_user_dir()
     graphics_base = base / "graphics"
@@ -296,17 +292,14 @@ def get_install_dir_for_type(mod_type: str, mod_name: str, config_target: Option
 
     # UI/bundle mods go to the main FM install location (StandaloneWindows64)
     if mod_type in ("ui", "bundle"):
-        return config_target
+        return config_target, False
 
     # Tactics mods go to the user's tactics folder
     if mod_type == "tactics":
-        path = base / "tactics"
-        path.mkdir(parents=True, exist_ok=True)
-        return path
+        return base / "tactics", True
 
     # Graphics and its subtypes
     if mod_type == "graphics":
-        graphics_base.mkdir(parents=True, exist_ok=True)
         if any(x in mod_name for x in ("kit", "kits")):
             path = graphics_base / "kits"
         elif any(x in mod_name for x in ("face", "faces", "portraits")):
@@ -315,27 +308,45 @@ def get_install_dir_for_type(mod_type: str, mod_name: str, config_target: Option
             path = graphics_base / "logos"
         else:
             path = graphics_base
-        path.mkdir(parents=True, exist_ok=True)
-        return path
+        return path, True
 
     # Database/editor mods
     if mod_type == "database":
-        path = base / "editor data"
-        path.mkdir(parents=True, exist_ok=True)
-        return path
+        return base / "editor data", True
 
     # Camera mods (BepInEx plugins)
     # Note: Camera mods should use BepInEx/plugins/ in manifest target_subpath
     # This routing provides a sensible base directory fallback
-    if mod_type == "camera":
-        if config_target:
-            # Return game root (parent of StandaloneWindows64)
-            game_root = config_target.parent.parent
-            return game_root
-        # Fallback to Documents if no target configured
-        base.mkdir(parents=True, exist_ok=True)
-        return base
-
-    # Default fallback (misc mods)
-    base.mkdir(parents=True, exist_ok=True)
-    return base
+    if mod_type == "camera" and config_target:
+        # Return game root (parent of StandaloneWindows64)
+        return config_target.parent.parent, False
+
+    # Camera without a target (falls back to Documents) and misc mods
+    return base, True
+
+
+def clear_install_dir_cache() -> None:
+    """Forget memoized install-dir routing (call after the FM paths change)."""
+    _install_dir_for_type.cache_clear()
+
+
+def get_install_dir_for_type(mod_type: str, mod_name: str, config_target: Optional[Path]) -> Path:
+    """
+    Return the appropriate install directory depending on mod type and mod name.
+    Auto-creates /graphics and its subfolders (kits, faces, logos) if missing.
+
+    The routing is memoized; the folder is still created on every call so a
+    folder deleted while the app runs comes back.
+
+    Args:
+        mod_type: Type from manifest ("ui", "graphics", "tactics", etc.)
+        mod_name: Name of the mod (used for graphics subtype detection)
+        config_target: Stored FM26 target path from config
+
+    Returns:
+        Installation directory path
+    """
+    path, create = _install_dir_for_type(mod_type, mod_name, config_target)
+    if create:
+        path.mkdir(parents=True, exist_ok=True)
+    return path
@@ -34,12 +34,16 @@ References:
 - CWE-409: Improper Handling of Highly Compressed Data
 """
 
+import contextlib
 import hashlib
+import io
+import os
 import shutil
 import zipfile
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from typing import Optional, Set
+from typing import Iterable, Optional, Set
 
 
 # ========================================
@@ -400,14 +404,32 @@ def validate_path_safety(target: Path, allowed_root: Path, description: str = "p
         )
 
 
-def safe_extract_zip(zip_path: Path, dest: Path, max_size_bytes: int = 500_000_000) -> None:
+# Parallel extraction only pays off for archives with many members
+_PARALLEL_EXTRACT_MIN_FILES = 8
+_EXTRACT_MAX_WORKERS = 8
+# File-object archives are copied into memory once for the workers; above this, extract serially
+_PARALLEL_EXTRACT_MAX_BUFFER = 64 * 1024 * 1024
+
+
+def safe_extract_zip(
+    zip_path: Path,
+    dest: Path,
+    max_size_bytes: int = 500_000_000,
+    max_compression_ratio: Optional[float] = None,
+    members: Optional[Iterable[str]] = None,
+) -> None:
     """
     Safely extract ZIP file with security validations.
 
     Args:
-        zip_path: Path to ZIP file
+        zip_path: Path to ZIP file, or an open seekable binary file object
         dest: Destination directory
         max_size_bytes: Maximum total uncompressed size (default 500MB)
+        max_compression_ratio: Optional maximum declared-size / archive-size
+            ratio. Off by default: text configs and padded bundles compress
+            very well, and max_size_bytes already bounds a bomb.
+        members: Optional member names to extract (default: everything). The
+            whole archive is still validated.
 
     Raises:
         ValueError: If ZIP contains malicious content
@@ -415,31 +437,52 @@ def safe_extract_zip(zip_path: Path, dest: Path, max_size_bytes: int = 500_000_0
 
     Security checks:
     - Path traversal protection
-    - ZIP bomb detection (size limits)
+    - ZIP bomb detection (size limits, optional compression ratio)
     - Symlink detection
     - Absolute path rejection
     """
     dest = dest.resolve()
-    total_size = 0
+    dest_str = str(dest)
+    dest_prefix = os.path.join(dest_str, "")  # dest + trailing separator
+
+    if hasattr(zip_path, "read"):
+        # Already-open archive (e.g. a spooled download); the caller owns it
+        fh_ctx = contextlib.nullcontext(zip_path)
+        archive_size = zip_path.seek(0, os.SEEK_END)
+        zip_path.seek(0)
+    else:
+        # 1 MiB read buffer instead of the 8 KiB default cuts read syscalls on big archives
+        fh_ctx = open(zip_path, 'rb', buffering=1 << 20)
+        archive_size = Path(zip_path).stat().st_size
 
-    with zipfile.ZipFile(zip_path, 'r') as z:
-        # First pass: validate all members
-        for member in z.namelist():
-            info = z.getinfo(member)
+    with fh_ctx as fh, zipfile.ZipFile(fh, 'r') as z:
+        infos = z.infolist()
 
-            # Check for ZIP bomb
-            total_size += info.file_size
-            if total_size > max_size_bytes:
-                raise ValueError(
-                    f"ZIP file too large: {total_size:,} bytes exceeds limit of {max_size_bytes:,} bytes. "
-                    "This may be a ZIP bomb attack."
-                )
+        # Fast reject: the central directory already declares every size,
+        # so bombs are caught before any per-member validation runs
+        total_declared = sum(i.file_size for i in infos)
+        if total_declared > max_size_bytes:
+            raise ValueError(
+                f"ZIP file too large: {total_declared:,} bytes exceeds limit of {max_size_bytes:,} bytes. "
+                "This may be a ZIP bomb attack."
+            )
+        archive_size = max(1, archive_size)
+        if (
+            max_compression_ratio is not None
+            and total_declared / archive_size > max_compression_ratio
+        ):
+            raise ValueError(
+                f"ZIP compression ratio too high: {total_declared:,} bytes declared "
+                f"from a {archive_size:,} byte archive. This may be a ZIP bomb attack."
+            )
 
-            # Check for path traversal
-            member_path = (dest / member).resolve()
-            try:
-                member_path.relative_to(dest)
-            except ValueError:
+        # First pass: validate all members
+        for info in infos:
+            member = info.filename
+
+            # Check for path traversal (plain string test, no exception on the safe path)
+            candidate = os.path.normpath(os.path.join(dest_str, member))
+            if not (candidate == dest_str or candidate.startswith(dest_prefix)):
                 raise ValueError(
                     f"Security: ZIP contains path traversal: '{member}' "
                     f"would extract outside destination directory"
@@ -449,13 +492,51 @@ def safe_extract_zip(zip_path: Path, dest: Path, max_size_bytes: int = 500_000_0
             if member.startswith("/") or member.startswith("\\") or ":" in member:
                 raise ValueError(f"Security: ZIP contains absolute path: '{member}'")
 
-            # Check for suspicious patterns
-            if ".." in member:
+            # Check for suspicious patterns (whole ".." components only, so "..foo" is fine)
+            if ".." in member.replace("\\", "/").split("/"):
                 raise ValueError(f"Security: ZIP contains suspicious path: '{member}'")
 
         # Second pass: extract if all validations passed
-        for member in z.namelist():
-            z.extract(member, dest)
+        if members is not None:
+            wanted = set(members)
+            infos = [i for i in infos if i.filename in wanted]
+
+        files = [i for i in infos if not i.is_dir()]
+        workers = min(_EXTRACT_MAX_WORKERS, os.cpu_count() or 1)
+        open_archive = None
+        if workers > 1 and len(files) >= _PARALLEL_EXTRACT_MIN_FILES:
+            if not hasattr(zip_path, "read"):
+                open_archive = lambda: zipfile.ZipFile(zip_path, 'r')
+            elif archive_size <= _PARALLEL_EXTRACT_MAX_BUFFER:
+                # Each worker needs its own handle; share one immutable copy of the bytes
+                fh.seek(0)
+                data = fh.read()
+                open_archive = lambda: zipfile.ZipFile(io.BytesIO(data), 'r')
+
+        if open_archive is None:
+            for info in infos:
+                z.extract(info, dest)
+            return
+
+        # Directories (and every file's parent) are created up front so the
+        # workers never race on makedirs
+        for info in infos:
+            if info.is_dir():
+                z.extract(info, dest)
+        parents = {os.path.dirname(os.path.join(dest_str, *i.filename.split("/"))) for i in files}
+        for parent in parents:
+            os.makedirs(parent, exist_ok=True)
+
+    # Inflate runs without the GIL, so per-thread ZipFile handles scale with cores
+    def _extract_chunk(chunk):
+        with open_archive() as zf:
+            for info in chunk:
+                zf.extract(info, dest)
+
+    chunks = [files[k::workers] for k in range(workers)]
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        for future in [pool.submit(_extract_chunk, c) for c in chunks if c]:
+            future.result()
 
 
 def safe_delete_path(path: Path, allow_symlink_delete: bool = False) -> bool:
@@ -617,31 +698,90 @@ def safe_copy(
     # Directory copy
     if src.is_dir():
         dst.mkdir(parents=True, exist_ok=True)
-        for child in src.rglob("*"):
-            # Skip symlinks if not following them
-            if child.is_symlink() and not follow_symlinks:
-                continue
+        # Walk with plain strings; Path objects are only built at API boundaries
+        src_str = str(src)
+        dst_str = str(dst)
+        # os.walk is top-down, so each output directory needs one makedirs at most
+        created_dirs = {dst_str}
+        for dirpath, dirnames, filenames in os.walk(src_str):
+            rel_dir = os.path.relpath(dirpath, src_str)
+            out_dir = dst_str if rel_dir == os.curdir else os.path.join(dst_str, rel_dir)
+
+            for name in dirnames:
+                child = os.path.join(dirpath, name)
+                # Skip symlinks if not following them
+                if os.path.islink(child) and not follow_symlinks:
+                    continue
+                out = os.path.join(out_dir, name)
+                if allowed_dst_root:
+                    validate_path_safety(Path(out), allowed_dst_root, f"copy destination ({os.path.relpath(out, dst_str)})")
+                os.makedirs(out, exist_ok=True)
+                created_dirs.add(out)
+
+            for name in filenames:
+                child = os.path.join(dirpath, name)
+                # Skip symlinks if not following them
+                if os.path.islink(child) and not follow_symlinks:
+                    continue
+                if not os.path.isfile(child):
+                    continue
+
+                out = os.path.join(out_dir, name)
+                rel = os.path.relpath(out, dst_str)
+
+                # Validate each output path if root provided
+                if allowed_dst_root:
+                    validate_path_safety(Path(out), allowed_dst_root, f"copy destination ({rel})")
 
-            rel = child.relative_to(src)
-            out = dst / rel
-
-            # Validate each output path if root provided
-            if allowed_dst_root:
-                validate_path_safety(out, allowed_dst_root, f"copy destination ({rel})")
-
-            if child.is_dir():
-                out.mkdir(parents=True, exist_ok=True)
-            elif child.is_file():
                 # Security: Check file size
-                size = child.stat().st_size
+                size = os.path.getsize(child)
                 if size > max_file_size:
                     raise ValueError(
                         f"Security: File too large: {rel} ({size:,} bytes exceeds {max_file_size:,} byte limit)"
                     )
-                out.parent.mkdir(parents=True, exist_ok=True)
+                if out_dir not in created_dirs:
+                    os.makedirs(out_dir, exist_ok=True)
+                    created_dirs.add(out_dir)
                 shutil.copy2(child, out, follow_symlinks=follow_symlinks)
 
 
+_kernel32 = None
+
+
+def _fast_copy(src, dst) -> None:
+    """
+    Copy one file with its timestamps using the OS copy primitive.
+
+    On Windows this is CopyFileExW, which copies in the kernel and keeps
+    timestamps/attributes; shutil.copy2 would loop over 1 MiB reads there.
+    Elsewhere shutil.copy2 already uses sendfile/fcopyfile, so it is used
+    directly. Any failure of the native call falls back to shutil.copy2.
+
+    Args:
+        src: Source file
+        dst: Destination file (overwritten)
+    """
+    global _kernel32
+    if os.name == "nt":
+        try:
+            if _kernel32 is None:
+                import ctypes
+                _kernel32 = ctypes.WinDLL("kernel32", use_last_error=True)
+            if _kernel32.CopyFileExW(os.fspath(src), os.fspath(dst), None, None, None, 0):
+                return
+        except (OSError, AttributeError):
+            pass
+    shutil.copy2(src, dst)
+
+
+def _link_or_copy(src, dst) -> None:
+    """Hardlink src to dst, copying instead when links are unsupported or cross-device."""
+    try:
+        os.link(src, dst)
+    except OSError:
+        _fast_copy(src, dst)
+
+
 def _copy_any(src: Path, dst: Path):
     """
     Merge-copy src -> dst.
@@ -656,17 +796,24 @@ def _copy_any(src: Path, dst: Path):
     """
     if src.is_dir():
         dst.mkdir(parents=True, exist_ok=True)
-        for child in src.rglob("*"):
-            rel = child.relative_to(src)
-            out = dst / rel
-            if child.is_dir():
-                out.mkdir(parents=True, exist_ok=True)
-            else:
-                out.parent.mkdir(parents=True, exist_ok=True)
-                shutil.copy2(child, out)
+        src_str = str(src)
+        dst_str = str(dst)
+        created_dirs = {dst_str}
+        for dirpath, dirnames, filenames in os.walk(src_str):
+            rel_dir = os.path.relpath(dirpath, src_str)
+            out_dir = dst_str if rel_dir == os.curdir else os.path.join(dst_str, rel_dir)
+            for name in dirnames:
+                sub = os.path.join(out_dir, name)
+                os.makedirs(sub, exist_ok=True)
+                created_dirs.add(sub)
+            if filenames and out_dir not in created_dirs:
+                os.makedirs(out_dir, exist_ok=True)
+                created_dirs.add(out_dir)
+            for name in filenames:
+                _fast_copy(os.path.join(dirpath, name), os.path.join(out_dir, name))
     else:
         dst.parent.mkdir(parents=True, exist_ok=True)
-        shutil.copy2(src, dst)
+        _fast_copy(src, dst)
 
 
 def backup_original(target_file: Path, backup_dir: Path) -> Optional[Path]:
@@ -676,6 +823,11 @@ def backup_original(target_file: Path, backup_dir: Path) -> Optional[Path]:
     Stores backup alongside original file with .bck extension for easy restoration.
     Example: gamemodules_assets_match.bundle -> gamemodules_assets_match.bundle.bck
 
+    The backup is a hardlink when the filesystem allows it (same volume, so
+    almost always), which costs no data writes. Callers must therefore
+    replace the target (unlink, then write a new file) rather than write
+    into it, or the backup changes too. Restores copy out of the backup.
+
     Args:
         target_file: File to backup
         backup_dir: Directory to store backups (legacy, not used anymore)
@@ -683,31 +835,33 @@ def backup_original(target_file: Path, backup_dir: Path) -> Optional[Path]:
     Returns:
         Path to backup file, or None if file doesn't exist
     """
-    if not Path(target_file).exists():
+    target_str = os.fspath(target_file)
+    if not os.path.exists(target_str):
         return None
 
     # Store backup in same directory as original file with .bck extension
-    target_file = Path(target_file)
-    backup_file = target_file.parent / f"{target_file.name}.bck"
+    backup_str = target_str + ".bck"
 
     # Only create backup if it doesn't already exist (preserve original game file)
-    if not backup_file.exists():
+    if not os.path.exists(backup_str):
         try:
-            shutil.copy2(target_file, backup_file)
-            return backup_file
+            _link_or_copy(target_str, backup_str)
+            return Path(backup_str)
         except Exception:
             # Fallback: try legacy backup method in backup_dir
             backup_dir.mkdir(parents=True, exist_ok=True)
-            h = hashlib.sha256(str(target_file).encode("utf-8")).hexdigest()[:10]
-            dest = backup_dir / f"{target_file.name}.{h}.bak"
-            i, final = 1, dest
-            while final.exists():
-                final = backup_dir / f"{dest.name}.{i}"
+            backup_dir_str = str(backup_dir)
+            h = hashlib.sha256(target_str.encode("utf-8")).hexdigest()[:10]
+            dest_name = f"{os.path.basename(target_str)}.{h}.bak"
+            final = os.path.join(backup_dir_str, dest_name)
+            i = 1
+            while os.path.exists(final):
+                final = os.path.join(backup_dir_str, f"{dest_name}.{i}")
                 i += 1
-            shutil.copy2(target_file, final)
-            return final
+            _link_or_copy(target_str, final)
+            return Path(final)
 
-    return backup_file
+    return Path(backup_str)
 
 
 def find_latest_backup_for_filename(filename: str, backup_dir: Path, target_file: Optional[Path] = None) -> Optional[Path]:
@@ -727,18 +881,21 @@ def find_latest_backup_for_filename(filename: str, backup_dir: Path, target_file
     """
     # First, try to find .bck backup alongside the original file
     if target_file:
-        target_file = Path(target_file)
-        inline_backup = target_file.parent / f"{target_file.name}.bck"
-        if inline_backup.exists():
-            return inline_backup
+        inline_backup = os.fspath(target_file) + ".bck"
+        if os.path.exists(inline_backup):
+            return Path(inline_backup)
 
     # Fallback: search legacy backup directory
-    if not backup_dir.exists():
+    latest_path = None
+    latest_mtime = None
+    try:
+        with os.scandir(backup_dir) as it:
+            for entry in it:
+                if not entry.name.startswith(filename) or not entry.is_file():
+                    continue
+                mtime = entry.stat().st_mtime
+                if latest_mtime is None or mtime > latest_mtime:
+                    latest_path, latest_mtime = entry.path, mtime
+    except OSError:
         return None
-
-    cands = sorted(
-        [p for p in backup_dir.glob(f"{filename}*") if p.is_file()],
-        key=lambda p: p.stat().st_mtime,
-        reverse=True,
-    )
-    return cands[0] if cands else None
+    return Path(latest_path) if latest_path else None
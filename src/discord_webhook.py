@@ -4,17 +4,98 @@ Handles sending error reports and mod submissions to Discord channels.
 """
 
 import json
-import urllib.request
-import urllib.error
+import functools
+import gzip
+import http.client
+import threading
+import urllib.parse
 from pathlib import Path
-from typing import Optional, List, Dict
-from datetime import datetime
+from typing import Optional, List, Dict, Tuple
+import time
 import base64
+import uuid
+
+_TIMESTAMP_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+# Log attachments larger than this are gzipped before upload
+_GZIP_LOG_THRESHOLD = 256 * 1024
+
+# Optional fast JSON encoder (falls back to stdlib json)
+try:
+    import orjson
+
+    _ORJSON_AVAILABLE = True
+except ImportError:
+    _ORJSON_AVAILABLE = False
+
+
+def _encode_json(payload: Dict) -> bytes:
+    """Serialize a payload to UTF-8 JSON bytes, using orjson when installed."""
+    if _ORJSON_AVAILABLE:
+        return orjson.dumps(payload)
+    return json.dumps(payload).encode('utf-8')
+
+
+def _encode_multipart(payload: Dict, files: List[Tuple[str, bytes]]) -> Tuple[bytes, str]:
+    """
+    Build a multipart/form-data body for a webhook message with attachments.
+
+    Args:
+        payload: Message payload, sent as the payload_json part
+        files: List of (filename, content) pairs, sent as files[0], files[1], ...
+
+    Returns:
+        Tuple of (body bytes, Content-Type header value)
+    """
+    boundary = uuid.uuid4().hex
+    parts = [
+        (f'--{boundary}\r\n'
+         'Content-Disposition: form-data; name="payload_json"\r\n'
+         'Content-Type: application/json\r\n\r\n').encode('utf-8'),
+        _encode_json(payload),
+        b'\r\n',
+    ]
+    for i, (filename, content) in enumerate(files):
+        # Keep the header well-formed whatever the file is called
+        safe_name = filename.replace('"', '').replace('\r', '').replace('\n', '')
+        # Large logs are gzipped before upload; label them so they open as archives
+        file_type = 'application/gzip' if safe_name.endswith('.gz') else 'text/plain'
+        parts.append(
+            (f'--{boundary}\r\n'
+             f'Content-Disposition: form-data; name="files[{i}]"; filename="{safe_name}"\r\n'
+             f'Content-Type: {file_type}\r\n\r\n').encode('utf-8')
+        )
+        parts.append(content)
+        parts.append(b'\r\n')
+    parts.append(f'--{boundary}--\r\n'.encode('utf-8'))
+    return b''.join(parts), f'multipart/form-data; boundary={boundary}'
+
+
+@functools.lru_cache(maxsize=128)
+def _thread_request_path(base_path: str, thread_id: str) -> str:
+    """Append a thread_id query parameter to a webhook request path."""
+    separator = '&' if '?' in base_path else '?'
+    return f"{base_path}{separator}thread_id={thread_id}"
 
 
 class DiscordWebhook:
     """Interface to send messages and files to Discord via webhooks."""
 
+    # Static parts of the embeds; only fields/description vary per call
+    _ERROR_EMBED_TEMPLATE = {
+        "title": "Bug Report",
+        "color": 15158332,  # Red color
+        "footer": {
+            "text": "FM Reloaded Mod Manager - Error Report"
+        }
+    }
+    _MOD_EMBED_TEMPLATE = {
+        "color": 5763719,  # Green color
+        "footer": {
+            "text": "FM Reloaded Mod Manager - Mod Submission"
+        }
+    }
+
     def __init__(self, webhook_url: str):
         """
         Initialize Discord webhook.
@@ -24,6 +105,37 @@ class DiscordWebhook:
         """
         self.webhook_url = webhook_url
 
+        # Parse the URL once; every send reuses one keep-alive connection
+        parsed = urllib.parse.urlsplit(webhook_url)
+        self._scheme = parsed.scheme or "https"
+        self._host = parsed.netloc
+        self._path = self._request_path(parsed)
+        self._conn: Optional[http.client.HTTPConnection] = None
+        self._conn_lock = threading.Lock()
+
+    @staticmethod
+    def _request_path(parsed: urllib.parse.SplitResult) -> str:
+        """Build the request target (path + query) from a parsed URL."""
+        path = parsed.path or "/"
+        return f"{path}?{parsed.query}" if parsed.query else path
+
+    def _get_connection(self) -> http.client.HTTPConnection:
+        """Return the cached connection, opening a new one if needed."""
+        if self._conn is None:
+            conn_cls = (
+                http.client.HTTPConnection if self._scheme == "http"
+                else http.client.HTTPSConnection
+            )
+            self._conn = conn_cls(self._host, timeout=10)
+        return self._conn
+
+    def close(self) -> None:
+        """Close the keep-alive connection (reopened lazily on next send)."""
+        with self._conn_lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
     def send_message(
         self,
         content: str = "",
@@ -58,12 +170,9 @@ class DiscordWebhook:
         if thread_name:
             payload['thread_name'] = thread_name
 
-        custom_url = self.webhook_url
-        if thread_id:
-            separator = '&' if '?' in custom_url else '?'
-            custom_url = f"{custom_url}{separator}thread_id={thread_id}"
+        path = _thread_request_path(self._path, str(thread_id)) if thread_id else None
 
-        return self._send_payload(payload, webhook_override=custom_url)
+        return self._send_payload(payload, path=path)
 
     def send_error_report(
         self,
@@ -84,11 +193,13 @@ class DiscordWebhook:
         Returns:
             True if successful
         """
+        # One timestamp for the whole report (embed field + thread name)
+        now_str = time.strftime(_TIMESTAMP_FORMAT, time.localtime())
+
         # Create embed with error details
         embed = {
-            "title": "Bug Report",
+            **self._ERROR_EMBED_TEMPLATE,
             "description": user_description[:2048],
-            "color": 15158332,  # Red color
             "fields": [
                 {
                     "name": "App Version",
@@ -97,13 +208,10 @@ class DiscordWebhook:
                 },
                 {
                     "name": "Timestamp",
-                    "value": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+                    "value": now_str,
                     "inline": True
                 }
             ],
-            "footer": {
-                "text": "FM Reloaded Mod Manager - Error Report"
-            }
         }
 
         if user_email:
@@ -129,14 +237,13 @@ class DiscordWebhook:
             "username": "FM Reloaded Bug Reporter"
         }
 
-        # For now, send without file attachments (Discord webhooks have limitations)
-        # Files would require multipart/form-data which is complex without requests library
-        thread_name = f"Error {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"
+        # Logs follow as one multipart upload (see _send_log_contents)
+        thread_name = f"Error {now_str}"
         payload['thread_name'] = thread_name
         success = self._send_payload(payload)
 
         if success and log_files:
-            # Send log content as code blocks (fallback method)
+            # Attach the log files in a single follow-up request
             self._send_log_contents(log_files)
 
         return success
@@ -165,9 +272,9 @@ class DiscordWebhook:
             True if successful
         """
         embed = {
+            **self._MOD_EMBED_TEMPLATE,
             "title": f"New Mod Submission: {mod_name}",
             "description": mod_description[:2048],
-            "color": 5763719,  # Green color
             "fields": [
                 {
                     "name": "GitHub Repository",
@@ -186,13 +293,10 @@ class DiscordWebhook:
                 },
                 {
                     "name": "Submitted",
-                    "value": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+                    "value": time.strftime(_TIMESTAMP_FORMAT, time.localtime()),
                     "inline": True
                 }
             ],
-            "footer": {
-                "text": "FM Reloaded Mod Manager - Mod Submission"
-            }
         }
 
         if submitter_contact:
@@ -209,53 +313,98 @@ class DiscordWebhook:
 
         return self._send_payload(payload)
 
-    def _send_payload(self, payload: Dict, webhook_override: Optional[str] = None) -> bool:
+    def _send_payload(
+        self,
+        payload: Dict,
+        path: Optional[str] = None,
+        files: Optional[List[Tuple[str, bytes]]] = None,
+    ) -> bool:
         """
         Send JSON payload to Discord webhook.
 
+        Reuses a single keep-alive connection per webhook, so multi-message
+        reports only pay the TCP/TLS handshake once.
+
         Args:
             payload: Dictionary to send as JSON
+            path: Optional request target (e.g. with thread_id query);
+                defaults to the webhook's own path
+            files: Optional (filename, content) attachments; switches the
+                request to multipart/form-data
 
         Returns:
             True if successful
         """
-        try:
-            headers = {
-                'Content-Type': 'application/json',
-                'User-Agent': 'FM-Reloaded-Mod-Manager/1.0'
-            }
-
-            data = json.dumps(payload).encode('utf-8')
-            request = urllib.request.Request(
-                webhook_override or self.webhook_url,
-                data=data,
-                headers=headers,
-                method='POST'
-            )
-
-            with urllib.request.urlopen(request, timeout=10) as response:
-                return response.status == 204  # Discord returns 204 No Content on success
+        if files:
+            data, content_type = _encode_multipart(payload, files)
+        else:
+            data, content_type = _encode_json(payload), 'application/json'
+        headers = {
+            'Content-Type': content_type,
+            'User-Agent': 'FM-Reloaded-Mod-Manager/1.0',
+            'Connection': 'keep-alive',
+        }
 
-        except urllib.error.HTTPError as e:
-            print(f"Discord webhook HTTP error: {e.code} - {e.reason}")
-            if e.code == 400:
-                print(f"Response: {e.read().decode('utf-8')}")
-            return False
-        except urllib.error.URLError as e:
+        try:
+            status, reason, body = self._post(path or self._path, data, headers)
+        except (OSError, http.client.HTTPException) as e:
             print(f"Discord webhook connection error: {e}")
             return False
         except Exception as e:
             print(f"Discord webhook error: {e}")
             return False
 
-    def _send_log_contents(self, log_files: List[Path], max_size_kb: int = 100) -> None:
+        if status >= 400:
+            print(f"Discord webhook HTTP error: {status} - {reason}")
+            if status == 400:
+                print(f"Response: {body.decode('utf-8', errors='replace')}")
+            return False
+        return status == 204  # Discord returns 204 No Content on success
+
+    def _post(self, path: str, data: bytes, headers: Dict[str, str]):
+        """
+        POST over the keep-alive connection, retrying once if the server
+        closed the idle socket between requests.
+
+        Returns:
+            Tuple of (status, reason, body)
+        """
+        with self._conn_lock:
+            for attempt in (1, 2):
+                conn = self._get_connection()
+                try:
+                    conn.request("POST", path, body=data, headers=headers)
+                    response = conn.getresponse()
+                    # Drain the body so the connection can be reused
+                    body = response.read()
+                    if response.will_close:
+                        conn.close()
+                        self._conn = None
+                    return response.status, response.reason, body
+                except (http.client.RemoteDisconnected, http.client.BadStatusLine,
+                        ConnectionResetError, BrokenPipeError):
+                    conn.close()
+                    self._conn = None
+                    if attempt == 2:
+                        raise
+                except Exception:
+                    conn.close()
+                    self._conn = None
+                    raise
+
+    def _send_log_contents(self, log_files: List[Path], max_size_kb: int = 2048) -> None:
         """
-        Send log file contents as code blocks.
+        Upload log files as attachments in one multipart request.
+
+        Falls back to code-block messages if the upload is rejected.
 
         Args:
             log_files: List of log files to send
-            max_size_kb: Maximum size per file in KB
+            max_size_kb: Maximum size per file in KB; larger logs are cut to their tail
         """
+        attachments: List[Tuple[str, bytes]] = []
+        contents: List[Tuple[str, bytes]] = []
+        notes: List[str] = []
         for log_file in log_files[:3]:  # Limit to 3 files
             if not log_file.exists():
                 continue
@@ -264,25 +413,70 @@ class DiscordWebhook:
                 # Check file size
                 size_kb = log_file.stat().st_size / 1024
                 if size_kb > max_size_kb:
-                    # Send truncated version
-                    with open(log_file, 'r', encoding='utf-8', errors='ignore') as f:
-                        lines = f.readlines()
-                        # Get last N lines
-                        last_lines = lines[-100:] if len(lines) > 100 else lines
-                        content = ''.join(last_lines)
-                        truncated_msg = f"(Showing last 100 lines of {len(lines)} total)"
+                    # Attach truncated version (only the tail is read from disk)
+                    content = self._read_log_tail(log_file, max_lines=1000).encode('utf-8')
+                    notes.append(f"{log_file.name} (Showing last 1000 lines)")
                 else:
-                    with open(log_file, 'r', encoding='utf-8', errors='ignore') as f:
-                        content = f.read()
-                        truncated_msg = ""
-
-                # Send as code block (Discord markdown)
-                code_block = f"```\n{log_file.name} {truncated_msg}\n{content[:1800]}\n```"
-                self.send_message(content=code_block)
+                    content = log_file.read_bytes()
+                contents.append((log_file.name, content))
+                if len(content) > _GZIP_LOG_THRESHOLD:
+                    # Plain-text logs shrink ~10x, cutting upload time
+                    attachments.append((f"{log_file.name}.gz", gzip.compress(content, compresslevel=6)))
+                else:
+                    attachments.append((log_file.name, content))
 
             except Exception as e:
                 print(f"Error reading log file {log_file}: {e}")
 
+        if not attachments:
+            return
+
+        message = "Log files"
+        if notes:
+            message += ":\n" + "\n".join(notes)
+        if self._send_payload({"content": message[:2000]}, files=attachments):
+            return
+
+        # Fallback: send each log as a code block (Discord markdown)
+        for name, content in contents:
+            text = content.decode('utf-8', errors='ignore')
+            code_block = f"```\n{name}\n{text[-1800:]}\n```"
+            self.send_message(content=code_block)
+
+    @staticmethod
+    def _read_log_tail(log_file: Path, max_lines: int = 100, chunk_size: int = 16384) -> str:
+        """
+        Return the last `max_lines` lines of a log without loading the whole file.
+
+        Reads backwards from EOF, doubling the window until enough newlines
+        have been seen (or the start of the file is reached).
+
+        Args:
+            log_file: Log file to read
+            max_lines: Number of trailing lines to return
+            chunk_size: Initial window size in bytes
+
+        Returns:
+            Decoded tail of the file
+        """
+        with open(log_file, 'rb', buffering=65536) as f:
+            f.seek(0, 2)
+            size = f.tell()
+            window = chunk_size
+            while True:
+                start = max(0, size - window)
+                f.seek(start)
+                data = f.read(size - start)
+                # One extra newline is needed when starting mid-line
+                if start == 0 or data.count(b"\n") > max_lines:
+                    break
+                window *= 2
+
+        lines = data.splitlines(keepends=True)
+        if start > 0:
+            lines = lines[1:]  # Drop the partial first line
+        return b''.join(lines[-max_lines:]).decode('utf-8', errors='ignore')
+
 
 class DiscordChannels:
     """Manage multiple Discord webhook channels."""
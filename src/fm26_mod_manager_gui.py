@@ -11,13 +11,18 @@
 # - Improved conflict detection and file management
 # - Delete functionality for complete mod removal
 
-import os, sys, json, shutil, hashlib, webbrowser, subprocess, zipfile, tempfile
+import os, sys, json, shutil, hashlib, subprocess, zipfile, tempfile
+import atexit
+import contextlib
 from typing import List, Optional
 from pathlib import Path
 from datetime import datetime
 import tkinter as tk
 from tkinter import messagebox, filedialog
 import threading
+from collections import defaultdict, deque
+from concurrent.futures import Future, ThreadPoolExecutor
+import heapq
 
 # Import ttkbootstrap for modern UI
 try:
@@ -32,23 +37,20 @@ except ImportError:
 # Import core modules
 from core.config_manager import ConfigManager, asset_path
 from core.path_resolver import (
-    _platform_tag, default_candidates, detect_fm_path, fm_user_dir,
-    validate_path_safety, resolve_target, get_install_dir_for_type
+    detect_fm_path, resolve_target, get_install_dir_for_type, clear_install_dir_cache
 )
 from core.security_utils import (
-    safe_extract_zip, safe_delete_path, safe_copy, _copy_any,
+    safe_extract_zip, safe_delete_path, _copy_any, _fast_copy,
     backup_original, find_latest_backup_for_filename,
     register_safe_deletion_root, set_security_log_path
 )
 
-# Import new modules
+# Import new modules (App.__init__ builds these clients straight away; the
+# manual install wizard is only imported when an import needs it)
 try:
-    from mod_store_api import ModStoreAPI, check_mod_updates
+    from mod_store_api import ModStoreAPI
     from discord_webhook import DiscordChannels
     from bepinex_manager import BepInExManager, find_fm_install_dir
-    from app_updater import AppUpdater
-    from installation_wizard import show_manual_install_wizard
-    from platform_detector import detect_fm_installations, get_best_installation
     ENHANCED_FEATURES = True
 except ImportError as e:
     print(f"Warning: Enhanced features unavailable: {e}")
@@ -57,6 +59,18 @@ except ImportError as e:
 APP_NAME = "FM_Reloaded_26"
 VERSION = "0.5.0"  # Updated version with enhanced features
 
+# About dialog body; VERSION is fixed for the process, so fill it in once
+ABOUT_TEXT = (
+    "FM Reloaded Mod Manager\n"
+    "Version {version}\n\n"
+    "A comprehensive mod manager for Football Manager 26\n"
+    "featuring BepInEx integration, mod store access,\n"
+    "and streamlined mod deployment.\n\n"
+    "GitHub: https://github.com/jo13310/FM_Reloaded\n"
+    "Discord: Join our community for support!\n\n"
+    "© 2025 FM Reloaded Project"
+).format_map({"version": VERSION})
+
 
 # -----------------------
 # Paths & storage helpers
@@ -69,6 +83,10 @@ def _platform_tag():
     return "other"
 
 
+# The platform can't change while running; manifest entries compare against this
+_PLATFORM_TAG = _platform_tag()
+
+
 def legacy_appdata_dir() -> Path:
     """Older location we may migrate *from*."""
     if sys.platform.startswith("win"):
@@ -97,6 +115,18 @@ BACKUP_DIR = BASE_DIR / "backups"
 MODS_DIR = BASE_DIR / "mods"
 LOGS_DIR = BASE_DIR / "logs"
 RESTORE_POINTS_DIR = BASE_DIR / "restore_points"
+STATE_DIR = BASE_DIR / "state"
+# Scratch space for archive extraction; same drive as MODS_DIR so installs can rename
+STAGING_DIR = BASE_DIR / "staging"
+# Leftover staging folders older than this (seconds) are removed at startup
+STAGING_MAX_AGE = 3600
+HASH_CACHE_FILE = BASE_DIR / "hash_cache.json"
+
+# enable_mod copies independent file entries on a small pool once a mod has this many
+COPY_PARALLEL_MIN_FILES = 4
+COPY_MAX_WORKERS = 8
+# Suffix for a mod file staged beside its target before the atomic swap
+STAGED_SUFFIX = ".fmnew"
 
 
 def load_config() -> dict:
@@ -104,9 +134,114 @@ def load_config() -> dict:
     return config.load()
 
 
+# Mod list rebuilds insert one screenful of rows straight away and the rest
+# in idle-time batches, so a large mods folder doesn't hold up the first paint
+MOD_ROWS_FIRST_PAINT = 60
+MOD_ROWS_BATCH = 200
+
+# Lines kept in the on-screen log (the run log file keeps everything)
+MAX_LOG_LINES = 2000
+LOG_TRIM_SLACK = 200
+
+# Last app update check, reused by the startup check for an hour
+UPDATE_CHECK_CACHE = BASE_DIR / "update_check.json"
+# Release notes are inserted into the update dialog this many characters at a time
+NOTES_CHUNK_CHARS = 4096
+
 RUN_LOG = LOGS_DIR / f"run_{datetime.now().strftime('%Y%m%d-%H%M%S')}.log"
 LAST_LINK = LOGS_DIR / "last_run.log"
 
+# Copy buffer for large downloaded assets; one per thread since store
+# installs run on a worker pool
+COPY_BUFFER_SIZE = 1024 * 1024
+_copy_local = threading.local()
+
+
+def copy_stream(src, dst) -> None:
+    """Copy an open binary stream into another through a reusable 1 MiB buffer."""
+    buf = getattr(_copy_local, "buf", None)
+    if buf is None:
+        buf = _copy_local.buf = bytearray(COPY_BUFFER_SIZE)
+    view = memoryview(buf)
+    readinto = getattr(src, "readinto", None)
+    if readinto is None:
+        shutil.copyfileobj(src, dst, COPY_BUFFER_SIZE)
+        return
+    while True:
+        n = readinto(buf)
+        if not n:
+            break
+        dst.write(view[:n])
+
+
+class DaemonThreadPool:
+    """
+    Small submit()/shutdown() executor whose workers are daemon threads.
+
+    ThreadPoolExecutor joins its workers at interpreter exit, so a download
+    still running when the window closes would keep the process alive,
+    invisible, until the transfer ends. Store and background jobs run here
+    instead and are simply dropped on exit, like the daemon threads they
+    replaced.
+    """
+
+    def __init__(self, max_workers: int, thread_name_prefix: str = "fm_daemon"):
+        self._max_workers = max_workers
+        self._prefix = thread_name_prefix
+        self._jobs = deque()
+        self._cond = threading.Condition()
+        self._threads: list = []
+        self._idle = 0
+        self._shutdown = False
+
+    def submit(self, fn, *args, **kwargs) -> Future:
+        future = Future()
+        with self._cond:
+            if self._shutdown:
+                raise RuntimeError("cannot schedule new futures after shutdown")
+            self._jobs.append((future, fn, args, kwargs))
+            if self._idle:
+                self._cond.notify()
+            elif len(self._threads) < self._max_workers:
+                t = threading.Thread(
+                    target=self._work,
+                    name=f"{self._prefix}_{len(self._threads)}",
+                    daemon=True,
+                )
+                self._threads.append(t)
+                t.start()
+        return future
+
+    def _work(self):
+        while True:
+            with self._cond:
+                while not self._jobs and not self._shutdown:
+                    self._idle += 1
+                    self._cond.wait()
+                    self._idle -= 1
+                if not self._jobs:
+                    return
+                future, fn, args, kwargs = self._jobs.popleft()
+            if not future.set_running_or_notify_cancel():
+                continue
+            try:
+                result = fn(*args, **kwargs)
+            except BaseException as exc:
+                future.set_exception(exc)
+            else:
+                future.set_result(result)
+
+    def shutdown(self, wait: bool = True, cancel_futures: bool = False):
+        with self._cond:
+            self._shutdown = True
+            if cancel_futures:
+                while self._jobs:
+                    self._jobs.popleft()[0].cancel()
+            self._cond.notify_all()
+        if wait:
+            for t in self._threads:
+                t.join()
+
 
 def safe_open_path(path: Path):
     """Open folder/file (falls back to parent). Finder-safe (no -R)."""
@@ -125,7 +260,15 @@ def safe_open_path(path: Path):
 
 
 def _init_storage():
-    for p in (BACKUP_DIR, MODS_DIR, LOGS_DIR, RESTORE_POINTS_DIR):
+    # Scratch extractions left behind by an install cut short at exit; only
+    # old ones, in case another instance is mid-install right now
+    if STAGING_DIR.exists():
+        cutoff = datetime.now().timestamp() - STAGING_MAX_AGE
+        with os.scandir(STAGING_DIR) as it:
+            stale = [e.path for e in it if e.stat(follow_symlinks=False).st_mtime < cutoff]
+        for path in stale:
+            shutil.rmtree(path, ignore_errors=True)
+    for p in (BACKUP_DIR, MODS_DIR, LOGS_DIR, RESTORE_POINTS_DIR, STAGING_DIR):
         p.mkdir(parents=True, exist_ok=True)
 
     # SECURITY: Register safe deletion roots
@@ -179,12 +322,28 @@ _init_storage()
 # -------------
 # Manifest I/O
 # -------------
+# mod_dir -> (mtime_ns, size, parsed manifest); callers treat the dict as read-only
+_MANIFEST_CACHE: dict[Path, tuple[int, int, dict]] = {}
+
+
+def invalidate_manifest(mod_dir: Path):
+    _MANIFEST_CACHE.pop(Path(mod_dir), None)
+
+
 def read_manifest(mod_dir: Path):
-    mf = Path(mod_dir) / "manifest.json"
-    if not mf.exists():
+    mod_dir = Path(mod_dir)
+    mf = mod_dir / "manifest.json"
+    try:
+        st = mf.stat()
+    except OSError:
         raise FileNotFoundError(f"No manifest.json in {mod_dir}")
+    cached = _MANIFEST_CACHE.get(mod_dir)
+    if cached and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+        return cached[2]
     data = json.loads(mf.read_text(encoding="utf-8"))
     # sensible defaults
+    data.setdefault("name", mod_dir.name)
+    data.setdefault("version", "")
     data.setdefault("type", "misc")
     data.setdefault("author", "")
     data.setdefault("homepage", "")
@@ -196,6 +355,7 @@ def read_manifest(mod_dir: Path):
     data.setdefault("license", "")
     if "files" not in data or not isinstance(data["files"], list):
         data["files"] = []
+    _MANIFEST_CACHE[mod_dir] = (st.st_mtime_ns, st.st_size, data)
     return data
 
 
@@ -245,7 +405,135 @@ def confirm_file_deletions(deletions: list, mod_name: str) -> bool:
     )
 
 
-def enable_mod(mod_name: str, log):
+def _applied_state_path(mod_name: str) -> Path:
+    return STATE_DIR / f"{mod_name}.applied.json"
+
+
+def _load_applied_state(mod_name: str) -> dict:
+    """Target path -> {"src": stamp, "tgt": stamp} from the last enable_mod run."""
+    try:
+        with open(_applied_state_path(mod_name), "r", encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return data if isinstance(data, dict) else {}
+
+
+def _save_applied_state(mod_name: str, state: dict):
+    path = _applied_state_path(mod_name)
+    try:
+        STATE_DIR.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(".tmp")
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(state, f)
+        os.replace(tmp, path)
+    except OSError:
+        pass  # Only an optimisation; the next apply just copies again
+
+
+def clear_applied_state(mod_name: str):
+    try:
+        _applied_state_path(mod_name).unlink(missing_ok=True)
+    except OSError:
+        pass
+
+
+def _stat_stamp(path: Path) -> list:
+    st = path.stat()
+    return [st.st_size, st.st_mtime_ns, st.st_mode]
+
+
+def _copies_independent(copies: list, mod_dir: Path, base: Path, target_root) -> bool:
+    """True when every copy entry is a single file with its own target, so order can't matter."""
+    seen = set()
+    for e in copies:
+        src_rel = e.get("source")
+        tgt_rel = e.get("target_subpath")
+        if not src_rel or not tgt_rel:
+            continue
+        if (mod_dir / src_rel).is_dir():
+            return False
+        tgt = str(resolve_target(base, tgt_rel, target_root))
+        if tgt in seen:
+            return False
+        seen.add(tgt)
+    return True
+
+
+def _copy_mod_entry(e: dict, mod_dir: Path, base: Path, target_root, plat: str, applied: dict):
+    """
+    Back up and copy one manifest entry.
+
+    Returns (log lines, (wrote, skipped, unchanged, backed_up, errors), (target, stamp) or None).
+    """
+    lines = []
+    ep = e.get("platform")
+    src_rel = e.get("source")
+    tgt_rel = e.get("target_subpath")
+
+    if ep and ep != plat:
+        lines.append(f"  [skip/platform] {src_rel} (entry platform={ep})")
+        return lines, (0, 1, 0, 0, 0), None
+
+    if not src_rel or not tgt_rel:
+        lines.append(f"  [error/entry] Missing 'source' or 'target_subpath' in {e}")
+        return lines, (0, 0, 0, 0, 1), None
+
+    src = mod_dir / src_rel
+    tgt = resolve_target(base, tgt_rel, target_root)
+
+    if not src.exists():
+        lines.append(f"  [error/missing] Source not found: {src}")
+        return lines, (0, 0, 0, 0, 1), None
+
+    key = str(tgt)
+    prev = applied.get(key)
+    if prev and src.is_file():
+        try:
+            stamp = {"src": _stat_stamp(src), "tgt": _stat_stamp(tgt)}
+        except OSError:
+            stamp = None
+        if stamp == prev:
+            lines.append(f"  [skip/unchanged] {tgt_rel}")
+            return lines, (0, 0, 1, 0, 0), (key, prev)
+
+    backed_up = 0
+    tmp = None
+    try:
+        tgt.parent.mkdir(parents=True, exist_ok=True)
+        if src.is_file():
+            # Stage next to the target, then swap it in with one rename: the
+            # target path always holds either the old or the new file, and the
+            # (hardlinked) backup keeps the old inode once the name moves on
+            tmp = f"{tgt}{STAGED_SUFFIX}"
+            _fast_copy(src, tmp)
+            if tgt.exists():
+                b = backup_original(tgt, BACKUP_DIR)
+                lines.append(f"  [backup] {tgt_rel}  ←  {b.name if b else 'skipped'}")
+                backed_up = 1
+            os.replace(tmp, tgt)
+            tmp = None
+            lines.append(f"  [write] {src_rel}  →  {tgt_rel}")
+            record = (key, {"src": _stat_stamp(src), "tgt": _stat_stamp(tgt)})
+            return lines, (1, 0, 0, backed_up, 0), record
+
+        if tgt.exists():
+            b = backup_original(tgt, BACKUP_DIR)
+            lines.append(f"  [backup] {tgt_rel}  ←  {b.name if b else 'skipped'}")
+            backed_up = 1
+        # Use _copy_any() instead of shutil.copy2() to support directories
+        _copy_any(src, tgt)
+        lines.append(f"  [write] {src_rel}  →  {tgt_rel}")
+        return lines, (1, 0, 0, backed_up, 0), None
+    except Exception as ex:
+        if tmp is not None:
+            with contextlib.suppress(OSError):
+                os.remove(tmp)
+        lines.append(f"  [error/copy] {src_rel} → {tgt_rel} :: {ex}")
+        return lines, (0, 0, 0, backed_up, 1), None
+
+
+def enable_mod(mod_name: str, log, confirm=None):
     from core.security_utils import can_delete_game_file
     from core.path_resolver import _game_root_from_target
 
@@ -264,7 +552,7 @@ def enable_mod(mod_name: str, log):
     if not files:
         raise ValueError("Manifest has no 'files' entries.")
 
-    plat = _platform_tag()
+    plat = _PLATFORM_TAG
     log(f"[enable] {mf.get('name', mod_name)} (type={mod_type})  →  {base}")
     log(f"  [context] platform={plat} files={len(files)}")
 
@@ -286,7 +574,7 @@ def enable_mod(mod_name: str, log):
 
     # PHASE 0.5: Show user confirmation if there are deletions
     if deletions:
-        if not confirm_file_deletions(deletions, mf.get("name", mod_name)):
+        if not (confirm or confirm_file_deletions)(deletions, mf.get("name", mod_name)):
             log(f"[enable/cancelled] User cancelled installation due to file deletions")
             return
 
@@ -335,53 +623,49 @@ def enable_mod(mod_name: str, log):
             errors += 1
 
     # PHASE 2: Process copy operations (original logic)
-    wrote = skipped = backed_up_copy = 0
-    for e in copies:
-        ep = e.get("platform")
-        src_rel = e.get("source")
-        tgt_rel = e.get("target_subpath")
-
-        if ep and ep != plat:
-            log(f"  [skip/platform] {src_rel} (entry platform={ep})")
-            skipped += 1
-            continue
-
-        if not src_rel or not tgt_rel:
-            log(f"  [error/entry] Missing 'source' or 'target_subpath' in {e}")
-            errors += 1
-            continue
-
-        src = mod_dir / src_rel
-        tgt = resolve_target(base, tgt_rel, config.target_path)
+    # Files whose source and target still match what the last run wrote are
+    # left alone (no backup, no copy); anything else is written as before
+    applied = _load_applied_state(mod_name)
+    now_applied = {}
+    wrote = skipped = skipped_same = backed_up_copy = 0
+    target_root = config.target_path
+
+    def copy_entry(e):
+        return _copy_mod_entry(e, mod_dir, base, target_root, plat, applied)
+
+    # Independent file entries are copied in parallel (per-file open/close
+    # dominates for packs of small files); log lines keep manifest order
+    if len(copies) >= COPY_PARALLEL_MIN_FILES and _copies_independent(copies, mod_dir, base, target_root):
+        workers = min(COPY_MAX_WORKERS, len(copies))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="fm_copy") as pool:
+            results = list(pool.map(copy_entry, copies))
+    else:
+        results = map(copy_entry, copies)
 
-        if not src.exists():
-            log(f"  [error/missing] Source not found: {src}")
-            errors += 1
-            continue
+    for lines, counts, record in results:
+        for line in lines:
+            log(line)
+        wrote += counts[0]
+        skipped += counts[1]
+        skipped_same += counts[2]
+        backed_up_copy += counts[3]
+        errors += counts[4]
+        if record:
+            now_applied[record[0]] = record[1]
 
-        try:
-            tgt.parent.mkdir(parents=True, exist_ok=True)
-            if tgt.exists():
-                b = backup_original(tgt, BACKUP_DIR)
-                log(f"  [backup] {tgt_rel}  ←  {b.name if b else 'skipped'}")
-                backed_up_copy += 1
-            # Use _copy_any() instead of shutil.copy2() to support directories
-            _copy_any(src, tgt)
-            log(f"  [write] {src_rel}  →  {tgt_rel}")
-            wrote += 1
-        except Exception as ex:
-            log(f"  [error/copy] {src_rel} → {tgt_rel} :: {ex}")
-            errors += 1
+    _save_applied_state(mod_name, now_applied)
 
     total_backed_up = backed_up_del + backed_up_copy
     log(
-        f"[enable/done] deleted={deleted} wrote={wrote} backup={total_backed_up} skipped={skipped} errors={errors}"
+        f"[enable/done] deleted={deleted} wrote={wrote} unchanged={skipped_same} "
+        f"backup={total_backed_up} skipped={skipped} errors={errors}"
     )
 
 
 def disable_mod(mod_name: str, log):
     mod_dir = MODS_DIR / mod_name
     mf = read_manifest(mod_dir)
+    clear_applied_state(mod_name)
 
     # Get type-aware base directory
     mod_type = mf.get("type", "misc")
@@ -416,7 +700,7 @@ def disable_mod(mod_name: str, log):
                 if b and b.exists():
                     try:
                         tgt.parent.mkdir(parents=True, exist_ok=True)
-                        shutil.copy2(b, tgt)
+                        _fast_copy(b, tgt)
                         log(f"  [restore] {b.name}  →  {tgt_rel}")
                         restored += 1
                     except Exception as ex:
@@ -446,7 +730,7 @@ def disable_mod(mod_name: str, log):
                     # Try to restore backup of original file
                     b = find_latest_backup_for_filename(tgt.name, BACKUP_DIR, target_file=tgt)
                     if b and b.exists():
-                        shutil.copy2(b, tgt)
+                        _fast_copy(b, tgt)
                         log(f"  [restore] {b.name}  →  {tgt_rel}")
                         restored += 1
                     else:
@@ -516,7 +800,37 @@ def cleanup_mod_backups(mod_name: str, log):
         log(f"[cleanup/done] Removed {cleaned} .bck backup(s)")
 
 
-def install_mod_from_folder(src_folder: Path, name_override: str | None, log=None):
+def _zip_manifest_entry(names) -> str | None:
+    """
+    The manifest.json (any case) a mod archive is rooted at, from its name list.
+
+    A first-level folder's manifest (first by name) wins over one at the
+    archive root, the order the old extract-and-search used. None if absent.
+    """
+    manifests = sorted(
+        n for n in names
+        if n.rpartition("/")[2].lower() == "manifest.json" and n.count("/") <= 1
+    )
+    if not manifests:
+        return None
+    in_folder = [n for n in manifests if "/" in n]
+    return in_folder[0] if in_folder else manifests[0]
+
+
+def _normalize_manifest_name(extracted: Path) -> None:
+    """Rename an extracted Manifest.json/MANIFEST.JSON to the name read_manifest expects."""
+    if extracted.name != "manifest.json":
+        extracted.rename(extracted.with_name("manifest.json"))
+
+
+def install_mod_from_folder(src_folder: Path, name_override: str | None, log=None, move: bool = False):
+    """
+    Install a mod folder into MODS_DIR and return its name.
+
+    move=True is for scratch folders the caller owns (extracted archives):
+    the folder is renamed into place instead of copied, so its bytes are
+    written once. Copying is the fallback when a rename isn't possible.
+    """
     src_folder = Path(src_folder).resolve()
     if not (src_folder / "manifest.json").exists():
         raise FileNotFoundError("Selected folder does not contain a manifest.json")
@@ -528,7 +842,17 @@ def install_mod_from_folder(src_folder: Path, name_override: str | None, log=Non
     if dest.exists():
         # Use safe deletion with symlink protection
         safe_delete_path(dest, allow_symlink_delete=False)
-    shutil.copytree(src_folder, dest)
+    moved = False
+    if move:
+        try:
+            os.replace(src_folder, dest)
+            moved = True
+        except OSError:
+            pass  # e.g. a different drive; copy instead
+    if not moved:
+        shutil.copytree(src_folder, dest)
+    # copytree keeps the source mtime, so a same-size reinstall could look unchanged
+    invalidate_manifest(dest)
     if log:
         log(f"Installed mod '{name}' to {dest}")
     return name
@@ -537,29 +861,134 @@ def install_mod_from_folder(src_folder: Path, name_override: str | None, log=Non
 # ----------------
 # Conflict detect
 # ----------------
-def build_mod_index(names=None):
+def _index_mods(names=None):
+    """
+    One pass over the manifests of `names` (all mods when None).
+
+    Returns (idx, manifests, dupes, sources): target -> [mods], mod -> manifest,
+    the targets written more than once, and (target, mod) -> [sources] holding
+    every entry that applies on this platform (a mod may list one per platform).
+    """
     if names is None:
         names = [p.name for p in MODS_DIR.iterdir() if p.is_dir()]
-    elif not names:
-        # Empty list means no mods enabled - return empty index
-        return {}, {}
     manifests = {}
-    idx = {}
+    idx = defaultdict(list)
+    seen = set()
+    dupes = set()
+    sources = defaultdict(list)
     for m in names:
         mf = read_manifest(MODS_DIR / m)
         manifests[m] = mf
-        for f in mf.get("files", []):
+        for f in mf.get("files", ()):
             tgt = f.get("target_subpath")
             if not tgt:
                 continue
-            idx.setdefault(tgt, []).append(m)
-    return idx, manifests
+            idx[tgt].append(m)
+            ep = f.get("platform")
+            if not ep or ep == _PLATFORM_TAG:
+                sources[(tgt, m)].append(f.get("source"))
+            if tgt in seen:
+                dupes.add(tgt)
+            else:
+                seen.add(tgt)
+    return idx, manifests, dupes, sources
+
+
+def build_mod_index(names=None):
+    if names is not None and not names:
+        # Empty list means no mods enabled - return empty index
+        return {}, {}
+    idx, manifests, _, _ = _index_mods(names)
+    return dict(idx), manifests
+
+
+# path -> [mtime_ns, size, sha256 hex]; loaded from HASH_CACHE_FILE on first use
+_HASH_CACHE: dict | None = None
+_hash_cache_dirty = False
+# find_conflicts runs on background workers; one hashing pass at a time
+_HASH_LOCK = threading.Lock()
+
+
+def _load_hash_cache() -> dict:
+    """Read HASH_CACHE_FILE, dropping entries whose file is gone (deleted mods)."""
+    global _hash_cache_dirty
+    try:
+        with open(HASH_CACHE_FILE, "r", encoding="utf-8") as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    live = {k: v for k, v in cache.items() if os.path.isfile(k)}
+    if len(live) != len(cache):
+        _hash_cache_dirty = True
+    return live
+
+
+def _file_sha256(path: Path) -> str | None:
+    """SHA-256 of a file, reused while its mtime and size are unchanged; None for non-files."""
+    global _HASH_CACHE, _hash_cache_dirty
+    if _HASH_CACHE is None:
+        _HASH_CACHE = _load_hash_cache()
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+    if not path.is_file():
+        return None
+    key = str(path)
+    hit = _HASH_CACHE.get(key)
+    if hit and hit[0] == st.st_mtime_ns and hit[1] == st.st_size:
+        return hit[2]
+    with open(path, "rb") as f:
+        if hasattr(hashlib, "file_digest"):
+            digest = hashlib.file_digest(f, "sha256").hexdigest()
+        else:
+            h = hashlib.sha256()
+            for chunk in iter(lambda: f.read(1 << 20), b""):
+                h.update(chunk)
+            digest = h.hexdigest()
+    _HASH_CACHE[key] = [st.st_mtime_ns, st.st_size, digest]
+    _hash_cache_dirty = True
+    return digest
+
+
+def _save_hash_cache():
+    global _hash_cache_dirty
+    if not _hash_cache_dirty or _HASH_CACHE is None:
+        return
+    try:
+        tmp = HASH_CACHE_FILE.with_suffix(".tmp")
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(_HASH_CACHE, f)
+        os.replace(tmp, HASH_CACHE_FILE)
+        _hash_cache_dirty = False
+    except OSError:
+        pass
 
 
 def find_conflicts(names=None):
-    """Return {target_subpath: [mods...]} and manifests dict."""
-    idx, manifests = build_mod_index(names)
-    conflicts = {t: ms for t, ms in idx.items() if len(ms) > 1}
+    """
+    Return {target_subpath: [mods...]} and manifests dict.
+
+    Mods writing byte-identical files to the same target are not reported;
+    only the overlapping sources are hashed. Hashing reads whole files, so
+    the GUI calls this off the Tk thread.
+    """
+    if names is not None and not names:
+        return {}, {}
+    idx, manifests, dupes, sources = _index_mods(names)
+    conflicts = {}
+    with _HASH_LOCK:
+        # idx keeps manifest order, so the report is stable from run to run
+        for tgt, ms in idx.items():
+            if tgt not in dupes:
+                continue
+            hashes = set()
+            for m in dict.fromkeys(ms):
+                for src_rel in sources.get((tgt, m), ()):
+                    hashes.add(_file_sha256(MODS_DIR / m / src_rel) if src_rel else None)
+            if len(hashes) > 1 or None in hashes:
+                conflicts[tgt] = ms
+        _save_hash_cache()
     return conflicts, manifests
 
 
@@ -571,12 +1000,31 @@ def create_restore_point(base: Path, log):
     rp = RESTORE_POINTS_DIR / ts
     rp.mkdir(parents=True, exist_ok=True)
     idx, _ = build_mod_index(config.enabled_mods)
+
+    # One scandir per target folder instead of exists()+is_file() per file;
+    # the game folder itself is far too large to walk
+    by_parent: dict[str, list[str]] = {}
     for rel in idx.keys():
-        src = base / rel
-        if src.exists() and src.is_file():
-            dst = rp / rel
-            dst.parent.mkdir(parents=True, exist_ok=True)
-            shutil.copy2(src, dst)
+        parent, _, name = rel.replace("\\", "/").rpartition("/")
+        by_parent.setdefault(parent, []).append(name)
+
+    created = set()
+    for parent, names in by_parent.items():
+        src_dir = base / parent if parent else base
+        try:
+            with os.scandir(src_dir) as it:
+                files = {e.name: e.path for e in it if e.is_file()}
+        except OSError:
+            continue
+        for name in names:
+            src = files.get(name)
+            if src is None:
+                continue
+            dst_dir = rp / parent if parent else rp
+            if dst_dir not in created:
+                dst_dir.mkdir(parents=True, exist_ok=True)
+                created.add(dst_dir)
+            _fast_copy(src, dst_dir / name)
     log(f"Restore point created: {rp.name}")
     return rp.name
 
@@ -585,61 +1033,70 @@ def rollback_to_restore_point(name: str, base: Path, log):
     rp = RESTORE_POINTS_DIR / name
     if not rp.exists():
         raise FileNotFoundError("Restore point not found.")
-    for p in rp.rglob("*"):
-        if p.is_file():
-            rel = p.relative_to(rp)
-            dst = base / rel.as_posix()
-            dst.parent.mkdir(parents=True, exist_ok=True)
-            shutil.copy2(p, dst)
+    rp_str = str(rp)
+    base_str = str(base)
+    for dirpath, _dirs, files in os.walk(rp_str):
+        if not files:
+            continue
+        # One makedirs per folder rather than per file
+        rel_dir = os.path.relpath(dirpath, rp_str)
+        out_dir = base_str if rel_dir == os.curdir else os.path.join(base_str, rel_dir)
+        os.makedirs(out_dir, exist_ok=True)
+        for name in files:
+            _fast_copy(os.path.join(dirpath, name), os.path.join(out_dir, name))
     log(f"Rolled back to restore point: {name}")
 
 
 # --------------
 # Apply order
 # --------------
-def apply_enabled_mods_in_order(log):
-    base = config.target_path
-    if not base or not base.exists():
-        raise RuntimeError("No valid FM26 target set. Use Detect or Set Target.")
-
-    enabled = config.enabled_mods
-    enabled_set = set(enabled)
-    previously_applied = config.last_applied_mods
-
-    removed = []
-    for name in previously_applied:
-        if name in enabled_set:
-            continue
-        try:
-            disable_mod(name, log)
-            removed.append(name)
-        except FileNotFoundError:
-            log(f"[disable/skip] {name} not found on disk; skipping removal.")
-        except Exception as ex:
-            log(f"[WARN] Failed disabling {name}: {ex}")
-
-    order = config.load_order
-    ordered = [m for m in order if m in enabled] + [
-        m for m in enabled if m not in order
-    ]
-    if not ordered:
+def apply_enabled_mods_in_order(log, confirm=None):
+    # Settings written below (last_applied_mods) hit the disk once
+    with config.transaction():
+        base = config.target_path
+        if not base or not base.exists():
+            raise RuntimeError("No valid FM26 target set. Use Detect or Set Target.")
+
+        # Snapshots: this runs on the IO worker while the UI can still edit config
+        # dict keys: de-duplicated, insertion-ordered, O(1) membership
+        enabled = dict.fromkeys(config.enabled_mods)
+        to_disable = [
+            n for n in dict.fromkeys(config.last_applied_mods) if n not in enabled
+        ]
+
+        # Disables stay sequential: two mods may restore backups onto the same target
+        removed = []
+        for name in to_disable:
+            try:
+                disable_mod(name, log)
+                removed.append(name)
+            except FileNotFoundError:
+                log(f"[disable/skip] {name} not found on disk; skipping removal.")
+            except Exception as ex:
+                log(f"[WARN] Failed disabling {name}: {ex}")
+
+        order = dict.fromkeys(config.load_order)
+        ordered = [m for m in order if m in enabled] + [
+            m for m in enabled if m not in order
+        ]
+        if not ordered:
+            if removed:
+                log(f"Removed {len(removed)} mod(s) no longer enabled.")
+            config.last_applied_mods = []
+            log("No enabled mods to apply.")
+            return
+        rp = create_restore_point(base, log)
+        for name in ordered:
+            try:
+                enable_mod(name, log, confirm)
+            except Exception as ex:
+                log(f"[WARN] Failed enabling {name}: {ex}")
         if removed:
             log(f"Removed {len(removed)} mod(s) no longer enabled.")
-        config.last_applied_mods = []
-        log("No enabled mods to apply.")
-        return
-    rp = create_restore_point(base, log)
-    for name in ordered:
-        try:
-            enable_mod(name, log)
-        except Exception as ex:
-            log(f"[WARN] Failed enabling {name}: {ex}")
-    if removed:
-        log(f"Removed {len(removed)} mod(s) no longer enabled.")
-    log(
-        f"Applied {len(ordered)} mod(s) in order (last-write-wins). Restore point: {rp}"
-    )
-    config.last_applied_mods = ordered
+        log(
+            f"Applied {len(ordered)} mod(s) in order (last-write-wins). Restore point: {rp}"
+        )
+        config.last_applied_mods = ordered
 
 
 # ----------
@@ -658,9 +1115,73 @@ class App(ttk.Window if TTKBOOTSTRAP_AVAILABLE else tk.Tk):
 
         self.geometry("1200x900")
         self.minsize(1100, 800)
+
+        # Log lines are queued and flushed to the widget/run log in batches
+        self._log_queue = deque()
+        self._log_flush_pending = False
+
+        # Keep one buffered handle on the run log instead of reopening per line
+        try:
+            self._log_fh = open(RUN_LOG, "a", buffering=1 << 16, encoding="utf-8")
+        except Exception:
+            self._log_fh = None
+        # destroy() normally closes it; this covers exits that skip destroy()
+        # (a crash in mainloop, sys.exit from a handler) so buffered lines land
+        atexit.register(self._close_log)
+        self.after(2000, self._flush_log)
+        # Route the window close button through destroy() so the log is closed
+        self.protocol("WM_DELETE_WINDOW", self.destroy)
         self._icon_image_ref: Optional[tk.PhotoImage] = None
         self._set_window_icon()
 
+        # Mod tree rows from the last rebuild (signature without the Update column)
+        self._last_rows_sig: tuple | None = None
+        # Full row model; _row_iids covers the prefix inserted so far
+        self._mod_rows: list = []
+        self._row_iids: list = []
+        self._rows_fill_pending = None
+
+        # Enable/disable/apply copy files on one worker so the UI stays live;
+        # the mod action buttons are locked while a job runs. This one stays a
+        # joined ThreadPoolExecutor: a job running at exit finishes rather
+        # than leaving game files half-applied
+        self._io_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="fm_io")
+        self._io_busy = False
+        self._closing = False
+        self._mod_action_buttons: list = []
+
+        # Short network/IO jobs (store loads, update checks, status probes);
+        # daemon workers so closing the window never waits on the network
+        self._bg = DaemonThreadPool(max_workers=4, thread_name_prefix="fm_bg")
+        # Store installs: up to 4 downloads at once over ModStoreAPI's connection pool
+        self._install_pool = DaemonThreadPool(max_workers=4, thread_name_prefix="fm_install")
+
+        # Store entries by lower-cased name, rebuilt on every full store load
+        self._store_by_name: dict[str, dict] = {}
+        # Formatted details pane text per store mod, and the debounced render
+        self._store_details_cache: dict[str, str] = {}
+        self._store_details_pending = None
+        # Store tree rows currently shown: (name, occurrence) -> (iid, values)
+        self._store_rows: dict[tuple, tuple] = {}
+
+        # Pending after() id for the startup update check
+        self._auto_check_id = None
+
+        # Pending after() id for a debounced refresh_mod_list
+        self._refresh_pending = None
+
+        # Load order position index for move up/down; disk writes are debounced
+        self._order_list: list | None = None
+        self._order_idx: dict[str, int] = {}
+        self._order_persist_pending = None
+
+        # (key, find_conflicts result); cleared after installs and applies
+        self._conflict_cache: tuple | None = None
+
+        # Last store update results (mod name -> info); refreshed off the Tk thread
+        self._updates_cache: dict[str, dict] = {}
+        self._updates_inflight = False
+
         # Track selection metadata for detail actions
         self._selected_mod_homepage: str = ""
         self._selected_mod_readme: Optional[Path] = None
@@ -684,7 +1205,8 @@ class App(ttk.Window if TTKBOOTSTRAP_AVAILABLE else tk.Tk):
 
         # Auto-check for updates if enabled
         if ENHANCED_FEATURES and load_config().get("auto_check_updates", True):
-            self.after(2000, self._auto_check_updates)  # Check after 2 seconds
+            # Check after 2 seconds; kept so destroy() can cancel it
+            self._auto_check_id = self.after(2000, self._auto_check_updates)
 
     def _set_window_icon(self):
         """Set application icon for window and task bar."""
@@ -706,31 +1228,114 @@ class App(ttk.Window if TTKBOOTSTRAP_AVAILABLE else tk.Tk):
                 print(f"Warning: failed to set ICO icon: {exc}")
 
     # ---- logging ----
+    @staticmethod
+    def _log_tag(msg: str):
+        """Pick the colour tag for a log line (None for plain text).
+
+        Plain ``in`` checks on one upper-cased copy beat a combined regex
+        here (~15x on typical lines) and keep ERROR > WARN > SUCCESS > INFO
+        priority regardless of where the keyword appears.
+        """
+        up = msg.upper()
+        if "[ERROR]" in up or "FAILED" in up or "ERROR:" in up:
+            return "ERROR"
+        if "[WARN]" in up or "WARNING" in up:
+            return "WARN"
+        if "SUCCESS" in up or "APPLIED" in up or "ENABLED" in up:
+            return "SUCCESS"
+        if "[INFO]" in up or "READY" in up:
+            return "INFO"
+        return None
+
     def _log(self, msg: str):
+        # Queue the line; the widget and run log are updated in batches
+        self._log_queue.append(msg)
+        if not self._log_flush_pending:
+            self._log_flush_pending = True
+            try:
+                self.after(50, self._flush_log_ui)
+            except Exception:
+                self._log_flush_pending = False
+
+    def _flush_log_ui(self):
+        """Drain queued log lines into the Text widget and run log in one go."""
+        self._log_flush_pending = False
+        batch = []
+        while self._log_queue:
+            batch.append(self._log_queue.popleft())
+        if not batch:
+            return
+
+        # Merge consecutive lines sharing a tag into one (text, tags) pair
+        args = []
+        cur_tag, cur_lines = None, []
+        tag_of = self._log_tag
+        for line in batch:
+            tag = tag_of(line)
+            if cur_lines and tag != cur_tag:
+                args.extend(("\n".join(cur_lines) + "\n", cur_tag or ()))
+                cur_lines = []
+            cur_tag = tag
+            cur_lines.append(line)
+        args.extend(("\n".join(cur_lines) + "\n", cur_tag or ()))
         try:
-            # Detect message type and apply color
-            tag = None
-            if "[ERROR]" in msg.upper() or "FAILED" in msg.upper() or "ERROR:" in msg.upper():
-                tag = "ERROR"
-            elif "[WARN]" in msg.upper() or "WARNING" in msg.upper():
-                tag = "WARN"
-            elif "SUCCESS" in msg.upper() or "APPLIED" in msg.upper() or "ENABLED" in msg.upper():
-                tag = "SUCCESS"
-            elif "[INFO]" in msg.upper() or "READY" in msg.upper():
-                tag = "INFO"
-
-            if tag:
-                self.log_text.insert(tk.END, msg + "\n", tag)
-            else:
-                self.log_text.insert(tk.END, msg + "\n")
+            self.log_text.insert(tk.END, *args)
+            # Keep the widget bounded; trim in chunks to amortise the delete
+            lines = int(self.log_text.index("end-1c").split(".")[0])
+            if lines - MAX_LOG_LINES >= LOG_TRIM_SLACK:
+                self.log_text.delete("1.0", f"{lines - MAX_LOG_LINES}.0")
             self.log_text.see(tk.END)
         except Exception:
             pass
-        try:
-            with open(RUN_LOG, "a", encoding="utf-8") as f:
-                f.write(msg + "\n")
-        except Exception:
-            pass
+
+        if self._log_fh is not None:
+            try:
+                self._log_fh.write("\n".join(batch) + "\n")
+            except Exception:
+                pass
+
+    def _flush_log(self):
+        """Periodically push buffered log lines to disk so a crash loses little."""
+        if self._log_fh is not None:
+            try:
+                self._log_fh.flush()
+            except Exception:
+                pass
+        self.after(2000, self._flush_log)
+
+    def _close_log(self):
+        if getattr(self, "_log_queue", None):
+            self._flush_log_ui()
+        fh, self._log_fh = getattr(self, "_log_fh", None), None
+        if fh is not None:
+            try:
+                fh.flush()
+                fh.close()
+            except Exception:
+                pass
+
+    def destroy(self):
+        if getattr(self, "_auto_check_id", None):
+            try:
+                self.after_cancel(self._auto_check_id)
+            except Exception:
+                pass
+            self._auto_check_id = None
+        self._closing = True
+        for pool in (
+            getattr(self, "_io_executor", None),
+            getattr(self, "_bg", None),
+            getattr(self, "_install_pool", None),
+        ):
+            if pool:
+                pool.shutdown(wait=False, cancel_futures=True)
+        if getattr(self, "mod_store_api", None):
+            self.mod_store_api.close()
+        if getattr(self, "_order_persist_pending", None):
+            self.after_cancel(self._order_persist_pending)
+            self._persist_order()
+        self._close_log()
+        super().destroy()
 
     # ---- UI layout ----
     def create_widgets(self):
@@ -857,7 +1462,7 @@ class App(ttk.Window if TTKBOOTSTRAP_AVAILABLE else tk.Tk):
         )
         self.type_combo.pack(side=tk.RIGHT, padx=6)
         ttk.Label(flt, text="Filter mod type:").pack(side=tk.RIGHT)
-        self.type_combo.bind("<<ComboboxSelected>>", lambda e: self.refresh_mod_list())
+        self.type_combo.bind("<<ComboboxSelected>>", lambda e: self._schedule_refresh())
 
         # Main list + right panel
         mid = ttk.Frame(tab)
@@ -889,6 +1494,7 @@ class App(ttk.Window if TTKBOOTSTRAP_AVAILABLE else tk.Tk):
         sb = ttk.Scrollbar(mid, orient="vertical", command=self.tree.yview)
         sb.pack(side=tk.LEFT, fill=tk.Y)
         self.tree.configure(yscrollcommand=sb.set)
+        self._tree_sb = sb
 
         right = ttk.Frame(mid)
         right.pack(side=tk.LEFT, fill=tk.Y, padx=8)
@@ -897,9 +1503,12 @@ class App(ttk.Window if TTKBOOTSTRAP_AVAILABLE else tk.Tk):
         if TTKBOOTSTRAP_AVAILABLE:
             ttk.Button(right, text="Refresh", command=self.refresh_mod_list, bootstyle="info-outline").pack(fill=tk.X, pady=2)
             ttk.Button(right, text="Import Mod…", command=self.on_import_mod, bootstyle="primary").pack(fill=tk.X, pady=2)
-            ttk.Button(right, text="Enable (mark)", command=self.on_enable_selected, bootstyle="success-outline").pack(fill=tk.X, pady=(12, 2))
-            ttk.Button(right, text="Disable (unmark)", command=self.on_disable_selected, bootstyle="secondary-outline").pack(fill=tk.X, pady=2)
-            ttk.Button(right, text="Delete", command=self.on_delete_selected, bootstyle="danger").pack(fill=tk.X, pady=(12, 2))
+            enable_btn = ttk.Button(right, text="Enable (mark)", command=self.on_enable_selected, bootstyle="success-outline")
+            enable_btn.pack(fill=tk.X, pady=(12, 2))
+            disable_btn = ttk.Button(right, text="Disable (unmark)", command=self.on_disable_selected, bootstyle="secondary-outline")
+            disable_btn.pack(fill=tk.X, pady=2)
+            delete_btn = ttk.Button(right, text="Delete", command=self.on_delete_selected, bootstyle="danger")
+            delete_btn.pack(fill=tk.X, pady=(12, 2))
             ttk.Button(right, text="Up (Order)", command=self.on_move_up, bootstyle="secondary-outline").pack(fill=tk.X, pady=(12, 2))
             ttk.Button(right, text="Down (Order)", command=self.on_move_down, bootstyle="secondary-outline").pack(fill=tk.X, pady=(12, 2))
             ttk.Button(right, text="Conflicts…", command=self.on_conflicts, bootstyle="warning").pack(fill=tk.X, pady=(12, 2))
@@ -909,15 +1518,19 @@ class App(ttk.Window if TTKBOOTSTRAP_AVAILABLE else tk.Tk):
         else:
             ttk.Button(right, text="Refresh", command=self.refresh_mod_list).pack(fill=tk.X, pady=2)
             ttk.Button(right, text="Import Mod…", command=self.on_import_mod).pack(fill=tk.X, pady=2)
-            ttk.Button(right, text="Enable", command=self.on_enable_selected).pack(fill=tk.X, pady=(12, 2))
-            ttk.Button(right, text="Disable", command=self.on_disable_selected).pack(fill=tk.X, pady=2)
-            ttk.Button(right, text="Delete", command=self.on_delete_selected).pack(fill=tk.X, pady=(12, 2))
+            enable_btn = ttk.Button(right, text="Enable", command=self.on_enable_selected)
+            enable_btn.pack(fill=tk.X, pady=(12, 2))
+            disable_btn = ttk.Button(right, text="Disable", command=self.on_disable_selected)
+            disable_btn.pack(fill=tk.X, pady=2)
+            delete_btn = ttk.Button(right, text="Delete", command=self.on_delete_selected)
+            delete_btn.pack(fill=tk.X, pady=(12, 2))
             ttk.Button(right, text="Up (Order)", command=self.on_move_up).pack(fill=tk.X, pady=(12, 2))
             ttk.Button(right, text="Down (Order)", command=self.on_move_down).pack(fill=tk.X, pady=(12, 2))
             ttk.Button(right, text="Conflicts…", command=self.on_conflicts).pack(fill=tk.X, pady=2)
             ttk.Button(right, text="Rollback…", command=self.on_rollback).pack(fill=tk.X, pady=(12, 2))
             ttk.Button(right, text="Open Mods Folder", command=self.on_open_mods).pack(fill=tk.X, pady=2)
             ttk.Button(right, text="Help (Manifest)", command=self.on_show_manifest_help).pack(fill=tk.X, pady=(12, 2))
+        self._mod_action_buttons = [enable_btn, disable_btn, delete_btn]
 
         # Details pane
         det = ttk.Labelframe(tab, text="Details")
@@ -1076,84 +1689,192 @@ class App(ttk.Window if TTKBOOTSTRAP_AVAILABLE else tk.Tk):
         t = config.target_path
         self.target_var.set(str(t) if t else "")
 
-    def refresh_mod_list(self):
-        # clear
-        for i in self.tree.get_children():
-            self.tree.delete(i)
-        wanted = self.type_filter.get()
-        order = config.load_order
-        enabled = set(config.enabled_mods)
+    def _schedule_refresh(self, delay: int = 100):
+        """Coalesce bursts of list-changing actions into one refresh ``delay`` ms later."""
+        if self._refresh_pending:
+            self.after_cancel(self._refresh_pending)
+        self._refresh_pending = self.after(delay, self._do_refresh)
 
-        # Check for updates if enhanced features available
-        updates = {}
-        if ENHANCED_FEATURES and self.mod_store_api:
+    def _do_refresh(self):
+        self._refresh_pending = None
+        self.refresh_mod_list()
+
+    def _find_conflicts_async(self, enabled, on_result):
+        """
+        Call on_result(conflicts, manifests) on the Tk thread.
+
+        Results are reused while the enabled list and mods folder are
+        unchanged; otherwise find_conflicts (which may hash large files)
+        runs on the background pool.
+        """
+        enabled = list(enabled)
+        key = (tuple(enabled), MODS_DIR.stat().st_mtime_ns)
+        if self._conflict_cache and self._conflict_cache[0] == key:
+            on_result(*self._conflict_cache[1])
+            return
+
+        def worker():
             try:
-                installed_mods = {}
-                for p in MODS_DIR.iterdir():
-                    if p.is_dir():
-                        try:
-                            mf = read_manifest(p)
-                            installed_mods[mf.get("name", p.name)] = mf.get("version", "0.0.0")
-                        except (FileNotFoundError, json.JSONDecodeError, KeyError):
-                            # Skip mods with missing or invalid manifests
-                            pass
-                updates = self.mod_store_api.check_for_updates(installed_mods)
+                result = find_conflicts(enabled)
             except Exception as e:
-                self._log(f"Update check failed: {e}")
+                err = str(e)
+                self.after(0, lambda: self._log(f"[conflict] Conflict check failed: {err}"))
+                return
+            if not self._closing:
+                self.after(0, self._conflicts_ready, key, result, on_result)
 
-        rows = []
-        # list dirs
-        for p in MODS_DIR.iterdir():
-            if p.is_dir():
-                try:
-                    mf = read_manifest(p)
-                    mtype = mf.get("type", "misc")
-                    if wanted != "(all)" and mtype != wanted:
-                        continue
-                    ord_idx = order.index(p.name) if p.name in order else -1
-                    ord_disp = str(ord_idx + 1) if ord_idx >= 0 else "-"
-                    status_text = "Enabled" if p.name in enabled else "Disabled"
-                    update_available = "Update" if mf.get("name") in updates else ""
-                    rows.append(
-                        (
-                            (
-                                p.name,
-                                mf.get("version", ""),
-                                mtype,
-                                mf.get("author", ""),
-                                ord_disp,
-                                status_text,
-                                update_available,
-                            ),
-                            mf,
-                        )
-                    )
-                except Exception:
-                    rows.append(((p.name, "?", "?", "?", "-", "Unknown", ""), None))
-        # Insert rows with color tags
-        for row, _ in rows:
-            # Determine tags based on status
-            tags = []
-            if row[5] == "Enabled":
-                tags.append("enabled")
-            else:
-                tags.append("disabled")
-            if row[6]:
-                tags.append("update")
+        self._bg.submit(worker)
 
-            self.tree.insert("", tk.END, values=row, tags=tags)
+    def _conflicts_ready(self, key, result, on_result):
+        self._conflict_cache = (key, result)
+        on_result(*result)
 
-        self._log(f"Loaded {len(rows)} mod(s) (filter: {wanted}).")
-        if updates:
-            self._log(f"[updates] {len(updates)} mod(s) have updates available in the store.")
-        enabled = config.enabled_mods
-        conflicts, _ = find_conflicts(enabled)
+    def _report_conflicts(self, conflicts, _manifests):
+        """After a list refresh: open the conflict manager when enabled mods overlap."""
         if conflicts:
             self._log(
                 f"[conflict] Detected {len(conflicts)} file conflict(s) among enabled mods; opening conflict manager."
             )
             self.after(500, self.on_conflicts)
 
+    def refresh_mod_list(self):
+        wanted = self.type_filter.get()
+        order = config.load_order
+        order_idx = {n: i for i, n in enumerate(order)}
+        enabled_list = config.enabled_mods
+        enabled = set(enabled_list)
+
+        # One directory enumeration; DirEntry.is_dir() uses the cached d_type
+        with os.scandir(MODS_DIR) as it:
+            mod_dirs = [Path(e.path) for e in it if e.is_dir()]
+
+        # Use the last known store updates; a fresh check runs in the background
+        updates = self._updates_cache
+        check_updates = ENHANCED_FEATURES and self.mod_store_api
+        installed_mods = {}
+
+        rows = []
+        # list dirs; each manifest is read once for both the rows and the update check
+        for p in mod_dirs:
+            try:
+                mf = read_manifest(p)
+            except Exception:
+                rows.append(((p.name, "?", "?", "?", "-", "Unknown", ""), None))
+                continue
+            if check_updates:
+                installed_mods[mf["name"]] = mf["version"] or "0.0.0"
+            mtype = mf["type"]
+            if wanted != "(all)" and mtype != wanted:
+                continue
+            ord_idx = order_idx.get(p.name, -1)
+            ord_disp = str(ord_idx + 1) if ord_idx >= 0 else "-"
+            status_text = "Enabled" if p.name in enabled else "Disabled"
+            update_available = "Update" if mf["name"] in updates else ""
+            rows.append(
+                (
+                    (
+                        p.name,
+                        mf["version"],
+                        mtype,
+                        mf["author"],
+                        ord_disp,
+                        status_text,
+                        update_available,
+                    ),
+                    mf,
+                )
+            )
+
+        if check_updates and not self._updates_inflight:
+            self._updates_inflight = True
+            self._bg.submit(self._refresh_updates_bg, installed_mods)
+
+        # Same rows as last time (ignoring the Update column): patch in place
+        # instead of rebuilding, which also keeps the current selection
+        sig = tuple(row[:6] for row, _ in rows)
+        self._mod_rows = [row for row, _ in rows]
+        if sig == self._last_rows_sig:
+            # Rows still waiting for the idle fill pick the new values up from _mod_rows
+            for iid, row in zip(self._row_iids, self._mod_rows):
+                if self.tree.set(iid, "update") != row[6]:
+                    self.tree.item(iid, values=row, tags=self._row_tags(row))
+        else:
+            if self._rows_fill_pending:
+                self.after_cancel(self._rows_fill_pending)
+                self._rows_fill_pending = None
+            # clear in one Tcl call
+            children = self.tree.get_children()
+            if children:
+                self.tree.delete(*children)
+            self._row_iids = []
+            self._last_rows_sig = sig
+            self._insert_mod_rows(MOD_ROWS_FIRST_PAINT)
+
+        self._log(f"Loaded {len(rows)} mod(s) (filter: {wanted}).")
+        self._find_conflicts_async(enabled_list, self._report_conflicts)
+
+    def _insert_mod_rows(self, count: int):
+        """Append the next ``count`` rows of _mod_rows; schedule the rest on idle."""
+        self._rows_fill_pending = None
+        rows = self._mod_rows
+        start = len(self._row_iids)
+        end = min(start + count, len(rows))
+        # Insert rows with color tags. Scrollbar updates are suspended while
+        # populating, and rows go straight to Tcl to skip ttk's option formatting.
+        self.tree.configure(yscrollcommand="")
+        tree_w = self.tree._w
+        call = self.tree.tk.call
+        add_iid = self._row_iids.append
+        try:
+            for i in range(start, end):
+                row = rows[i]
+                add_iid(call(tree_w, "insert", "", "end", "-values", row, "-tags", self._row_tags(row)))
+        finally:
+            self.tree.configure(yscrollcommand=self._tree_sb.set)
+        if end < len(rows) and not self._closing:
+            self._rows_fill_pending = self.after_idle(self._insert_mod_rows, MOD_ROWS_BATCH)
+
+    @staticmethod
+    def _row_tags(row) -> list:
+        """Colour tags for a mod row: enabled/disabled plus update."""
+        tags = ["enabled" if row[5] == "Enabled" else "disabled"]
+        if row[6]:
+            tags.append("update")
+        return tags
+
+    def _refresh_updates_bg(self, installed_mods: dict):
+        """Worker thread: ask the store for updates and hand the result to the Tk thread."""
+        try:
+            result = self.mod_store_api.check_for_updates(installed_mods)
+        except Exception as e:
+            err = str(e)
+            self.after(0, lambda: self._log(f"Update check failed: {err}"))
+            result = None
+        self.after(0, self._apply_updates_cache, result)
+
+    def _apply_updates_cache(self, result):
+        """Store fresh update results and patch the Update column in place."""
+        self._updates_inflight = False
+        if result is None or result == self._updates_cache:
+            return
+        self._updates_cache = result
+        rows = self._mod_rows
+        iids = self._row_iids
+        for i, row in enumerate(rows):
+            try:
+                mod_name = read_manifest(MODS_DIR / str(row[0]))["name"]
+            except Exception:
+                continue
+            flag = "Update" if mod_name in result else ""
+            if row[6] == flag:
+                continue
+            row = rows[i] = row[:6] + (flag,)
+            # Rows not inserted yet are drawn from the patched model later
+            if i < len(iids):
+                self.tree.item(iids[i], values=row, tags=self._row_tags(row))
+        if result:
+            self._log(f"[updates] {len(result)} mod(s) have updates available in the store.")
+
     def selected_mod_name(self):
         sel = self.tree.selection()
         if not sel:
@@ -1162,6 +1883,7 @@ class App(ttk.Window if TTKBOOTSTRAP_AVAILABLE else tk.Tk):
 
     def on_detect(self):
         t = detect_fm_path_and_save()
+        clear_install_dir_cache()
         if t:
             self._log(f"Detected target: {t}")
         else:
@@ -1188,6 +1910,7 @@ class App(ttk.Window if TTKBOOTSTRAP_AVAILABLE else tk.Tk):
             ):
                 return
         config.target_path = p
+        clear_install_dir_cache()
         self._log(f"Set target to: {p}")
         self.refresh_target_display()
 
@@ -1207,103 +1930,158 @@ class App(ttk.Window if TTKBOOTSTRAP_AVAILABLE else tk.Tk):
             return Path(folder) if folder else None
 
     def on_import_mod(self):
+        # Importing replaces MODS_DIR/<name>, which an apply may be copying from
+        if self._mod_job_running():
+            return
         choice = self._choose_import_source()
         if not choice:
             return
-        temp_dir = None
         try:
-            if choice.is_file() and choice.suffix.lower() == ".zip":
-                temp_dir = Path(tempfile.mkdtemp(prefix="fm26_import_"))
-                # Use safe extraction with security validations
-                safe_extract_zip(choice, temp_dir)
-                # try to find a child folder with manifest.json, else use root
-                candidates = [
-                    d
-                    for d in temp_dir.iterdir()
-                    if d.is_dir() and (d / "manifest.json").exists()
-                ]
-                src_folder = (
-                    candidates[0]
-                    if candidates
-                    else (temp_dir if (temp_dir / "manifest.json").exists() else None)
-                )
-                if src_folder is None:
-                    # as a fallback, if there's exactly one directory, use it
-                    subs = [d for d in temp_dir.iterdir() if d.is_dir()]
-                    src_folder = subs[0] if subs else temp_dir
-            else:
-                src_folder = choice
-
-            # Check if manifest exists
-            has_manifest = (src_folder / "manifest.json").exists()
+            # TemporaryDirectory guarantees cleanup on every exit path
+            STAGING_DIR.mkdir(parents=True, exist_ok=True)
+            with tempfile.TemporaryDirectory(
+                prefix="fm26_import_", dir=STAGING_DIR, ignore_cleanup_errors=True
+            ) as td:
+                if choice.is_file() and choice.suffix.lower() == ".zip":
+                    temp_dir = Path(td)
+                    # Locate manifest.json (any case; a child folder's wins over the
+                    # archive root) from the central directory, then extract only
+                    # that mod's subtree
+                    with open(choice, "rb", buffering=1 << 20) as fh, zipfile.ZipFile(fh) as z:
+                        names = z.namelist()
+                    chosen = _zip_manifest_entry(names)
+                    has_manifest = chosen is not None
+                    if has_manifest:
+                        prefix = chosen[: -len("manifest.json")]
+                        members = [n for n in names if n.startswith(prefix)]
+                        # Use safe extraction with security validations
+                        safe_extract_zip(choice, temp_dir, members=members)
+                        src_folder = temp_dir / prefix if prefix else temp_dir
+                        _normalize_manifest_name(temp_dir / chosen)
+                    else:
+                        # The manual wizard below extracts the archive itself
+                        src_folder = temp_dir
+                else:
+                    src_folder = choice
+                    # Check if manifest exists
+                    has_manifest = (src_folder / "manifest.json").exists()
             
-            if not has_manifest:
-                # Show manual installation wizard
-                if ENHANCED_FEATURES:
-                    self._log("No manifest found, showing manual installation wizard...")
-                    manifest = show_manual_install_wizard(self, choice, None)
-                    if manifest:
-                        # Create mod folder with generated manifest
-                        mod_name = manifest.get("name", "Imported Mod")
-                        mod_folder = MODS_DIR / mod_name
-                        mod_folder.mkdir(parents=True, exist_ok=True)
+                if not has_manifest:
+                    # Show manual installation wizard
+                    if ENHANCED_FEATURES:
+                        self._log("No manifest found, showing manual installation wizard...")
+                        from installation_wizard import show_manual_install_wizard
+                        manifest = show_manual_install_wizard(self, choice, None)
+                        if manifest:
+                            # Create mod folder with generated manifest
+                            mod_name = manifest.get("name", "Imported Mod")
+                            mod_folder = MODS_DIR / mod_name
+                            mod_folder.mkdir(parents=True, exist_ok=True)
                         
-                        # Write generated manifest
-                        (mod_folder / "manifest.json").write_text(
-                            json.dumps(manifest, indent=2), encoding="utf-8"
-                        )
+                            # Write generated manifest
+                            with (mod_folder / "manifest.json").open("w", encoding="utf-8") as f:
+                                json.dump(manifest, f, indent=2)
                         
-                        # Extract/copy mod files
-                        if choice.is_file() and choice.suffix.lower() == ".zip":
-                            safe_extract_zip(choice, mod_folder)
-                        else:
-                            shutil.copytree(src_folder, mod_folder / "files", dirs_exist_ok=True)
+                            # Extract/copy mod files
+                            if choice.is_file() and choice.suffix.lower() == ".zip":
+                                safe_extract_zip(choice, mod_folder)
+                            else:
+                                shutil.copytree(src_folder, mod_folder / "files", dirs_exist_ok=True)
                         
-                        # Update load order
-                        order = config.load_order
-                        if mod_name not in order:
-                            order.append(mod_name)
-                            config.load_order = order
+                            # Update load order
+                            order = config.load_order
+                            if mod_name not in order:
+                                order.append(mod_name)
+                                config.load_order = order
                         
-                        self.refresh_mod_list()
-                        messagebox.showinfo("Import", f"Successfully imported '{mod_name}' with generated manifest.")
-                        self._log(f"Manual installation completed for '{mod_name}'")
+                            self._schedule_refresh()
+                            messagebox.showinfo("Import", f"Successfully imported '{mod_name}' with generated manifest.")
+                            self._log(f"Manual installation completed for '{mod_name}'")
+                        else:
+                            self._log("Manual installation cancelled by user")
                     else:
-                        self._log("Manual installation cancelled by user")
-                else:
-                    messagebox.showerror(
-                        "Import Error", 
-                        "No manifest.json found in the selected mod.\n\n"
-                        "This mod cannot be imported without a manifest.\n"
-                        "Please contact the mod author or use the enhanced version of FM Reloaded."
-                    )
-                return
+                        messagebox.showerror(
+                            "Import Error", 
+                            "No manifest.json found in the selected mod.\n\n"
+                            "This mod cannot be imported without a manifest.\n"
+                            "Please contact the mod author or use the enhanced version of FM Reloaded."
+                        )
+                    return
             
-            # Normal import with existing manifest
-            newname = install_mod_from_folder(src_folder, None, log=self._log)
-            order = config.load_order
-            if newname not in order:
-                order.append(newname)
-                config.load_order = order
-            self.refresh_mod_list()
-            messagebox.showinfo("Import", f"Imported '{newname}'.")
+                # Normal import with existing manifest; extracted archives are
+                # renamed into MODS_DIR, user folders are copied
+                newname = install_mod_from_folder(
+                    src_folder, None, log=self._log, move=src_folder != choice
+                )
+                self._conflict_cache = None
+                order = config.load_order
+                if newname not in order:
+                    order.append(newname)
+                    config.load_order = order
+                self._schedule_refresh()
+                messagebox.showinfo("Import", f"Imported '{newname}'.")
 
         except Exception as e:
             messagebox.showerror("Import Error", str(e))
             self._log(f"Import error: {e}")
-        finally:
-            if temp_dir:
-                # Safe cleanup of temporary directory
-                try:
-                    safe_delete_path(temp_dir, allow_symlink_delete=True)
-                except Exception:
-                    pass  # Cleanup failure is non-critical
+
+    # ---- Mod file jobs (worker thread) ----
+    def _mod_job_running(self) -> bool:
+        if self._io_busy:
+            self._log("Another mod operation is still running; please wait.")
+        return self._io_busy
+
+    def _set_mod_busy(self, busy: bool):
+        self._io_busy = busy
+        state = tk.DISABLED if busy else tk.NORMAL
+        for btn in self._mod_action_buttons:
+            try:
+                btn.configure(state=state)
+            except Exception:
+                pass
+
+    def _run_mod_job(self, job, on_done):
+        """Run job() on the IO worker; on_done(error or None) runs back on the Tk thread."""
+        self._set_mod_busy(True)
+
+        def finished(future):
+            err = future.exception()
+            if not self._closing:
+                self.after(0, self._finish_mod_job, on_done, err)
+
+        self._io_executor.submit(job).add_done_callback(finished)
+
+    def _finish_mod_job(self, on_done, err):
+        self._set_mod_busy(False)
+        on_done(err)
+
+    def _confirm_deletions(self, deletions: list, mod_name: str) -> bool:
+        """confirm_file_deletions() that may be called from the IO worker."""
+        if threading.current_thread() is threading.main_thread():
+            return confirm_file_deletions(deletions, mod_name)
+        answer = []
+        done = threading.Event()
+
+        def ask():
+            try:
+                answer.append(confirm_file_deletions(deletions, mod_name))
+            finally:
+                done.set()
+
+        self.after(0, ask)
+        # Poll so a closing window can't leave the worker waiting forever
+        while not done.wait(0.2):
+            if self._closing:
+                return False
+        return bool(answer and answer[0])
 
     def on_enable_selected(self):
         name = self.selected_mod_name()
         if not name:
             messagebox.showinfo("Mods", "Select a mod first.")
             return
+        if self._mod_job_running():
+            return
         enabled = config.enabled_mods
         if name in enabled:
             messagebox.showinfo("Mods", f"'{name}' is already enabled.")
@@ -1315,21 +2093,26 @@ class App(ttk.Window if TTKBOOTSTRAP_AVAILABLE else tk.Tk):
 
         # Apply the mod immediately
         self._log(f"Enabling '{name}'...")
-        try:
-            enable_mod(name, self._log)
-            self._log(f"Successfully enabled '{name}'.")
-            self.refresh_mod_list()
-        except Exception as e:
+
+        def done(err):
+            if err is None:
+                self._log(f"Successfully enabled '{name}'.")
+                self._schedule_refresh()
+                return
             # Rollback: remove from enabled list
             config.enabled_mods = [m for m in config.enabled_mods if m != name]
-            self._log(f"Failed to enable '{name}': {e}")
-            messagebox.showerror("Enable Failed", f"Failed to enable '{name}':\n\n{e}")
+            self._log(f"Failed to enable '{name}': {err}")
+            messagebox.showerror("Enable Failed", f"Failed to enable '{name}':\n\n{err}")
+
+        self._run_mod_job(lambda: enable_mod(name, self._log, self._confirm_deletions), done)
 
     def on_disable_selected(self):
         name = self.selected_mod_name()
         if not name:
             messagebox.showinfo("Mods", "Select a mod first.")
             return
+        if self._mod_job_running():
+            return
 
         if name not in config.enabled_mods:
             messagebox.showinfo("Mods", f"'{name}' is not enabled.")
@@ -1337,18 +2120,23 @@ class App(ttk.Window if TTKBOOTSTRAP_AVAILABLE else tk.Tk):
 
         # Disable the mod immediately
         self._log(f"Disabling '{name}'...")
-        try:
-            disable_mod(name, self._log)
-            # Remove from enabled list only after successful disable
-            config.enabled_mods = [m for m in config.enabled_mods if m != name]
-            self._log(f"Successfully disabled '{name}'.")
-            self.refresh_mod_list()
-        except Exception as e:
-            self._log(f"Failed to disable '{name}': {e}")
-            messagebox.showerror("Disable Failed", f"Failed to disable '{name}':\n\n{e}")
+
+        def done(err):
+            if err is None:
+                # Remove from enabled list only after successful disable
+                config.enabled_mods = [m for m in config.enabled_mods if m != name]
+                self._log(f"Successfully disabled '{name}'.")
+                self._schedule_refresh()
+                return
+            self._log(f"Failed to disable '{name}': {err}")
+            messagebox.showerror("Disable Failed", f"Failed to disable '{name}':\n\n{err}")
+
+        self._run_mod_job(lambda: disable_mod(name, self._log), done)
 
     def on_delete_selected(self):
         """Delete selected mod from computer."""
+        if self._mod_job_running():
+            return
         name = self.selected_mod_name()
         if not name:
             messagebox.showinfo("Delete", "Select a mod first.")
@@ -1373,57 +2161,75 @@ class App(ttk.Window if TTKBOOTSTRAP_AVAILABLE else tk.Tk):
             ):
                 return
 
-        try:
-            mod_dir = MODS_DIR / name
+        mod_dir = MODS_DIR / name
 
-            # SECURITY: Validate mod_dir is actually within MODS_DIR (prevents path traversal)
-            try:
-                mod_dir.resolve().relative_to(MODS_DIR.resolve())
-            except ValueError:
-                messagebox.showerror(
-                    "Security Error",
-                    f"Security validation failed: mod path escapes mods directory.\n\n"
-                    f"Mod directory: {mod_dir}\n"
-                    f"Mods root: {MODS_DIR}\n\n"
-                    f"This should never happen with a legitimate mod."
-                )
-                self._log(f"[SECURITY] Blocked deletion - path escape attempt: {mod_dir}")
-                return
-            if mod_dir.exists():
-                # Always try to disable the mod to ensure files are removed from game directories
-                # This handles cases where the mod was manually installed or the enabled state is incorrect
-                disable_successful = False
-                should_cleanup_backups = False
+        # SECURITY: Validate mod_dir is actually within MODS_DIR (prevents path traversal)
+        try:
+            mod_dir.resolve().relative_to(MODS_DIR.resolve())
+        except ValueError:
+            messagebox.showerror(
+                "Security Error",
+                f"Security validation failed: mod path escapes mods directory.\n\n"
+                f"Mod directory: {mod_dir}\n"
+                f"Mods root: {MODS_DIR}\n\n"
+                f"This should never happen with a legitimate mod."
+            )
+            self._log(f"[SECURITY] Blocked deletion - path escape attempt: {mod_dir}")
+            return
+        if not mod_dir.exists():
+            messagebox.showerror("Delete Error", f"Mod '{name}' not found in {MODS_DIR}")
+            return
+        self._delete_mod(name)
+
+    def _delete_mod(self, name: str):
+        """
+        Remove a mod's installed files, drop it from the config and delete its folder.
+
+        The disable pass and the folder delete run on the IO worker; the
+        prompts and the config update happen back on the Tk thread.
+        """
+        mod_dir = MODS_DIR / name
+        was_enabled = name in config.enabled_mods
+        # Always try to disable the mod to ensure files are removed from game directories
+        # This handles cases where the mod was manually installed or the enabled state is incorrect
+        if was_enabled:
+            self._log(f"Auto-disabling '{name}' before deletion...")
+        else:
+            self._log(f"Cleaning up any installed files for '{name}'...")
 
+        def remove_folder(cleanup_backups: bool):
+            # Clean up .bck backups only if the disable went through
+            if cleanup_backups:
                 try:
-                    if name in config.enabled_mods:
-                        self._log(f"Auto-disabling '{name}' before deletion...")
-                    else:
-                        self._log(f"Cleaning up any installed files for '{name}'...")
-
-                    disable_mod(name, self._log)
-                    self._log(f"Successfully cleaned up files for '{name}'.")
-                    disable_successful = True
-                    should_cleanup_backups = True
+                    cleanup_mod_backups(name, self._log)
                 except Exception as e:
-                    self._log(f"Error during cleanup: {e}")
-                    if name in config.enabled_mods:
-                        # Only prompt if mod was supposedly enabled
-                        if not messagebox.askyesno(
-                            "Cleanup Failed",
-                            f"Failed to clean up '{name}' files before deletion:\n\n{e}\n\nContinue with deletion anyway?"
-                        ):
-                            return
-                    # User chose to continue or mod wasn't enabled - DON'T cleanup backups if there were errors
-                    should_cleanup_backups = disable_successful
-
-                # Clean up .bck backups only if safe to do so
-                if should_cleanup_backups:
-                    try:
-                        cleanup_mod_backups(name, self._log)
-                    except Exception as e:
-                        self._log(f"Warning: Failed to clean up backups: {e}")
+                    self._log(f"Warning: Failed to clean up backups: {e}")
+            safe_delete_path(mod_dir, allow_symlink_delete=False)
+            invalidate_manifest(mod_dir)
+            clear_applied_state(name)
+
+        def deleted(err):
+            if err is not None:
+                messagebox.showerror("Delete Error", f"Failed to delete mod: {err}")
+                self._log(f"Delete error for '{name}': {err}")
+                return
+            self._log(f"Deleted mod '{name}' from {MODS_DIR}")
+            self._schedule_refresh()
+            messagebox.showinfo("Delete", f"Mod '{name}' has been permanently deleted.")
+
+        def disabled(err):
+            if err is None:
+                self._log(f"Successfully cleaned up files for '{name}'.")
+            else:
+                self._log(f"Error during cleanup: {err}")
+                # Only prompt if mod was supposedly enabled
+                if was_enabled and not messagebox.askyesno(
+                    "Cleanup Failed",
+                    f"Failed to clean up '{name}' files before deletion:\n\n{err}\n\nContinue with deletion anyway?"
+                ):
+                    return
 
+            with config.transaction():
                 # Remove from enabled mods list
                 enabled = config.enabled_mods
                 if name in enabled:
@@ -1435,64 +2241,87 @@ class App(ttk.Window if TTKBOOTSTRAP_AVAILABLE else tk.Tk):
                 if name in order:
                     order.remove(name)
                     config.load_order = order
+            self._conflict_cache = None
 
-                # Delete mod folder
-                safe_delete_path(mod_dir, allow_symlink_delete=False)
-                self._log(f"Deleted mod '{name}' from {MODS_DIR}")
-                self.refresh_mod_list()
-                messagebox.showinfo("Delete", f"Mod '{name}' has been permanently deleted.")
-            else:
-                messagebox.showerror("Delete Error", f"Mod '{name}' not found in {MODS_DIR}")
-        except Exception as e:
-            messagebox.showerror("Delete Error", f"Failed to delete mod: {e}")
-            self._log(f"Delete error for '{name}': {e}")
+            self._run_mod_job(lambda: remove_folder(err is None), deleted)
+
+        self._run_mod_job(lambda: disable_mod(name, self._log), disabled)
+
+    def _move_in_order(self, name: str, step: int) -> bool:
+        """Swap a mod with its neighbour in the live load order; the config write is deferred."""
+        order = config.load_order
+        if order is not self._order_list or len(order) != len(self._order_idx):
+            self._order_list = order
+            self._order_idx = {n: i for i, n in enumerate(order)}
+        idx = self._order_idx
+        i = idx.get(name)
+        if i is None or order[i] != name:
+            idx = self._order_idx = {n: k for k, n in enumerate(order)}
+            i = idx.get(name)
+        if i is None:
+            order.append(name)
+            i = idx[name] = len(order) - 1
+            config.load_order = order
+        j = i + step
+        if not 0 <= j < len(order):
+            return False
+        order[i], order[j] = order[j], order[i]
+        idx[order[i]] = i
+        idx[order[j]] = j
+        if self._order_persist_pending:
+            self.after_cancel(self._order_persist_pending)
+        self._order_persist_pending = self.after(200, self._persist_order)
+        return True
+
+    def _persist_order(self):
+        """Write the in-memory load order (already swapped in config's cache) to disk."""
+        self._order_persist_pending = None
+        config.save()
 
     def on_move_up(self):
         name = self.selected_mod_name()
         if not name:
             return
-        order = config.load_order
-        if name not in order:
-            order.append(name)
-        i = order.index(name)
-        if i > 0:
-            order[i - 1], order[i] = order[i], order[i - 1]
-            config.load_order = order
+        if self._move_in_order(name, -1):
             self._log(f"Moved up: {name}")
-            self.refresh_mod_list()
+            self._schedule_refresh()
 
     def on_move_down(self):
         name = self.selected_mod_name()
         if not name:
             return
-        order = config.load_order
-        if name not in order:
-            order.append(name)
-            i = order.index(name)
-        if i < len(order) - 1:
-            order[i + 1], order[i] = order[i], order[i + 1]
-            config.load_order = order
+        if self._move_in_order(name, 1):
             self._log(f"Moved down: {name}")
-            self.refresh_mod_list()
+            self._schedule_refresh()
 
     def on_apply_order(self):
-        try:
-            apply_enabled_mods_in_order(self._log)
+        if self._mod_job_running():
+            return
+
+        def done(err):
+            self._conflict_cache = None
+            if err is not None:
+                messagebox.showerror("Apply Order Error", str(err))
+                return
             messagebox.showinfo(
                 "Apply Order",
                 "All enabled mods applied in load order.\n(Last-write-wins).",
             )
-        except Exception as e:
-            messagebox.showerror("Apply Order Error", str(e))
+
+        self._run_mod_job(
+            lambda: apply_enabled_mods_in_order(self._log, self._confirm_deletions), done
+        )
 
     def on_conflicts(self):
-        enabled = config.enabled_mods
-        conflicts, manifests = find_conflicts(enabled)
+        self._find_conflicts_async(config.enabled_mods, self._show_conflicts)
+
+    def _show_conflicts(self, conflicts, manifests):
         if not conflicts:
             messagebox.showinfo("Conflicts", "No file overlaps among enabled mods.")
             return
 
         order = config.load_order
+        order_idx = {n: i for i, n in enumerate(order)}
         win = tk.Toplevel(self)
         win.title("Conflict Manager — FM26 Mod Manager")
         win.geometry("760x560")
@@ -1506,51 +2335,57 @@ class App(ttk.Window if TTKBOOTSTRAP_AVAILABLE else tk.Tk):
         sb.pack(side=tk.RIGHT, fill=tk.Y)
         text.configure(yscrollcommand=sb.set)
 
-        text.insert(
-            tk.END, "Detected conflicts where multiple mods write to same file(s):\n\n"
-        )
+        # Format each mod's description once, not once per conflicting file
+        unique_mods = sorted({mm for ms in conflicts.values() for mm in ms})
+        details_by_mod = {
+            m: f"{m} ({manifests[m].get('type','misc')}) by {manifests[m].get('author','?')}"
+            for m in unique_mods
+        }
+
+        # Build the whole report first and hand it to Tk in a single insert
+        chunks = ["Detected conflicts where multiple mods write to same file(s):\n\n"]
+        # Many files conflict among the same few mods; format each mod set once
+        details_cache: dict[tuple, str] = {}
         for rel, mods in conflicts.items():
-            ranks = [(order.index(m) if m in order else -1, m) for m in mods]
-            ranks.sort()
-            winner = ranks[-1][1] if ranks else mods[-1]
-            details = []
-            for m in mods:
-                mf = manifests[m]
-                details.append(
-                    f"{m} ({mf.get('type','misc')}) by {mf.get('author','?')}"
+            key = tuple(mods)
+            tail = details_cache.get(key)
+            if tail is None:
+                ranks = sorted((order_idx.get(m, -1), m) for m in mods)
+                winner = ranks[-1][1] if ranks else mods[-1]
+                details = ", ".join(details_by_mod[m] for m in mods)
+                tail = details_cache[key] = (
+                    f"\n  Mods: {details}\n  Winner by load order (last wins): {winner}\n\n"
                 )
-            text.insert(
-                tk.END,
-                f"{rel}\n  Mods: {', '.join(details)}\n  Winner by load order (last wins): {winner}\n\n",
-            )
+            chunks.append(rel + tail)
+        text.insert(tk.END, "".join(chunks))
         text.config(state="disabled")
 
         ttk.Label(win, text="Select mods to disable:").pack(
             anchor="w", padx=8, pady=(8, 0)
         )
 
-        # Checkbox area
+        # Checkbox area; widget state is read back directly, no Tcl variable per mod
         mods_to_disable = {}
         box_frame = ttk.Frame(win)
         box_frame.pack(fill=tk.BOTH, expand=True, padx=8, pady=4)
-        unique_mods = sorted(set([mm for ms in conflicts.values() for mm in ms]))
         for m in unique_mods:
-            var = tk.BooleanVar()
-            mods_to_disable[m] = var
-            ttk.Checkbutton(box_frame, text=m, variable=var).pack(anchor="w")
+            cb = ttk.Checkbutton(box_frame, text=m)
+            cb.state(["!alternate", "!selected"])
+            cb.pack(anchor="w")
+            mods_to_disable[m] = cb
 
         def apply_disables():
             changed = []
             enabled_now = config.enabled_mods
-            for mod_name, var in mods_to_disable.items():
-                if var.get() and mod_name in enabled_now:
+            for mod_name, cb in mods_to_disable.items():
+                if cb.instate(["selected"]) and mod_name in enabled_now:
                     enabled_now.remove(mod_name)
                     changed.append(mod_name)
             if changed:
                 config.enabled_mods = enabled_now
                 self._log(f"Disabled mods due to conflicts: {', '.join(changed)}")
                 messagebox.showinfo("Conflicts", f"Disabled: {', '.join(changed)}")
-                self.refresh_mod_list()
+                self._schedule_refresh()
             win.destroy()
 
         bframe = ttk.Frame(win)
@@ -1561,9 +2396,9 @@ class App(ttk.Window if TTKBOOTSTRAP_AVAILABLE else tk.Tk):
         self._log(f"Opened conflict manager with {len(conflicts)} overlapping file path(s).")
 
     def on_rollback(self):
-        rps = sorted(
-            [p.name for p in RESTORE_POINTS_DIR.iterdir() if p.is_dir()], reverse=True
-        )[:50]
+        # Timestamped names sort chronologically; keep the newest 50 without a full sort
+        with os.scandir(RESTORE_POINTS_DIR) as it:
+            rps = heapq.nlargest(50, (e.name for e in it if e.is_dir()))
         if not rps:
             messagebox.showinfo("Rollback", "No restore points found.")
             return
@@ -1572,25 +2407,29 @@ class App(ttk.Window if TTKBOOTSTRAP_AVAILABLE else tk.Tk):
         win.title("Choose Restore Point")
         win.geometry("420x420")
         lb = tk.Listbox(win, height=min(16, len(rps)))
-        for rp in rps:
-            lb.insert(tk.END, rp)
+        lb.insert(tk.END, *rps)
         lb.pack(fill=tk.BOTH, expand=True, padx=8, pady=8)
 
         def do_rb():
             sel = lb.curselection()
-            if not sel:
+            if not sel or self._mod_job_running():
                 return
             rp = rps[sel[0]]
-            try:
-                base = config.target_path
-                if not base or not base.exists():
-                    messagebox.showerror("Rollback Error", "No valid FM26 target set.")
+            base = config.target_path
+            if not base or not base.exists():
+                messagebox.showerror("Rollback Error", "No valid FM26 target set.")
+                return
+
+            def done(err):
+                if err is not None:
+                    messagebox.showerror("Rollback Error", str(err))
                     return
-                rollback_to_restore_point(rp, base, self._log)
                 messagebox.showinfo("Rollback", f"Rolled back to {rp}.")
-                win.destroy()
-            except Exception as e:
-                messagebox.showerror("Rollback Error", str(e))
+                if win.winfo_exists():
+                    win.destroy()
+
+            # Restores write game files: same worker (and busy lock) as apply
+            self._run_mod_job(lambda: rollback_to_restore_point(rp, base, self._log), done)
 
         ttk.Button(win, text="Rollback to selected", command=do_rb).pack(pady=(0, 8))
 
@@ -1604,9 +2443,6 @@ class App(ttk.Window if TTKBOOTSTRAP_AVAILABLE else tk.Tk):
     def on_open_mods(self):
         safe_open_path(MODS_DIR)
 
-    def on_open_logs_folder(self):
-        safe_open_path(LOGS_DIR)
-
     def on_show_manifest_help(self):
         txt = (
             "Every mod must ship a manifest.json alongside its content.\n\n"
@@ -1664,17 +2500,7 @@ class App(ttk.Window if TTKBOOTSTRAP_AVAILABLE else tk.Tk):
 
     def on_about(self):
         """Show about dialog with version information."""
-        about_text = (
-            f"FM Reloaded Mod Manager\n"
-            f"Version {VERSION}\n\n"
-            f"A comprehensive mod manager for Football Manager 26\n"
-            f"featuring BepInEx integration, mod store access,\n"
-            f"and streamlined mod deployment.\n\n"
-            f"GitHub: https://github.com/jo13310/FM_Reloaded\n"
-            f"Discord: Join our community for support!\n\n"
-            f"© 2025 FM Reloaded Project"
-        )
-        messagebox.showinfo("About FM Reloaded", about_text)
+        messagebox.showinfo("About FM Reloaded", ABOUT_TEXT)
 
     def on_report_bug(self):
         """Open bug report page."""
@@ -1772,6 +2598,7 @@ class App(ttk.Window if TTKBOOTSTRAP_AVAILABLE else tk.Tk):
             messagebox.showinfo("Homepage", "No homepage URL provided for this mod.")
             return
         try:
+            import webbrowser
             webbrowser.open(url)
         except Exception as exc:
             messagebox.showerror("Homepage", f"Failed to open homepage:\n{exc}")
@@ -1792,23 +2619,85 @@ class App(ttk.Window if TTKBOOTSTRAP_AVAILABLE else tk.Tk):
         if not ENHANCED_FEATURES or not self.mod_store_api:
             return
 
-        try:
-            for i in self.store_tree.get_children():
-                self.store_tree.delete(i)
+        def worker():
+            try:
+                mods = self.mod_store_api.get_all_mods()
+            except Exception as e:
+                err = str(e)
+                self.after(0, lambda: self._log(f"Error loading store: {err}"))
+                self.after(0, lambda: messagebox.showerror("Store Error", f"Failed to load mod store:\n{err}"))
+                return
+            self.after(0, lambda: self._show_store_mods(mods, f"Loaded {len(mods)} mods from store.", index=True))
+
+        self._bg.submit(worker)
+
+    def _show_store_mods(self, mods, message: str, index: bool = False):
+        """Tk-thread half of the store loaders: index (full list only), populate, log."""
+        if index:
+            self._store_by_name = {str(m.get("name", "")).lower(): m for m in mods}
+            self._store_details_cache.clear()
+        self._populate_store_tree(mods)
+        self._log(message)
+
+    def _store_mod(self, mod_name) -> Optional[dict]:
+        """Look up a store entry by (case-insensitive) name, via the index built on refresh."""
+        mod_data = self._store_by_name.get(str(mod_name).lower())
+        if mod_data is None:
+            mod_data = self.mod_store_api.get_mod_by_name(str(mod_name))
+        return mod_data
+
+    def _populate_store_tree(self, mods):
+        """Show mods in the store list, touching only rows that changed."""
+        tree = self.store_tree
+        old_rows = self._store_rows
+        new_rows = {}
+        counts = {}
+        count_of = counts.get
+        # The five store columns are fixed, so the row tuple is built inline
+        # with locals rather than through a per-column helper
+        for mod in mods:
+            get = mod.get
+            name = get("name", "?")
+            # Occurrence keeps duplicate names (e.g. forks) as separate rows
+            n = counts[name] = count_of(name, 0) + 1
+            new_rows[(name, n)] = (
+                name,
+                get("version", "?"),
+                get("type", "?"),
+                get("author", "?"),
+                get("downloads", "—"),
+            )
 
-            mods = self.mod_store_api.get_all_mods()
-            for mod in mods:
-                self.store_tree.insert("", tk.END, values=(
-                    mod.get("name", "?"),
-                    mod.get("version", "?"),
-                    mod.get("type", "?"),
-                    mod.get("author", "?"),
-                    mod.get("downloads", "—")
-                ))
-            self._log(f"Loaded {len(mods)} mods from store.")
-        except Exception as e:
-            self._log(f"Error loading store: {e}")
-            messagebox.showerror("Store Error", f"Failed to load mod store:\n{e}")
+        gone = [iid for key, (iid, _) in old_rows.items() if key not in new_rows]
+        if gone:
+            tree.delete(*gone)
+
+        # Detach the scrollbar while populating so Tk doesn't re-layout per row
+        yscroll = tree.cget("yscrollcommand")
+        tree.configure(yscrollcommand="")
+        tree_w = tree._w
+        call = tree.tk.call
+        shown = {}
+        order = []
+        add_iid = order.append
+        old_row = old_rows.get
+        try:
+            for key, values in new_rows.items():
+                old = old_row(key)
+                if old is None:
+                    iid = str(call(tree_w, "insert", "", "end", "-values", values))
+                else:
+                    iid = old[0]
+                    if old[1] != values:
+                        call(tree_w, "item", iid, "-values", values)
+                shown[key] = (iid, values)
+                add_iid(iid)
+            # One reorder call, only when search/sort order actually moved rows
+            if list(tree.get_children()) != order:
+                tree.set_children("", *order)
+        finally:
+            tree.configure(yscrollcommand=yscroll)
+        self._store_rows = shown
 
     def on_store_search(self):
         """Search mods in the store."""
@@ -1816,22 +2705,17 @@ class App(ttk.Window if TTKBOOTSTRAP_AVAILABLE else tk.Tk):
             return
 
         query = self.store_search_var.get()
-        try:
-            for i in self.store_tree.get_children():
-                self.store_tree.delete(i)
-
-            mods = self.mod_store_api.search_mods(query=query)
-            for mod in mods:
-                self.store_tree.insert("", tk.END, values=(
-                    mod.get("name", "?"),
-                    mod.get("version", "?"),
-                    mod.get("type", "?"),
-                    mod.get("author", "?"),
-                    mod.get("downloads", "—")
-                ))
-            self._log(f"Found {len(mods)} mods matching '{query}'")
-        except Exception as e:
-            messagebox.showerror("Search Error", str(e))
+
+        def worker():
+            try:
+                mods = self.mod_store_api.search_mods(query=query)
+            except Exception as e:
+                err = str(e)
+                self.after(0, lambda: messagebox.showerror("Search Error", err))
+                return
+            self.after(0, lambda: self._show_store_mods(mods, f"Found {len(mods)} mods matching '{query}'"))
+
+        self._bg.submit(worker)
 
     def on_store_refresh(self):
         """Force refresh store cache."""
@@ -1839,15 +2723,18 @@ class App(ttk.Window if TTKBOOTSTRAP_AVAILABLE else tk.Tk):
             return
 
         self._log("Refreshing store index...")
-        threading.Thread(target=self._refresh_store_async, daemon=True).start()
+        self._bg.submit(self._refresh_store_async)
 
     def _refresh_store_async(self):
         """Async store refresh."""
         try:
             self.mod_store_api.fetch_store_index(force_refresh=True)
-            self.after(0, self.refresh_store_mods)
+            mods = self.mod_store_api.get_all_mods()
         except Exception as e:
-            self.after(0, lambda: messagebox.showerror("Refresh Error", str(e)))
+            err = str(e)
+            self.after(0, lambda: messagebox.showerror("Refresh Error", err))
+            return
+        self.after(0, lambda: self._show_store_mods(mods, f"Loaded {len(mods)} mods from store.", index=True))
 
     def on_store_install(self):
         """Install selected mod from store."""
@@ -1857,7 +2744,7 @@ class App(ttk.Window if TTKBOOTSTRAP_AVAILABLE else tk.Tk):
             return
 
         mod_name = self.store_tree.item(sel[0])["values"][0]
-        mod_data = self.mod_store_api.get_mod_by_name(mod_name)
+        mod_data = self._store_mod(mod_name)
 
         if not mod_data:
             messagebox.showerror("Install Error", f"Mod '{mod_name}' not found in store.")
@@ -1869,14 +2756,29 @@ class App(ttk.Window if TTKBOOTSTRAP_AVAILABLE else tk.Tk):
             return
 
         self._log(f"Downloading {mod_name}...")
-        threading.Thread(
-            target=self._download_and_install,
-            args=(mod_data,),
-            daemon=True,
-        ).start()
+        self._install_pool.submit(self._download_and_install, mod_data)
+
+    @staticmethod
+    def _store_zip_members(archive):
+        """
+        Pick the entries of a store ZIP to extract.
+
+        Returns (members, manifest_name): every entry under the folder holding
+        manifest.json (see _zip_manifest_entry), including assets the manifest
+        doesn't list. Both are None when there is no manifest, meaning extract
+        everything.
+        """
+        with zipfile.ZipFile(archive) as z:
+            names = z.namelist()
+        manifest_name = _zip_manifest_entry(names)
+        if manifest_name is None:
+            return None, None
+        prefix = manifest_name[: -len("manifest.json")]
+        return [n for n in names if n.startswith(prefix)], manifest_name
 
     def _download_and_install(self, mod_data):
         """Download and install mod in background."""
+        cleanup = contextlib.ExitStack()
         try:
             mod_name = mod_data.get("name", "Unknown Mod")
             url = mod_data.get("download_url")
@@ -1884,20 +2786,29 @@ class App(ttk.Window if TTKBOOTSTRAP_AVAILABLE else tk.Tk):
             if not url:
                 raise ValueError(f"No download URL available for '{mod_name}'")
 
-            temp_dir = Path(tempfile.mkdtemp(prefix="fm_store_"))
-            downloaded = self.mod_store_api.download_mod(url, temp_dir)
+            # Download into memory (spills to disk only for very large archives)
+            filename, payload = self.mod_store_api.download_mod_spooled(url)
+            cleanup.callback(payload.close)
 
-            self.after(0, lambda: self._log(f"Downloaded {downloaded.name}, installing..."))
+            self.after(0, lambda: self._log(f"Downloaded {filename}, installing..."))
 
             # Import the downloaded mod
             src_folder: Optional[Path] = None
-            if downloaded.suffix.lower() == ".zip":
-                temp_extract = Path(tempfile.mkdtemp(prefix="fm_extract_"))
-                safe_extract_zip(downloaded, temp_extract)
-
-                # Find manifest
-                candidates = [d for d in temp_extract.iterdir() if d.is_dir() and (d / "manifest.json").exists()]
-                src_folder = candidates[0] if candidates else temp_extract
+            if filename.lower().endswith(".zip"):
+                temp_extract = Path(
+                    cleanup.enter_context(tempfile.TemporaryDirectory(
+                        prefix="fm_extract_", dir=STAGING_DIR, ignore_cleanup_errors=True
+                    ))
+                )
+                # Extract only the mod's folder (the one holding manifest.json)
+                members, manifest_name = self._store_zip_members(payload)
+                safe_extract_zip(payload, temp_extract, members=members)
+                if manifest_name is None:
+                    src_folder = temp_extract
+                else:
+                    _normalize_manifest_name(temp_extract / manifest_name)
+                    prefix = manifest_name[: -len("manifest.json")]
+                    src_folder = temp_extract / prefix if prefix else temp_extract
             else:
                 if not manifest_url:
                     raise ValueError(
@@ -1926,10 +2837,16 @@ class App(ttk.Window if TTKBOOTSTRAP_AVAILABLE else tk.Tk):
 
                     self._log(f"Converted {len(cleanup_entries)} cleanup groups to delete operations")
 
-                package_dir = Path(tempfile.mkdtemp(prefix="fm_package_"))
+                package_dir = Path(
+                    cleanup.enter_context(tempfile.TemporaryDirectory(
+                        prefix="fm_package_", dir=STAGING_DIR, ignore_cleanup_errors=True
+                    ))
+                )
                 manifest_path = package_dir / "manifest.json"
                 manifest_path.parent.mkdir(parents=True, exist_ok=True)
-                manifest_path.write_text(json.dumps(manifest_data, indent=2), encoding="utf-8")
+                # Stream straight to the file instead of building the string first
+                with manifest_path.open("w", encoding="utf-8") as f:
+                    json.dump(manifest_data, f, indent=2)
 
                 files = manifest_data.get("files", [])
                 if not files:
@@ -1939,28 +2856,39 @@ class App(ttk.Window if TTKBOOTSTRAP_AVAILABLE else tk.Tk):
                 if len(files) == 1:
                     matched_entry = files[0]
                 else:
+                    # Basename -> first entry with that basename
+                    by_name = {}
                     for entry in files:
                         source_rel = entry.get("source")
-                        if source_rel and Path(source_rel).name.lower() == downloaded.name.lower():
-                            matched_entry = entry
-                            break
+                        if source_rel:
+                            by_name.setdefault(Path(source_rel).name.lower(), entry)
+                    matched_entry = by_name.get(filename.lower())
                 if not matched_entry or not matched_entry.get("source"):
                     raise ValueError(
-                        f"Unable to map downloaded asset '{downloaded.name}' to manifest files for '{mod_name}'."
+                        f"Unable to map downloaded asset '{filename}' to manifest files for '{mod_name}'."
                     )
 
                 dest_path = package_dir / matched_entry["source"]
                 dest_path.parent.mkdir(parents=True, exist_ok=True)
-                shutil.copy2(downloaded, dest_path)
+                with open(dest_path, "wb") as out:
+                    copy_stream(payload, out)
                 src_folder = package_dir
 
-            newname = install_mod_from_folder(src_folder, None, log=self._log)
-            order = config.load_order
-            if newname not in order:
-                order.append(newname)
-                config.load_order = order
+            # Downloads run in parallel; moving into MODS_DIR and the config
+            # update are queued on the IO worker, so they run one at a time and
+            # never while an apply/enable/delete is reading the mods folder
+            def finish_install():
+                name = install_mod_from_folder(src_folder, None, log=self._log, move=True)
+                order = config.load_order
+                if name not in order:
+                    order.append(name)
+                    config.load_order = order
+                return name
 
-            self.after(0, lambda: self.refresh_mod_list())
+            newname = self._io_executor.submit(finish_install).result()
+            self._conflict_cache = None
+
+            self.after(0, self._schedule_refresh)
             self.after(0, lambda: messagebox.showinfo("Install", f"Successfully installed '{newname}'!"))
             self.after(0, lambda: self._log(f"Successfully installed {newname} from store."))
 
@@ -1974,57 +2902,70 @@ class App(ttk.Window if TTKBOOTSTRAP_AVAILABLE else tk.Tk):
                     # Fail silently - download tracking is non-critical
                     pass
 
-            threading.Thread(target=track_download, daemon=True).start()
+            self._bg.submit(track_download)
 
         except Exception as e:
             # Capture exception message immediately to avoid lambda closure bug
             error_msg = str(e)
             self.after(0, lambda: self._log(f"Install failed: {error_msg}"))
             self.after(0, lambda: messagebox.showerror("Install Failed", f"Failed to install mod:\n\n{error_msg}"))
+        finally:
+            cleanup.close()
+
+    @staticmethod
+    def _format_store_details(mod_data: dict) -> str:
+        """Render the details pane text for one store entry."""
+        download = mod_data.get("download", {}) if isinstance(mod_data.get("download"), dict) else {}
+        asset = download.get("asset")
+        channel = (
+            "latest"
+            if download.get("latest")
+            else download.get("tag")
+            or download.get("tag_prefix", "v")
+        )
+        asset_line = f"Asset: {asset} (channel: {channel})\n" if asset else ""
+        manifest_line = f"Manifest: {mod_data.get('manifest_url')}\n" if mod_data.get("manifest_url") else ""
+        install_line = (
+            f"\nInstall Notes:\n{mod_data.get('install_notes')}\n"
+            if mod_data.get("install_notes")
+            else ""
+        )
+        return (
+            f"Name: {mod_data.get('name', '?')}\n"
+            f"Version: {mod_data.get('version', '?')}\n"
+            f"Type: {mod_data.get('type', '?')}\n"
+            f"Author: {mod_data.get('author', '?')}\n"
+            f"Downloads: {mod_data.get('downloads', '-')}\n"
+            f"{asset_line}"
+            f"{manifest_line}\n"
+            f"Description:\n{mod_data.get('description', 'No description available.')}\n\n"
+            f"Homepage: {mod_data.get('homepage', '-')}\n"
+            f"{install_line}"
+        )
 
     def on_store_details(self):
         """Show details for selected store mod."""
+        self._store_details_pending = None
         sel = self.store_tree.selection()
         if not sel:
             return
 
-        mod_name = self.store_tree.item(sel[0])["values"][0]
-        mod_data = self.mod_store_api.get_mod_by_name(mod_name)
-
-        if mod_data:
-            self.store_details_text.delete("1.0", tk.END)
-            download = mod_data.get("download", {}) if isinstance(mod_data.get("download"), dict) else {}
-            asset = download.get("asset")
-            channel = (
-                "latest"
-                if download.get("latest")
-                else download.get("tag")
-                or download.get("tag_prefix", "v")
-            )
-            asset_line = f"Asset: {asset} (channel: {channel})\n" if asset else ""
-            manifest_line = f"Manifest: {mod_data.get('manifest_url')}\n" if mod_data.get("manifest_url") else ""
-            install_line = (
-                f"\nInstall Notes:\n{mod_data.get('install_notes')}\n"
-                if mod_data.get("install_notes")
-                else ""
-            )
-            text = (
-                f"Name: {mod_data.get('name', '?')}\n"
-                f"Version: {mod_data.get('version', '?')}\n"
-                f"Type: {mod_data.get('type', '?')}\n"
-                f"Author: {mod_data.get('author', '?')}\n"
-                f"Downloads: {mod_data.get('downloads', '-')}\n"
-                f"{asset_line}"
-                f"{manifest_line}\n"
-                f"Description:\n{mod_data.get('description', 'No description available.')}\n\n"
-                f"Homepage: {mod_data.get('homepage', '-')}\n"
-                f"{install_line}"
-            )
-            self.store_details_text.insert(tk.END, text)
+        mod_name = str(self.store_tree.item(sel[0])["values"][0])
+        text = self._store_details_cache.get(mod_name)
+        if text is None:
+            mod_data = self._store_mod(mod_name)
+            if not mod_data:
+                return
+            text = self._store_details_cache[mod_name] = self._format_store_details(mod_data)
+
+        self.store_details_text.delete("1.0", tk.END)
+        self.store_details_text.insert(tk.END, text)
 
     def on_store_select_row(self, _event):
-            """Handle store mod selection."""
-            self.on_store_details()
+        """Handle store mod selection (debounced so key-repeat renders once)."""
+        if self._store_details_pending:
+            self.after_cancel(self._store_details_pending)
+        self._store_details_pending = self.after(80, self.on_store_details)
 
     def on_bepinex_install(self):
         """Install BepInEx."""
@@ -2032,6 +2973,10 @@ class App(ttk.Window if TTKBOOTSTRAP_AVAILABLE else tk.Tk):
             return
 
         archive_path = Path(__file__).parent.parent / "BepInEx_Patched_Win_af0cba7.rar"
+        # A repacked .zip next to the RAR extracts in parallel without WinRAR
+        zip_path = archive_path.with_suffix(".zip")
+        if zip_path.exists():
+            archive_path = zip_path
         if not archive_path.exists():
             messagebox.showerror("Install Error", f"BepInEx archive not found:\n{archive_path}")
             return
@@ -2095,28 +3040,39 @@ class App(ttk.Window if TTKBOOTSTRAP_AVAILABLE else tk.Tk):
             self.bepinex_status_var.set("BepInEx features not available")
             return
 
-        try:
-            if self.bepinex_manager.is_installed():
-                version = self.bepinex_manager.get_version()
-                self.bepinex_status_var.set(f"✓ BepInEx {version} installed")
+        manager = self.bepinex_manager
 
-                # Update console checkbox to reflect current config
-                console_enabled = self.bepinex_manager.is_console_enabled()
-                self.bepinex_console_var.set(console_enabled)
-            else:
-                self.bepinex_status_var.set("✗ BepInEx not installed")
-                self.bepinex_console_var.set(False)
-        except Exception as e:
-            self.bepinex_status_var.set(f"Error checking status: {e}")
-            self._log(f"Error refreshing BepInEx status: {e}")
+        def apply(status: str, console_enabled: bool):
+            self.bepinex_status_var.set(status)
+            self.bepinex_console_var.set(console_enabled)
+
+        def worker():
+            # File probing runs here; only the variable updates go back to Tk
+            try:
+                if manager.is_installed():
+                    version = manager.get_version()
+                    # Update console checkbox to reflect current config
+                    console_enabled = manager.is_console_enabled()
+                    self.after(0, apply, f"✓ BepInEx {version} installed", console_enabled)
+                else:
+                    self.after(0, apply, "✗ BepInEx not installed", False)
+            except Exception as e:
+                err = str(e)
+                self.after(0, lambda: self.bepinex_status_var.set(f"Error checking status: {err}"))
+                self.after(0, lambda: self._log(f"Error refreshing BepInEx status: {err}"))
+
+        self._bg.submit(worker)
 
     # ---- Enhanced feature handlers ----
     def _auto_check_updates(self):
         """Silently check for updates on startup."""
+        self._auto_check_id = None
         def check_async():
             try:
-                updater = AppUpdater(VERSION, "jo13310/FM_Reloaded")
-                has_update, release_info = updater.check_for_updates()
+                from app_updater import AppUpdater
+                updater = AppUpdater(VERSION, "jo13310/FM_Reloaded", cache_file=UPDATE_CHECK_CACHE)
+                # A check from the last hour is reused, so restarts stay offline
+                has_update, release_info = updater.check_for_updates(use_cache=True)
 
                 if has_update:
                     self.after(0, lambda: self._show_update_dialog(release_info))
@@ -2124,9 +3080,10 @@ class App(ttk.Window if TTKBOOTSTRAP_AVAILABLE else tk.Tk):
 
             except Exception as e:
                 # Silent failure on auto-check
-                self._log(f"Auto-update check failed: {e}")
+                err = str(e)
+                self.after(0, lambda: self._log(f"Auto-update check failed: {err}"))
 
-        threading.Thread(target=check_async, daemon=True).start()
+        self._bg.submit(check_async)
 
     def on_check_updates(self):
         """Check for app updates."""
@@ -2137,7 +3094,8 @@ class App(ttk.Window if TTKBOOTSTRAP_AVAILABLE else tk.Tk):
 
         def check_async():
             try:
-                updater = AppUpdater(VERSION, "jo13310/FM_Reloaded")
+                from app_updater import AppUpdater
+                updater = AppUpdater(VERSION, "jo13310/FM_Reloaded", cache_file=UPDATE_CHECK_CACHE)
                 has_update, release_info = updater.check_for_updates()
 
                 if has_update:
@@ -2146,9 +3104,10 @@ class App(ttk.Window if TTKBOOTSTRAP_AVAILABLE else tk.Tk):
                     self.after(0, lambda: messagebox.showinfo("Check for Updates", f"You are running the latest version ({VERSION})."))
 
             except Exception as e:
-                self.after(0, lambda: messagebox.showerror("Update Check Failed", f"Failed to check for updates:\n{e}"))
+                err = str(e)
+                self.after(0, lambda: messagebox.showerror("Update Check Failed", f"Failed to check for updates:\n{err}"))
 
-        threading.Thread(target=check_async, daemon=True).start()
+        self._bg.submit(check_async)
 
     def _show_update_dialog(self, release_info):
         """Show update available dialog."""
@@ -2163,8 +3122,20 @@ class App(ttk.Window if TTKBOOTSTRAP_AVAILABLE else tk.Tk):
         ttk.Label(win, text="Release Notes:", font=("", 10, "bold")).pack(padx=10, pady=(5, 0))
         notes_text = tk.Text(win, height=12, wrap="word")
         notes_text.pack(padx=10, pady=5, fill=tk.BOTH, expand=True)
-        notes_text.insert("1.0", release_info.get('body', 'No release notes available.'))
-        notes_text.config(state="disabled")
+        # Notes are formatted on the worker; feed them in 4 KiB pieces so a
+        # long changelog doesn't hold up the event loop
+        notes = release_info.get('notes') or release_info.get('body') or 'No release notes available.'
+
+        def insert_chunk(pos=0):
+            if not notes_text.winfo_exists():
+                return
+            notes_text.config(state="normal")
+            notes_text.insert(tk.END, notes[pos:pos + NOTES_CHUNK_CHARS])
+            notes_text.config(state="disabled")
+            if pos + NOTES_CHUNK_CHARS < len(notes):
+                self.after_idle(insert_chunk, pos + NOTES_CHUNK_CHARS)
+
+        insert_chunk()
 
         def open_download():
             import webbrowser
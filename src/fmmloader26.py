@@ -10,9 +10,11 @@
 # - Live FM process detection (prevents applying/importing while FM is running)
 # - Type-aware installs (bundle/ui to Standalone; tactics/skins/graphics/etc. to user dir)
 
-import os, sys, json, shutil, hashlib, webbrowser, subprocess, zipfile, tempfile
+import os, sys, json, shutil, hashlib, webbrowser, subprocess, zipfile, tempfile, threading, queue, functools, atexit, stat
 from pathlib import Path
 from datetime import datetime
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog
 
@@ -24,6 +26,14 @@ try:
 except Exception:
     _PSUTIL_OK = False
 
+try:
+    import fcntl
+
+    # Linux FICLONE ioctl (copy-on-write clone on Btrfs/XFS)
+    _FICLONE = 0x40049409 if sys.platform.startswith("linux") else None
+except Exception:
+    _FICLONE = None
+
 try:
     from tkinterdnd2 import TkinterDnD, DND_FILES
 
@@ -38,6 +48,7 @@ VERSION = "0.0.4"
 # -----------------------
 # Paths & storage helpers
 # -----------------------
+@functools.cache
 def _platform_tag():
     if sys.platform.startswith("win"):
         return "windows"
@@ -56,18 +67,21 @@ def legacy_appdata_dir() -> Path:
         return Path.home() / "Library/Application Support" / APP_NAME
 
 
+@functools.cache
 def appdata_dir() -> Path:
     """Current storage base. Windows = %APPDATA%/APP_NAME ; macOS = ~/Library/Application Support/APP_NAME"""
     if sys.platform.startswith("win"):
         base = os.getenv("APPDATA") or str(Path.home() / "AppData/Roaming")
-        p = Path(base) / APP_NAME
-    else:
-        p = Path.home() / "Library/Application Support" / APP_NAME
-    p.mkdir(parents=True, exist_ok=True)
-    return p
+        return Path(base) / APP_NAME
+    return Path.home() / "Library/Application Support" / APP_NAME
+
+
+def _ensure_appdata_dir():
+    appdata_dir().mkdir(parents=True, exist_ok=True)
 
 
 BASE_DIR = appdata_dir()
+_ensure_appdata_dir()
 CONFIG_PATH = BASE_DIR / "config.json"
 BACKUP_DIR = BASE_DIR / "backups"
 MODS_DIR = BASE_DIR / "mods"
@@ -95,7 +109,7 @@ def safe_open_path(path: Path):
 
 def _init_storage():
     for p in (BACKUP_DIR, MODS_DIR, LOGS_DIR, RESTORE_POINTS_DIR):
-        p.mkdir(parents=True, exist_ok=True)
+        os.makedirs(p, exist_ok=True)
     # write "pointer" to last run log (symlink if allowed, else text)
     try:
         if LAST_LINK.exists() or LAST_LINK.is_symlink():
@@ -125,20 +139,143 @@ migrate_legacy_storage_copy_only()
 _init_storage()
 
 
+# Run log: one buffered handle, flushed at operation boundaries and on exit
+_LOG_FH = None
+_LOG_LOCK = threading.Lock()
+
+
+def _run_log_write(line: str):
+    global _LOG_FH
+    with _LOG_LOCK:
+        try:
+            if _LOG_FH is None:
+                _LOG_FH = open(RUN_LOG, "a", buffering=64 * 1024, encoding="utf-8")
+            _LOG_FH.write(line + "\n")
+        except Exception:
+            pass
+
+
+def _run_log_flush():
+    with _LOG_LOCK:
+        try:
+            if _LOG_FH is not None:
+                _LOG_FH.flush()
+        except Exception:
+            pass
+
+
+def _run_log_close():
+    global _LOG_FH
+    with _LOG_LOCK:
+        try:
+            if _LOG_FH is not None:
+                _LOG_FH.close()
+        except Exception:
+            pass
+        _LOG_FH = None
+
+
+atexit.register(_run_log_close)
+
+
 # -------------
 # Config I/O
 # -------------
+# Set FM_RELOADED_PRETTY_CONFIG=1 to keep config.json human-readable while debugging
+_CONFIG_PRETTY = bool(os.getenv("FM_RELOADED_PRETTY_CONFIG"))
+
+
+def _write_config_file(cfg):
+    if _CONFIG_PRETTY:
+        data = json.dumps(cfg, indent=2).encode("utf-8")
+    else:
+        data = json.dumps(cfg, separators=(",", ":")).encode("utf-8")
+    # Write a temp file and rename over config.json, so a crash mid-write
+    # never leaves a truncated config behind
+    tmp = CONFIG_PATH.with_suffix(".json.tmp")
+    fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0), 0o644)
+    try:
+        os.write(fd, data)
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+    os.replace(tmp, CONFIG_PATH)
+
+
+class _Config:
+    """
+    In-memory config.json. Reads come from memory (reloaded only when the file's
+    mtime changes and nothing is pending); setters mark it dirty and a short
+    timer coalesces a burst of edits into one write.
+    """
+
+    def __init__(self, delay: float = 0.25):
+        self._data = None
+        self._mtime = -1
+        self._dirty = False
+        self._timer = None
+        self._delay = delay
+        # Config is used from worker threads too
+        self._lock = threading.RLock()
+
+    def data(self) -> dict:
+        with self._lock:
+            if self._dirty:
+                return self._data
+            try:
+                mtime = CONFIG_PATH.stat().st_mtime_ns
+            except OSError:
+                mtime = None
+            if self._data is None or mtime != self._mtime:
+                data = {}
+                if mtime is not None:
+                    try:
+                        data = json.loads(CONFIG_PATH.read_text(encoding="utf-8"))
+                    except Exception:
+                        data = {}
+                self._data, self._mtime = data, mtime
+            return self._data
+
+    def set(self, key, value):
+        with self._lock:
+            self.data()[key] = value
+            self._dirty = True
+            if self._timer is None:
+                self._timer = threading.Timer(self._delay, self.flush)
+                self._timer.daemon = True
+                self._timer.start()
+
+    def replace(self, cfg: dict):
+        with self._lock:
+            self._data = cfg
+            self._dirty = True
+            self.flush()
+
+    def flush(self):
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            if not self._dirty:
+                return
+            _write_config_file(self._data)
+            self._dirty = False
+            try:
+                self._mtime = CONFIG_PATH.stat().st_mtime_ns
+            except OSError:
+                self._mtime = -1
+
+
+_CONFIG = _Config()
+atexit.register(_CONFIG.flush)
+
+
 def load_config():
-    if CONFIG_PATH.exists():
-        try:
-            return json.loads(CONFIG_PATH.read_text(encoding="utf-8"))
-        except Exception:
-            return {}
-    return {}
+    return _CONFIG.data()
 
 
 def save_config(cfg):
-    CONFIG_PATH.write_text(json.dumps(cfg, indent=2), encoding="utf-8")
+    _CONFIG.replace(cfg)
 
 
 def get_target() -> Path | None:
@@ -147,38 +284,33 @@ def get_target() -> Path | None:
 
 
 def set_target(path: Path):
-    cfg = load_config()
-    cfg["target_path"] = str(path)
-    save_config(cfg)
+    _CONFIG.set("target_path", str(path))
 
 
+# The getters hand out copies: callers edit the lists in place, and the cached
+# config must only change through the setters (which mark it dirty)
 def get_enabled_mods():
-    return load_config().get("enabled_mods", [])
+    return list(load_config().get("enabled_mods", []))
 
 
 def set_enabled_mods(mods):
-    cfg = load_config()
-    cfg["enabled_mods"] = mods
-    save_config(cfg)
+    _CONFIG.set("enabled_mods", mods)
 
 
 def get_load_order():
-    return load_config().get("load_order", [])
+    return list(load_config().get("load_order", []))
 
 
 def set_load_order(order):
-    cfg = load_config()
-    cfg["load_order"] = order
-    save_config(cfg)
+    _CONFIG.set("load_order", order)
 
 
 # -----------------------
 # Game detection (common)
 # -----------------------
-def default_candidates():
-    """Try to discover the 'Standalone...' asset folder by platform."""
+def _candidate_paths():
+    """All known 'Standalone...' asset folder locations for this platform."""
     home = Path.home()
-    out = []
     if sys.platform.startswith("win"):
         steam = (
             Path(os.getenv("PROGRAMFILES(X86)", "C:/Program Files (x86)"))
@@ -188,27 +320,32 @@ def default_candidates():
             Path(os.getenv("PROGRAMFILES", "C:/ Program Files"))
             / "Epic Games/Football Manager 26"
         )
-        for base in (steam, epic):
+        return [
+            base / sub
+            for base in (steam, epic)
             for sub in (
                 "fm_Data/StreamingAssets/aa/StandaloneWindows64",
                 "data/StreamingAssets/aa/StandaloneWindows64",
-            ):
-                p = base / sub
-                if p.exists():
-                    out.append(p)
-    else:
-        # macOS
-        for p in (
-            home
-            / "Library/Application Support/Steam/steamapps/common/Football Manager 26/fm.app/Contents/Resources/Data/StreamingAssets/aa/StandaloneOSX",
-            home
-            / "Library/Application Support/Steam/steamapps/common/Football Manager 26/fm_Data/StreamingAssets/aa/StandaloneOSXUniversal",
-            home
-            / "Library/Application Support/Epic/Football Manager 26/fm_Data/StreamingAssets/aa/StandaloneOSXUniversal",
-        ):
-            if p.exists():
-                out.append(p)
-    return out
+            )
+        ]
+    # macOS
+    return [
+        home
+        / "Library/Application Support/Steam/steamapps/common/Football Manager 26/fm.app/Contents/Resources/Data/StreamingAssets/aa/StandaloneOSX",
+        home
+        / "Library/Application Support/Steam/steamapps/common/Football Manager 26/fm_Data/StreamingAssets/aa/StandaloneOSXUniversal",
+        home
+        / "Library/Application Support/Epic/Football Manager 26/fm_Data/StreamingAssets/aa/StandaloneOSXUniversal",
+    ]
+
+
+# Built once; only the existence probe runs per call
+_CANDIDATES = _candidate_paths()
+
+
+def default_candidates():
+    """Try to discover the 'Standalone...' asset folder by platform."""
+    return [p for p in _CANDIDATES if os.path.isdir(p)]
 
 
 def detect_and_set():
@@ -222,10 +359,24 @@ def detect_and_set():
 # -------------
 # Manifest I/O
 # -------------
+# mod_dir -> (mtime_ns, size, parsed manifest); callers treat the dict as read-only
+_MANIFEST_CACHE: dict[Path, tuple[int, int, dict]] = {}
+
+
+def invalidate_manifest(mod_dir: Path):
+    _MANIFEST_CACHE.pop(Path(mod_dir), None)
+
+
 def read_manifest(mod_dir: Path):
-    mf = Path(mod_dir) / "manifest.json"
-    if not mf.exists():
+    mod_dir = Path(mod_dir)
+    mf = mod_dir / "manifest.json"
+    try:
+        st = mf.stat()
+    except OSError:
         raise FileNotFoundError(f"No manifest.json in {mod_dir}")
+    cached = _MANIFEST_CACHE.get(mod_dir)
+    if cached and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+        return cached[2]
     data = json.loads(mf.read_text(encoding="utf-8"))
     # sensible defaults
     data.setdefault("name", Path(mod_dir).name)
@@ -241,26 +392,34 @@ def read_manifest(mod_dir: Path):
     data.setdefault("license", "")
     if "files" not in data or not isinstance(data["files"], list):
         data["files"] = []
+    _MANIFEST_CACHE[mod_dir] = (st.st_mtime_ns, st.st_size, data)
     return data
 
 
-def resolve_target(base: Path, sub: str) -> Path:
-    return Path(base) / sub
+def resolve_target(base: Path, sub: str) -> str:
+    """Target file path as a plain string (per-file loops avoid Path construction)."""
+    return os.path.normpath(os.path.join(base, sub))
 
 
 # ----------
 # Backups
 # ----------
-def backup_original(target_file: Path):
-    if not Path(target_file).exists():
+def backup_original(target_file: Path, st=None):
+    """Back up target_file into BACKUP_DIR. Pass `st` when the caller already knows it exists."""
+    if st is None and not Path(target_file).exists():
         return None
-    h = hashlib.sha256(str(target_file).encode("utf-8")).hexdigest()[:10]
+    h = hashlib.blake2b(str(target_file).encode("utf-8"), digest_size=5).hexdigest()
     dest = BACKUP_DIR / f"{Path(target_file).name}.{h}.bak"
     i, final = 1, dest
     while final.exists():
         final = BACKUP_DIR / f"{dest.name}.{i}"
         i += 1
-    shutil.copy2(target_file, final)
+    # Hardlink when possible (same volume). Callers must replace the target
+    # (unlink + write), never write into it, or the backup changes too.
+    try:
+        os.link(target_file, final)
+    except OSError:
+        shutil.copy2(target_file, final)
     return final
 
 
@@ -273,6 +432,29 @@ def find_latest_backup_for_filename(filename: str):
     return cands[0] if cands else None
 
 
+def _scan_backup_index() -> dict[str, list[tuple[float, Path]]]:
+    """
+    One pass over BACKUP_DIR: original filename -> [(mtime, backup path)], newest first.
+    Backups are named '<filename>.<hash>.bak[.N]', so the key is everything before '.<hash>.bak'.
+    """
+    index: dict[str, list[tuple[float, Path]]] = {}
+    try:
+        with os.scandir(BACKUP_DIR) as it:
+            for entry in it:
+                if not entry.is_file():
+                    continue
+                stem, sep, _ = entry.name.rpartition(".bak")
+                if not sep:
+                    continue
+                filename = stem.rsplit(".", 1)[0]
+                index.setdefault(filename, []).append((entry.stat().st_mtime, Path(entry.path)))
+    except OSError:
+        return {}
+    for bucket in index.values():
+        bucket.sort(key=lambda t: t[0], reverse=True)
+    return index
+
+
 # -----------------------
 # NEW: Utility helpers
 # -----------------------
@@ -305,6 +487,27 @@ def is_fm_running():
     return False
 
 
+def _clone_or_copy(src: Path, dst: Path):
+    """Copy one file as a copy-on-write clone where the filesystem supports it, else copy2."""
+    if sys.platform == "darwin":
+        # APFS clonefile via `cp -c`
+        try:
+            if subprocess.run(["cp", "-c", str(src), str(dst)], capture_output=True).returncode == 0:
+                shutil.copystat(src, dst)
+                return
+        except OSError:
+            pass
+    elif _FICLONE is not None:
+        try:
+            with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+                fcntl.ioctl(fdst.fileno(), _FICLONE, fsrc.fileno())
+            shutil.copystat(src, dst)
+            return
+        except OSError:
+            pass
+    shutil.copy2(src, dst)
+
+
 def _copy_any(src: Path, dst: Path):
     """
     Merge-copy src -> dst.
@@ -344,35 +547,18 @@ def _find_mod_root(path: Path) -> tuple[Path, Path | None]:
     Return (mod_root, temp_dir).
     - If `path` is a directory: prefer that dir when it has manifest.json,
       otherwise search one level deep for a dir that has it.
-    - If `path` is a .zip: extract to a temp dir, then search as above.
-    temp_dir (if created) must be cleaned up by the caller.
+    Zips don't come through here: install_mod_from_zip reads them directly.
+    temp_dir is always None for directories; callers still clean it up if set.
     """
+    # Be forgiving about case (manifest.json / Manifest.json)
+    manifest_names = ("manifest.json", "Manifest.json", "MANIFEST.JSON")
 
     def _has_manifest(p: Path) -> bool:
-        # Be forgiving about case (manifest.json / Manifest.json)
-        for name in ("manifest.json", "Manifest.json", "MANIFEST.JSON"):
+        for name in manifest_names:
             if (p / name).exists():
                 return True
         return False
 
-    if path.is_file() and path.suffix.lower() == ".zip":
-        tmp = Path(tempfile.mkdtemp(prefix="fm26_import_"))
-        with zipfile.ZipFile(path, "r") as z:
-            z.extractall(tmp)
-        # 1) root
-        if _has_manifest(tmp):
-            return tmp, tmp
-        # 2) any first-level dir with manifest
-        for d in sorted([d for d in tmp.iterdir() if d.is_dir()]):
-            if _has_manifest(d):
-                return d, tmp
-        # 3) if exactly one subdir, try it anyway
-        subs = [d for d in tmp.iterdir() if d.is_dir()]
-        if len(subs) == 1:
-            return subs[0], tmp
-        # No manifest found
-        return tmp, tmp
-
     # Directory path
     if path.is_dir():
         if _has_manifest(path):
@@ -442,8 +628,15 @@ def enable_mod(mod_name: str, log):
     mod_dir = MODS_DIR / mod_name
     if not mod_dir.exists():
         raise FileNotFoundError(f"Mod not found: {mod_name} in {MODS_DIR}")
+    enable_mod_with_manifest(mod_name, read_manifest(mod_dir), log)
 
-    mf = read_manifest(mod_dir)
+
+def enable_mod_with_manifest(mod_name: str, mf: dict, log, shadowed=None):
+    """
+    Same as enable_mod, for callers that already hold the parsed manifest.
+    `shadowed` maps target_subpath -> later mod that overwrites it; those entries are skipped.
+    """
+    mod_dir = MODS_DIR / mod_name
     mod_type = (mf.get("type") or "misc").strip().lower()
 
     # Pass mod name so graphics/* routing (kits/faces/logos) can work
@@ -468,7 +661,8 @@ def enable_mod(mod_name: str, log):
     log(f"[enable] {mf.get('name', mod_name)} ({mod_type}) → {base}")
     log(f"  [context] platform={plat} files={len(files)}")
 
-    wrote = skipped = backed_up = errors = 0
+    wrote = skipped = backed_up = errors = unchanged = 0
+    cands = []  # (src_rel, tgt_rel, src, tgt, src_stat)
 
     for e in files:
         ep = (e.get("platform") or "").strip().lower()
@@ -485,32 +679,144 @@ def enable_mod(mod_name: str, log):
             errors += 1
             continue
 
+        if shadowed and tgt_rel in shadowed:
+            log(f"  [shadowed-by: {shadowed[tgt_rel]}] {src_rel}  →  {tgt_rel}")
+            skipped += 1
+            continue
+
         src = mod_dir / src_rel
         tgt = resolve_target(base, tgt_rel)
 
-        if not src.exists():
+        try:
+            s_st = src.stat()
+        except OSError:
             log(f"  [error/missing] Source not found: {src}")
             errors += 1
             continue
 
-        try:
-            # Back up only when the target is an existing FILE
-            if tgt.exists() and tgt.is_file():
-                b = backup_original(tgt)
-                log(f"  [backup] {tgt_rel}  ←  {b.name if b else 'skipped'}")
-                backed_up += 1
+        cands.append((src_rel, tgt_rel, src, tgt, s_st))
+
+    # Create each target parent once up front (typically 1-3 dirs per mod)
+    parents = {}
+    for c in cands:
+        parent, name = os.path.split(c[3])
+        parents.setdefault(parent, set()).add(name)
+    for parent in sorted(parents):
+        os.makedirs(parent, exist_ok=True)
+    existing = _stat_targets(parents)
+
+    jobs = []  # (src_rel, tgt_rel, src, tgt, src_is_dir, tgt_stat)
+    for src_rel, tgt_rel, src, tgt, s_st in cands:
+        src_is_dir = stat.S_ISDIR(s_st.st_mode)
+        t_st = existing.get(tgt)
+
+        # Re-applying: copies keep the source mtime, so only a size + mtime_ns
+        # match is worth the full byte comparison that decides it
+        if (
+            not src_is_dir
+            and t_st is not None
+            and s_st.st_size == t_st.st_size
+            and s_st.st_mtime_ns == t_st.st_mtime_ns
+            and _same_content(src, tgt)
+        ):
+            log(f"  [noop/equal] {src_rel}  =  {tgt_rel}")
+            unchanged += 1
+            continue
 
-            # Directory-aware copy (merges folders, supports packs like logos/kits/faces)
-            _copy_any(src, tgt)
-            log(f"  [write] {src_rel}  →  {tgt_rel}{' (dir)' if src.is_dir() else ''}")
+        jobs.append((src_rel, tgt_rel, src, tgt, src_is_dir, t_st))
 
-        except Exception as ex:
+    # Distinct single-file targets are independent, so copy them concurrently.
+    # Folder entries or repeated targets keep the sequential last-write-wins order.
+    parallel = (
+        len(jobs) > 1
+        and len({j[3] for j in jobs}) == len(jobs)
+        and not any(j[4] for j in jobs)
+    )
+    if parallel:
+        with ThreadPoolExecutor(max_workers=min(8, (os.cpu_count() or 1) * 2)) as pool:
+            results = list(pool.map(lambda j: _install_entry(*j[2:]), jobs))
+    else:
+        results = [_install_entry(*j[2:]) for j in jobs]
+
+    # Log from this thread, in manifest order
+    for (src_rel, tgt_rel, _src, _tgt, src_is_dir, _st), (backed, b, ex) in zip(jobs, results):
+        if backed:
+            log(f"  [backup] {tgt_rel}  ←  {b.name if b else 'skipped'}")
+            backed_up += 1
+        if ex is not None:
             log(f"  [error/copy] {src_rel} → {tgt_rel} :: {ex}")
             errors += 1
+        else:
+            log(f"  [write] {src_rel}  →  {tgt_rel}{' (dir)' if src_is_dir else ''}")
+            wrote += 1
 
     log(
-        f"[enable/done] wrote={wrote} backup={backed_up} skipped={skipped} errors={errors}"
+        f"[enable/done] wrote={wrote} unchanged={unchanged} backup={backed_up} skipped={skipped} errors={errors}"
     )
+    _run_log_flush()
+
+
+def _same_content(a: Path, b: Path, chunk: int = 1 << 20) -> bool:
+    """Compare two files byte for byte, stopping at the first differing chunk."""
+    try:
+        with open(a, "rb") as fa, open(b, "rb") as fb:
+            while True:
+                ca = fa.read(chunk)
+                if ca != fb.read(chunk):
+                    return False
+                if not ca:
+                    return True
+    except OSError:
+        return False
+
+
+def _stat_targets(parents: dict) -> dict:
+    """
+    Stat the wanted names of each target folder with one os.scandir per folder.
+    `parents` maps folder -> {file names}; returns {target path: stat_result}.
+    """
+    found = {}
+    for parent, names in parents.items():
+        with os.scandir(parent) as it:
+            for de in it:
+                if de.name in names:
+                    found[de.path] = de.stat()
+        if sys.platform in ("win32", "darwin"):
+            # Case-insensitive volumes: a name that differs only in case is the same file
+            for name in names:
+                p = os.path.join(parent, name)
+                if p not in found:
+                    try:
+                        found[p] = os.stat(p)
+                    except OSError:
+                        pass
+    return found
+
+
+def _install_entry(src: Path, tgt: str, src_is_dir: bool = None, tgt_stat=None):
+    """
+    Back up and copy one manifest entry. Returns (backed_up, backup_path, error).
+    `tgt_stat` is the target's prefetched stat (None when it doesn't exist).
+    """
+    if src_is_dir is None:
+        src_is_dir = src.is_dir()
+    backed, b = False, None
+    try:
+        # Back up only when the target is an existing FILE
+        if tgt_stat is not None and stat.S_ISREG(tgt_stat.st_mode):
+            b = backup_original(tgt, st=tgt_stat)
+            backed = True
+            # The backup may be a hardlink to this file: replace it, don't overwrite in place
+            os.remove(tgt)
+
+        if src_is_dir:
+            # Directory-aware copy (merges folders, supports packs like logos/kits/faces)
+            _copy_any(src, Path(tgt))
+        else:
+            _clone_or_copy(src, tgt)  # parent created by the caller
+        return backed, b, None
+    except Exception as ex:
+        return backed, b, ex
 
 
 def disable_mod(mod_name: str, log):
@@ -526,6 +832,8 @@ def disable_mod(mod_name: str, log):
         return
     log(f"[disable] {mf.get('name', mod_name)}  from  {base}")
     removed = restored = missing_backup = not_present = errors = 0
+    # Scan the backup folder once instead of globbing per file
+    backups = _scan_backup_index()
     for e in files:
         tgt_rel = e.get("target_subpath")
         if not tgt_rel:
@@ -533,18 +841,19 @@ def disable_mod(mod_name: str, log):
             errors += 1
             continue
         tgt = resolve_target(base, tgt_rel)
-        if tgt.exists():
+        tgt_name = os.path.basename(tgt)
+        if os.path.lexists(tgt):
             try:
-                tgt.unlink()
+                os.remove(tgt)
                 log(f"  [remove] {tgt_rel}")
                 removed += 1
-                b = find_latest_backup_for_filename(tgt.name)
+                b = backups.get(tgt_name, [(None, None)])[0][1]
                 if b and b.exists():
                     shutil.copy2(b, tgt)
                     log(f"  [restore] {b.name}  →  {tgt_rel}")
                     restored += 1
                 else:
-                    log(f"  [no-backup] {tgt.name} (left removed)")
+                    log(f"  [no-backup] {tgt_name} (left removed)")
                     missing_backup += 1
             except Exception as ex:
                 log(f"  [error/remove] {tgt_rel} :: {ex}")
@@ -555,6 +864,39 @@ def disable_mod(mod_name: str, log):
     log(
         f"[disable/done] removed={removed} restored={restored} no_backup={missing_backup} absent={not_present} errors={errors}"
     )
+    _run_log_flush()
+
+
+def _fast_copytree(src: Path, dst: Path):
+    """
+    copytree replacement for mod imports: one BFS scandir pass creates every
+    directory, then file contents are copied on a thread pool with copyfile
+    (sendfile/fcopyfile fast paths). Per-file copystat is skipped; directory
+    times are set once at the end.
+    """
+    dirs, files = [], []
+    pending = deque([(str(src), str(dst))])
+    while pending:
+        s_dir, d_dir = pending.popleft()
+        os.makedirs(d_dir, exist_ok=True)
+        dirs.append((s_dir, d_dir))
+        with os.scandir(s_dir) as it:
+            for e in it:
+                out = os.path.join(d_dir, e.name)
+                if e.is_dir():
+                    pending.append((e.path, out))
+                else:
+                    files.append((e.path, out))
+
+    if files:
+        with ThreadPoolExecutor(max_workers=min(8, (os.cpu_count() or 1) * 2)) as pool:
+            # list() re-raises the first copy error
+            list(pool.map(lambda pair: shutil.copyfile(*pair), files))
+
+    # Deepest first, so creating children doesn't bump a parent's mtime afterwards
+    for s_dir, d_dir in reversed(dirs):
+        st = os.stat(s_dir)
+        os.utime(d_dir, ns=(st.st_atime_ns, st.st_mtime_ns))
 
 
 def install_mod_from_folder(src_folder: Path, name_override: str | None, log=None):
@@ -568,7 +910,71 @@ def install_mod_from_folder(src_folder: Path, name_override: str | None, log=Non
     dest = MODS_DIR / name
     if dest.exists():
         shutil.rmtree(dest)
-    shutil.copytree(src_folder, dest)
+    _fast_copytree(src_folder, dest)
+    invalidate_manifest(dest)
+    _index_remove(name)
+    _index_add(name, read_manifest(dest))
+    if log:
+        log(f"Installed mod '{name}' to {dest}")
+    return name
+
+
+def install_mod_from_zip(zip_path: Path, name_override: str | None, log=None):
+    """
+    Install a mod straight from a .zip into MODS_DIR, streaming each entry
+    to its final place (no temp extraction + copytree).
+    The mod root is the folder holding manifest.json (any case): the zip root,
+    else the first folder by name one level down, as _find_mod_root picks it.
+    """
+    zip_path = Path(zip_path)
+    with zipfile.ZipFile(zip_path, "r") as z:
+        infos = z.infolist()
+        manifests = sorted(
+            (i.filename for i in infos
+             if i.filename.rpartition("/")[2].lower() == "manifest.json"
+             and i.filename.count("/") <= 1),
+            key=lambda n: (n.count("/"), n),
+        )
+        if not manifests:
+            raise FileNotFoundError("Selected zip does not contain a manifest.json")
+        manifest_entry = manifests[0]
+        prefix = manifest_entry[: -len("manifest.json")]  # "" or "<folder>/"
+        mf = json.loads(z.read(manifest_entry).decode("utf-8"))
+        name = (name_override or mf.get("name") or prefix.rstrip("/") or zip_path.stem).strip()
+        if not name:
+            raise ValueError("Mod name cannot be empty.")
+
+        dest = MODS_DIR / name
+        if dest.exists():
+            shutil.rmtree(dest)
+        dest.mkdir(parents=True)
+        dest_str = str(dest)
+        made = {dest_str}
+        for info in infos:
+            if not info.filename.startswith(prefix):
+                continue
+            rel = info.filename[len(prefix):]
+            parts = rel.replace("\\", "/").split("/")
+            if not rel or ".." in parts or rel.startswith(("/", "\\")) or ":" in rel:
+                continue
+            if info.filename == manifest_entry:
+                # read_manifest looks for the lower-case name
+                parts = ["manifest.json"]
+            out = os.path.join(dest_str, *[p for p in parts if p])
+            if info.is_dir():
+                if out not in made:
+                    os.makedirs(out, exist_ok=True)
+                    made.add(out)
+                continue
+            parent = os.path.dirname(out)
+            if parent not in made:
+                os.makedirs(parent, exist_ok=True)
+                made.add(parent)
+            with z.open(info) as src, open(out, "wb") as dst:
+                shutil.copyfileobj(src, dst, 1 << 20)
+    invalidate_manifest(dest)
+    _index_remove(name)
+    _index_add(name, read_manifest(dest))
     if log:
         log(f"Installed mod '{name}' to {dest}")
     return name
@@ -580,7 +986,8 @@ def install_mod_from_folder(src_folder: Path, name_override: str | None, log=Non
 def build_mod_index(names=None):
     """Index target_subpath -> [unique mods touching it], for THIS platform only."""
     if names is None:
-        names = [p.name for p in MODS_DIR.iterdir() if p.is_dir()]
+        with os.scandir(MODS_DIR) as it:
+            names = [e.name for e in it if e.is_dir(follow_symlinks=False)]
     manifests = {}
     idx = {}  # target_subpath -> set of mod names
     plat = _platform_tag()
@@ -604,70 +1011,198 @@ def build_mod_index(names=None):
     return idx, manifests
 
 
+# Persistent target_subpath -> {mods} index over all installed mods (this platform),
+# kept current incrementally instead of rebuilt per conflict check
+_TARGET_INDEX: dict[str, set[str]] = {}
+_INDEXED_MANIFESTS: dict[str, dict] = {}
+
+
+def _index_add(mod: str, mf: dict):
+    plat = _platform_tag()
+    for f in mf.get("files", []):
+        ep = f.get("platform")
+        if ep and ep != plat:
+            continue
+        tgt = f.get("target_subpath")
+        if tgt:
+            _TARGET_INDEX.setdefault(tgt, set()).add(mod)
+    _INDEXED_MANIFESTS[mod] = mf
+
+
+def _index_remove(mod: str):
+    mf = _INDEXED_MANIFESTS.pop(mod, None)
+    if mf is None:
+        return
+    for f in mf.get("files", []):
+        tgt = f.get("target_subpath")
+        mods = _TARGET_INDEX.get(tgt)
+        if mods is not None:
+            mods.discard(mod)
+            if not mods:
+                del _TARGET_INDEX[tgt]
+
+
+def _refresh_target_index():
+    """Re-index only mods that appeared, vanished or whose manifest changed."""
+    with os.scandir(MODS_DIR) as it:
+        present = {e.name for e in it if e.is_dir(follow_symlinks=False)}
+    for mod in list(_INDEXED_MANIFESTS):
+        if mod not in present:
+            _index_remove(mod)
+    for mod in present:
+        try:
+            mf = read_manifest(MODS_DIR / mod)  # cached dict while unchanged
+        except (OSError, ValueError):
+            _index_remove(mod)
+            continue
+        if _INDEXED_MANIFESTS.get(mod) is not mf:
+            _index_remove(mod)
+            _index_add(mod, mf)
+
+
 def find_conflicts(names=None):
     """Return {target_subpath: [mods...]} and manifests dict, deduped and platform-filtered."""
-    idx, manifests = build_mod_index(names)
-    conflicts = {t: ms for t, ms in idx.items() if len(ms) > 1}
+    _refresh_target_index()
+    wanted = None if names is None else set(names)
+    conflicts = {}
+    for t, ms in _TARGET_INDEX.items():
+        sel = ms if wanted is None else ms & wanted
+        if len(sel) > 1:
+            conflicts[t] = sorted(sel)
+    mods = _INDEXED_MANIFESTS if wanted is None else wanted
+    manifests = {m: _INDEXED_MANIFESTS[m] for m in mods if m in _INDEXED_MANIFESTS}
     return conflicts, manifests
 
 
 # --------------------
 # Restore points
 # --------------------
-def create_restore_point(base: Path, log):
+def create_restore_point(base: Path, log, idx=None):
     ts = datetime.now().strftime("%Y%m%d-%H%M%S")
     rp = RESTORE_POINTS_DIR / ts
     rp.mkdir(parents=True, exist_ok=True)
-    idx, _ = build_mod_index(get_enabled_mods())
+    if idx is None:
+        idx, _ = build_mod_index(get_enabled_mods())
     for rel in idx.keys():
         src = base / rel
         if src.exists() and src.is_file():
             dst = rp / rel
             dst.parent.mkdir(parents=True, exist_ok=True)
-            shutil.copy2(src, dst)
+            # Real copy (a CoW clone where supported), never a hardlink: directory
+            # merges and game/Steam updates write these files in place, which
+            # would silently change a linked snapshot too
+            _clone_or_copy(src, dst)
     log(f"Restore point created: {rp.name}")
     return rp.name
 
 
 def rollback_to_restore_point(name: str, base: Path, log):
+    """
+    Copy a restore point back over the game files. This always unlinks +
+    copies (never links back), so the snapshot stays untouched if the game
+    later writes those files in place; older restore points may still hold
+    hardlinks.
+    """
     rp = RESTORE_POINTS_DIR / name
     if not rp.exists():
         raise FileNotFoundError("Restore point not found.")
-    for p in rp.rglob("*"):
-        if p.is_file():
-            rel = p.relative_to(rp)
-            dst = base / rel.as_posix()
-            dst.parent.mkdir(parents=True, exist_ok=True)
-            shutil.copy2(p, dst)
+    base_str = str(base)
+    made = set()
+    for dirpath, _dirs, filenames in os.walk(rp):
+        rel_dir = os.path.relpath(dirpath, rp)
+        dst_dir = base_str if rel_dir == os.curdir else os.path.join(base_str, rel_dir)
+        if filenames and dst_dir not in made:
+            os.makedirs(dst_dir, exist_ok=True)
+            made.add(dst_dir)
+        for f in filenames:
+            dst = os.path.join(dst_dir, f)
+            if os.path.isfile(dst):
+                os.unlink(dst)  # may share an inode with a hardlinked backup
+            shutil.copy2(os.path.join(dirpath, f), dst)
     log(f"Rolled back to restore point: {name}")
+    _run_log_flush()
 
 
 # --------------
 # Apply order
 # --------------
+@functools.lru_cache(maxsize=8)
+def _merge_order(enabled: tuple, order: tuple) -> list:
+    enabled_set, order_set = set(enabled), set(order)
+    return [m for m in order if m in enabled_set] + [
+        m for m in enabled if m not in order_set
+    ]
+
+
+def _effective_order():
+    """Enabled mods in load order, then enabled mods missing from the order."""
+    return list(_merge_order(tuple(get_enabled_mods()), tuple(get_load_order())))
+
+
+def _shadowed_writes(ordered, manifests):
+    """
+    Find single-file writes that a later mod in `ordered` overwrites anyway.
+    Returns {mod: {target_subpath: winning_mod}}; those entries can be skipped
+    without changing the last-write-wins result.
+    """
+    plat = _platform_tag()
+    last_writer = {}  # resolved target path -> (mod, target_subpath)
+    for name in ordered:
+        mf = manifests[name]
+        mod_type = (mf.get("type") or "misc").strip().lower()
+        base = get_target_for_type(mod_type, mf.get("name", name))
+        if not base:
+            continue
+        for e in mf.get("files", []):
+            ep = (e.get("platform") or "").strip().lower()
+            src_rel, tgt_rel = e.get("source"), e.get("target_subpath")
+            if (ep and ep != plat) or not src_rel or not tgt_rel:
+                continue
+            # Folder entries merge, so they never shadow or get shadowed
+            if not os.path.isfile(os.path.join(MODS_DIR, name, src_rel)):
+                continue
+            last_writer[os.path.normpath(os.path.join(base, tgt_rel))] = (name, tgt_rel)
+
+    shadowed = {}
+    for name in ordered:
+        mf = manifests[name]
+        mod_type = (mf.get("type") or "misc").strip().lower()
+        base = get_target_for_type(mod_type, mf.get("name", name))
+        if not base:
+            continue
+        for e in mf.get("files", []):
+            tgt_rel = e.get("target_subpath")
+            if not tgt_rel:
+                continue
+            winner = last_writer.get(os.path.normpath(os.path.join(base, tgt_rel)))
+            if winner and winner[0] != name:
+                shadowed.setdefault(name, {})[tgt_rel] = winner[0]
+    return shadowed
+
+
 def apply_enabled_mods_in_order(log):
     # IMPORTANT: For mixed types, we still create a restore point for the Standalone base.
     # For user-dir types, restore points won't snapshot (only intended for game-file overwrites).
     base = get_target()
     if not base or not base.exists():
         raise RuntimeError("No valid FM26 target set. Use Detect or Set Target.")
-    enabled = get_enabled_mods()
-    order = get_load_order()
-    ordered = [m for m in order if m in enabled] + [
-        m for m in enabled if m not in order
-    ]
+    ordered = _effective_order()
     if not ordered:
         log("No enabled mods to apply.")
         return
-    rp = create_restore_point(base, log)
+    # One index/manifest pass shared by the restore point and every enable
+    idx, manifests = build_mod_index(ordered)
+    shadowed = _shadowed_writes(ordered, manifests)
+    rp = create_restore_point(base, log, idx=idx)
     for name in ordered:
         try:
-            enable_mod(name, log)
+            enable_mod_with_manifest(name, manifests[name], log, shadowed.get(name))
         except Exception as ex:
             log(f"[WARN] Failed enabling {name}: {ex}")
     log(
         f"Applied {len(ordered)} mod(s) in order (last-write-wins). Restore point: {rp}"
     )
+    _run_log_flush()
 
 
 # ==========
@@ -682,6 +1217,9 @@ class App(BaseTk):
         self.title(f"FM_Reloaded_26 v{VERSION} — Presented by the FM Match Lab Team")
         self.geometry("1120x820")
         self.minsize(1000, 700)
+        # Worker threads never touch widgets: they post log lines / callbacks here
+        self._ui_queue = queue.Queue()
+        self._worker_busy = False
         if DND_AVAILABLE:
             self.drop_target_register(DND_FILES)
             self.dnd_bind("<<Drop>>", self.on_drop)
@@ -689,19 +1227,67 @@ class App(BaseTk):
         self.refresh_target_display()
         self.refresh_mod_list()
         self._log("Ready.")
+        self.after(50, self._drain_ui_queue)
+
+    # ---- background work ----
+    def _queue_log(self, msg: str):
+        """Thread-safe log callback for worker threads."""
+        _run_log_write(msg)  # file order/flush points stay with the worker
+        self._ui_queue.put(msg)
+
+    def _drain_ui_queue(self):
+        try:
+            while True:
+                item = self._ui_queue.get_nowait()
+                if callable(item):
+                    item()
+                else:
+                    self._log_widget(item)
+        except queue.Empty:
+            pass
+        self.after(50, self._drain_ui_queue)
+
+    def _busy(self) -> bool:
+        """True (after telling the user) while a background job owns the mods/config."""
+        if self._worker_busy:
+            messagebox.showinfo("Busy", "Another operation is still running.")
+        return self._worker_busy
+
+    def _run_in_background(self, work, on_done, error_title: str):
+        """
+        Run work(log) on a daemon thread so file I/O doesn't freeze the window.
+        on_done(result) / the error dialog run back on the Tk thread.
+        """
+        if self._busy():
+            return
+        self._worker_busy = True
+
+        def finish(callback):
+            self._worker_busy = False
+            callback()
+
+        def runner():
+            try:
+                result = work(self._queue_log)
+            except Exception as e:
+                err = str(e)  # `e` is cleared when the except block ends
+                self._ui_queue.put(lambda: finish(lambda: messagebox.showerror(error_title, err)))
+            else:
+                self._ui_queue.put(lambda: finish(lambda: on_done(result)))
+
+        threading.Thread(target=runner, daemon=True).start()
 
     # ---- logging ----
     def _log(self, msg: str):
+        self._log_widget(msg)
+        _run_log_write(msg)
+
+    def _log_widget(self, msg: str):
         try:
             self.log_text.insert(tk.END, msg + "\n")
             self.log_text.see(tk.END)
         except Exception:
             pass
-        try:
-            with open(RUN_LOG, "a", encoding="utf-8") as f:
-                f.write(msg + "\n")
-        except Exception:
-            pass
 
     # ---- UI layout ----
     def create_widgets(self):
@@ -957,17 +1543,23 @@ class App(BaseTk):
             )
             return Path(folder) if folder else None
     def on_import_mod(self):
+        if self._busy():
+            return
         if is_fm_running():
             messagebox.showwarning("FM is Running", "Please close Football Manager before importing mods.")
             return
         choice = self._choose_import_source()
         if not choice:
             return
-        mod_root, temp_dir = _find_mod_root(choice)
+        is_zip = choice.is_file() and choice.suffix.lower() == ".zip"
+        mod_root, temp_dir = (None, None) if is_zip else _find_mod_root(choice)
         try:
-            if not (mod_root / "manifest.json").exists() and not (mod_root / "Manifest.json").exists():
-                raise FileNotFoundError("Selected folder does not contain a manifest.json")
-            newname = install_mod_from_folder(mod_root, None, log=self._log)
+            if is_zip:
+                newname = install_mod_from_zip(choice, None, log=self._log)
+            else:
+                if not (mod_root / "manifest.json").exists() and not (mod_root / "Manifest.json").exists():
+                    raise FileNotFoundError("Selected folder does not contain a manifest.json")
+                newname = install_mod_from_folder(mod_root, None, log=self._log)
             order = get_load_order()
             if newname not in order:
                 order.append(newname); set_load_order(order)
@@ -980,6 +1572,8 @@ class App(BaseTk):
                 shutil.rmtree(temp_dir, ignore_errors=True)
 
     def on_drop(self, event):
+        if self._busy():
+            return
         if is_fm_running():
             messagebox.showwarning(
                 "FM is Running", "Please close Football Manager before importing mods."
@@ -991,16 +1585,20 @@ class App(BaseTk):
         path = Path(raw)
         if not path.exists():
             return
-        mod_root, temp_dir = _find_mod_root(path)
+        is_zip = path.is_file() and path.suffix.lower() == ".zip"
+        mod_root, temp_dir = (None, None) if is_zip else _find_mod_root(path)
         try:
-            if (
-                not (mod_root / "manifest.json").exists()
-                and not (mod_root / "Manifest.json").exists()
-            ):
-                raise FileNotFoundError(
-                    "Dropped file/folder does not contain a manifest.json"
-                )
-            newname = install_mod_from_folder(mod_root, None, log=self._log)
+            if is_zip:
+                newname = install_mod_from_zip(path, None, log=self._log)
+            else:
+                if (
+                    not (mod_root / "manifest.json").exists()
+                    and not (mod_root / "Manifest.json").exists()
+                ):
+                    raise FileNotFoundError(
+                        "Dropped file/folder does not contain a manifest.json"
+                    )
+                newname = install_mod_from_folder(mod_root, None, log=self._log)
             order = get_load_order()
             if newname not in order:
                 order.append(newname)
@@ -1015,6 +1613,8 @@ class App(BaseTk):
 
 
     def on_enable_selected(self):
+        if self._busy():
+            return
         name = self.selected_mod_name()
         if not name:
             messagebox.showinfo("Mods", "Select a mod first.")
@@ -1029,6 +1629,8 @@ class App(BaseTk):
             messagebox.showinfo("Mods", f"'{name}' already enabled (marked).")
 
     def on_disable_selected(self):
+        if self._busy():
+            return
         name = self.selected_mod_name()
         if not name:
             messagebox.showinfo("Mods", "Select a mod first.")
@@ -1041,6 +1643,8 @@ class App(BaseTk):
         self.refresh_mod_list()
 
     def on_move_up(self):
+        if self._busy():
+            return
         name = self.selected_mod_name()
         if not name:
             return
@@ -1055,6 +1659,8 @@ class App(BaseTk):
             self.refresh_mod_list()
 
     def on_move_down(self):
+        if self._busy():
+            return
         name = self.selected_mod_name()
         if not name:
             return
@@ -1069,13 +1675,21 @@ class App(BaseTk):
             self.refresh_mod_list()
 
     def on_apply_order(self):
-        # Only show conflicts window when the user tries to apply *and* conflicts exist
+        # Only show conflicts window when the user tries to apply *and* conflicts exist;
+        # the scan reads every enabled manifest, so it runs on the worker too
         enabled = get_enabled_mods()
-        conflicts, _ = find_conflicts(enabled if enabled else None)
+        self._run_in_background(
+            lambda _log: find_conflicts(enabled if enabled else None),
+            self._apply_if_no_conflicts,
+            "Apply Order Error",
+        )
+
+    def _apply_if_no_conflicts(self, result):
+        conflicts, manifests = result
         if conflicts:
             self._log(f"Found {len(conflicts)} conflict(s) among enabled mods.")
             # Open the conflicts manager instead of applying
-            self.on_conflicts()
+            self._show_conflicts(conflicts, manifests)
             return
         try:
             if 'is_fm_running' in globals() and is_fm_running():
@@ -1083,18 +1697,24 @@ class App(BaseTk):
                 return
         except Exception:
             pass
-        try:
-            apply_enabled_mods_in_order(self._log)
-            messagebox.showinfo(
+        self._run_in_background(
+            apply_enabled_mods_in_order,
+            lambda _result: messagebox.showinfo(
                 "Apply Order",
                 "All enabled mods applied in load order.\n(Last-write-wins).",
-            )
-        except Exception as e:
-            messagebox.showerror("Apply Order Error", str(e))
+            ),
+            "Apply Order Error",
+        )
 
     def on_conflicts(self):
         enabled = get_enabled_mods()
-        conflicts, manifests = find_conflicts(enabled if enabled else None)
+        self._run_in_background(
+            lambda _log: find_conflicts(enabled if enabled else None),
+            lambda result: self._show_conflicts(*result),
+            "Conflicts Error",
+        )
+
+    def _show_conflicts(self, conflicts, manifests):
         if not conflicts:
             messagebox.showinfo("Conflicts", "No file overlaps among enabled mods.")
             return
@@ -1147,6 +1767,8 @@ class App(BaseTk):
             ttk.Checkbutton(box_frame, text=m, variable=var).pack(anchor="w")
 
         def apply_disables():
+            if self._busy():
+                return
             changed = []
             enabled_now = get_enabled_mods()
             for mod_name, var in mods_to_disable.items():
@@ -1192,16 +1814,21 @@ class App(BaseTk):
             if not sel:
                 return
             rp = rps[sel[0]]
-            try:
-                base = get_target()
-                if not base or not base.exists():
-                    messagebox.showerror("Rollback Error", "No valid FM26 target set.")
-                    return
-                rollback_to_restore_point(rp, base, self._log)
+            base = get_target()
+            if not base or not base.exists():
+                messagebox.showerror("Rollback Error", "No valid FM26 target set.")
+                return
+
+            def done(_result):
                 messagebox.showinfo("Rollback", f"Rolled back to {rp}.")
-                win.destroy()
-            except Exception as e:
-                messagebox.showerror("Rollback Error", str(e))
+                if win.winfo_exists():
+                    win.destroy()
+
+            self._run_in_background(
+                lambda log: rollback_to_restore_point(rp, base, log),
+                done,
+                "Rollback Error",
+            )
 
         ttk.Button(win, text="Rollback to selected", command=do_rb).pack(pady=(0, 8))
 
@@ -1215,9 +1842,6 @@ class App(BaseTk):
     def on_open_mods(self):
         safe_open_path(MODS_DIR)
 
-    def on_open_logs_folder(self):
-        safe_open_path(LOGS_DIR)
-
     def on_show_manifest_help(self):
         txt = (
             "Each mod must include a manifest.json at its root:\n\n"
@@ -4,9 +4,12 @@ Handles fetching, caching, and version comparison for the trusted mod store.
 """
 
 import copy
+import http.client
 import json
 import os
+import threading
 import time
+import urllib.parse
 import urllib.request
 import urllib.error
 from pathlib import Path
@@ -27,6 +30,9 @@ except ImportError:
 DEFAULT_STORE_URL = "https://raw.githubusercontent.com/jo13310/FM_Reloaded_Trusted_Store/main/mods.json"
 CACHE_DURATION_MINUTES = 1
 DEFAULT_TAG_PREFIX = "v"
+_USER_AGENT = "FMReloaded-ModManager/1.0"
+_MAX_IDLE_PER_HOST = 4
+_MAX_REDIRECTS = 5
 
 
 class ModStoreAPI:
@@ -46,6 +52,126 @@ class ModStoreAPI:
         self.cache_file = self.cache_dir / "store_cache.json"
         self._cache: Optional[Dict] = None
         self._cache_timestamp: Optional[float] = None
+        # ETag / Last-Modified of the cached index, for conditional refetches
+        self._etag: Optional[str] = None
+        self._last_modified: Optional[str] = None
+        # Lower-cased name -> mod, for the mods list it was built from
+        self._by_name: Dict[str, Dict] = {}
+        self._by_name_source: Optional[List[Dict]] = None
+        # Parsed manifests by URL; dropped whenever the store index changes
+        self._manifest_cache: Dict[str, Dict] = {}
+
+        # Small per-host pool of keep-alive connections shared by index
+        # fetches, manifest fetches and downloads (which may run in parallel)
+        self._idle: Dict[Tuple[str, str], List[http.client.HTTPConnection]] = {}
+        self._pool_lock = threading.Lock()
+
+    def _acquire(self, key: Tuple[str, str]) -> http.client.HTTPConnection:
+        """Take an idle connection for (scheme, host) or open a new one."""
+        with self._pool_lock:
+            idle = self._idle.get(key)
+            if idle:
+                return idle.pop()
+        scheme, host = key
+        conn_cls = http.client.HTTPConnection if scheme == "http" else http.client.HTTPSConnection
+        return conn_cls(host, timeout=30)
+
+    def _release(self, key: Tuple[str, str], conn: http.client.HTTPConnection, response) -> None:
+        """Return a drained connection to the pool (or close it if the server asked to)."""
+        if response.will_close:
+            conn.close()
+            return
+        with self._pool_lock:
+            idle = self._idle.setdefault(key, [])
+            if len(idle) < _MAX_IDLE_PER_HOST:
+                idle.append(conn)
+                return
+        conn.close()
+
+    def close(self) -> None:
+        """Close pooled keep-alive connections (reopened lazily on next request)."""
+        with self._pool_lock:
+            idle, self._idle = self._idle, {}
+        for conns in idle.values():
+            for conn in conns:
+                conn.close()
+
+    def _open(self, url: str, headers: Dict[str, str]):
+        """
+        Send a GET over a pooled connection, following redirects on pooled
+        connections too and retrying once if an idle socket was closed by
+        the server.
+
+        Returns:
+            Tuple of (pool key, connection, response); the caller reads the
+            response and hands the connection back via _release()
+
+        Raises:
+            urllib.error.URLError: Network error or too many redirects
+        """
+        for _ in range(_MAX_REDIRECTS + 1):
+            parsed = urllib.parse.urlsplit(url)
+            key = (parsed.scheme, parsed.netloc)
+            path = parsed.path or "/"
+            if parsed.query:
+                path = f"{path}?{parsed.query}"
+
+            for attempt in (1, 2):
+                conn = self._acquire(key)
+                try:
+                    conn.request("GET", path, headers=headers)
+                    response = conn.getresponse()
+                    break
+                except (http.client.RemoteDisconnected, http.client.BadStatusLine,
+                        ConnectionResetError, BrokenPipeError) as e:
+                    conn.close()
+                    if attempt == 2:
+                        raise urllib.error.URLError(e)
+                except (OSError, http.client.HTTPException) as e:
+                    conn.close()
+                    raise urllib.error.URLError(e)
+
+            location = response.getheader("Location")
+            if response.status in (301, 302, 303, 307, 308) and location:
+                # Drain the body so the connection can be reused
+                response.read()
+                self._release(key, conn, response)
+                url = urllib.parse.urljoin(url, location)
+                continue
+            return key, conn, response
+        raise urllib.error.URLError(f"Too many redirects for {url}")
+
+    def _get(self, request: urllib.request.Request):
+        """
+        GET a whole response body over the connection pool. Non-HTTP URLs
+        fall back to urllib.
+
+        Returns:
+            Tuple of (status, headers, body); status is 200 or 304
+
+        Raises:
+            urllib.error.URLError: Network or HTTP error
+        """
+        url = request.full_url
+        if urllib.parse.urlsplit(url).scheme not in ("http", "https"):
+            with urllib.request.urlopen(request, timeout=10) as response:
+                return response.status or 200, response.headers, response.read()
+
+        key, conn, response = self._open(url, dict(request.header_items()))
+        try:
+            body = response.read()
+        except (OSError, http.client.HTTPException) as e:
+            conn.close()
+            raise urllib.error.URLError(e)
+        self._release(key, conn, response)
+
+        if response.status == 304:
+            return 304, response.headers, b""
+        if response.status >= 400:
+            raise urllib.error.HTTPError(
+                url, response.status, response.reason, response.headers, None
+            )
+        return response.status, response.headers, body
 
     def set_store_url(self, url: str) -> None:
         """Update the store URL and invalidate cache."""
@@ -56,6 +182,9 @@ class ModStoreAPI:
         """Clear the in-memory and file cache."""
         self._cache = None
         self._cache_timestamp = None
+        self._etag = None
+        self._last_modified = None
+        self._manifest_cache.clear()
         if self.cache_file.exists():
             self.cache_file.unlink()
 
@@ -68,7 +197,12 @@ class ModStoreAPI:
         return age_minutes < CACHE_DURATION_MINUTES
 
     def _load_from_cache(self) -> Optional[Dict]:
-        """Load store data from file cache if valid."""
+        """
+        Load store data from file cache if valid.
+
+        An expired file is still loaded into memory (without being returned)
+        so its ETag/Last-Modified can be used for a conditional refetch.
+        """
         if not self.cache_file.exists():
             return None
 
@@ -76,13 +210,15 @@ class ModStoreAPI:
             with open(self.cache_file, 'r', encoding='utf-8') as f:
                 cache_data = json.load(f)
 
-            # Check cache timestamp
             cache_time = cache_data.get('timestamp', 0)
-            age_minutes = (time.time() - cache_time) / 60
+            self._cache = cache_data['data']
+            self._cache_timestamp = cache_time
+            self._etag = cache_data.get('etag')
+            self._last_modified = cache_data.get('last_modified')
 
+            # Check cache timestamp
+            age_minutes = (time.time() - cache_time) / 60
             if age_minutes < CACHE_DURATION_MINUTES:
-                self._cache = cache_data['data']
-                self._cache_timestamp = cache_time
                 return self._cache
 
         except (json.JSONDecodeError, KeyError, IOError) as e:
@@ -95,6 +231,8 @@ class ModStoreAPI:
         try:
             cache_data = {
                 'timestamp': time.time(),
+                'etag': self._etag,
+                'last_modified': self._last_modified,
                 'data': data
             }
             with open(self.cache_file, 'w', encoding='utf-8') as f:
@@ -116,7 +254,7 @@ class ModStoreAPI:
             headers={
                 "Cache-Control": "no-cache",
                 "Pragma": "no-cache",
-                "User-Agent": "FMReloaded-ModManager/1.0",
+                "User-Agent": _USER_AGENT,
             },
         )
 
@@ -139,16 +277,27 @@ class ModStoreAPI:
             return self._cache
 
         # Try loading from file cache
-        if not force_refresh:
+        if not force_refresh and self._cache is None:
             cached = self._load_from_cache()
             if cached:
                 return cached
 
-        # Fetch fresh data from GitHub
+        # Fetch fresh data from GitHub; a stale cache revalidates with a
+        # conditional GET so an unchanged index costs a bodiless 304
         try:
             request = self._build_request(force_refresh)
-            with urllib.request.urlopen(request, timeout=10) as response:
-                data = json.loads(response.read().decode('utf-8'))
+            revalidate = not force_refresh and self._cache is not None
+            if revalidate and self._etag:
+                request.add_header("If-None-Match", self._etag)
+            if revalidate and self._last_modified:
+                request.add_header("If-Modified-Since", self._last_modified)
+
+            status, headers, body = self._get(request)
+            if status == 304 and revalidate:
+                self._cache_timestamp = time.time()
+                return self._cache
+
+            data = json.loads(body.decode('utf-8'))
 
             # Validate structure
             if 'mods' not in data or not isinstance(data['mods'], list):
@@ -157,6 +306,9 @@ class ModStoreAPI:
             # Cache the result
             self._cache = data
             self._cache_timestamp = time.time()
+            self._etag = headers.get('ETag')
+            self._last_modified = headers.get('Last-Modified')
+            self._manifest_cache.clear()
             self._save_to_cache(data)
 
             return data
@@ -233,10 +385,21 @@ class ModStoreAPI:
         Returns:
             Mod dictionary or None if not found
         """
-        for mod in self.get_all_mods():
-            if mod.get('name', '').lower() == name.lower():
-                return mod
-        return None
+        try:
+            mods = self.fetch_store_index().get('mods', [])
+        except (ConnectionError, ValueError) as e:
+            print(f"Error fetching mods: {e}")
+            return None
+        # Rebuild the name index only when a new index list was fetched
+        if self._by_name_source is not mods:
+            by_name: Dict[str, Dict] = {}
+            for mod in mods:
+                key = mod.get('name', '').lower()
+                if key not in by_name:
+                    by_name[key] = self._normalize_mod(mod)
+            self._by_name = by_name
+            self._by_name_source = mods
+        return self._by_name.get(name.lower())
 
     def download_mod(self, download_url: str, destination: Path, progress_callback=None) -> Path:
         """
@@ -277,11 +440,65 @@ class ModStoreAPI:
                 output_path.unlink()
             raise ConnectionError(f"Download failed: {e}")
 
+    def download_mod_spooled(self, download_url: str, max_memory: int = 64 * 1024 * 1024):
+        """
+        Download a mod file into a SpooledTemporaryFile.
+
+        The archive stays in memory up to ``max_memory`` bytes and only
+        spills to disk beyond that, so most mods never touch the filesystem
+        before extraction.
+
+        Args:
+            download_url: Direct download URL (GitHub raw or release asset)
+            max_memory: Spool threshold in bytes
+
+        Returns:
+            Tuple of (filename, file object positioned at 0); caller closes it
+
+        Raises:
+            ConnectionError: Download failed
+        """
+        filename = download_url.split('/')[-1].split('?')[0]
+        spooled = tempfile.SpooledTemporaryFile(max_size=max_memory)
+        try:
+            if urllib.parse.urlsplit(download_url).scheme not in ("http", "https"):
+                with urllib.request.urlopen(download_url, timeout=30) as response:
+                    shutil.copyfileobj(response, spooled, 128 * 1024)
+            else:
+                # Pooled keep-alive connection; chunks are written as they arrive
+                key, conn, response = self._open(download_url, {"User-Agent": _USER_AGENT})
+                if response.status >= 400:
+                    conn.close()
+                    raise urllib.error.HTTPError(
+                        download_url, response.status, response.reason, response.headers, None
+                    )
+                try:
+                    shutil.copyfileobj(response, spooled, 128 * 1024)
+                except BaseException:
+                    conn.close()
+                    raise
+                self._release(key, conn, response)
+        except (urllib.error.URLError, OSError, http.client.HTTPException) as e:
+            spooled.close()
+            raise ConnectionError(f"Download failed: {e}")
+        spooled.seek(0)
+        return filename, spooled
+
     def fetch_manifest(self, manifest_url: str) -> Dict:
-        """Fetch and parse a manifest.json file from a URL."""
+        """
+        Fetch and parse a manifest.json file from a URL.
+
+        Results are cached per URL until the store index changes; callers
+        get their own copy and may modify it.
+        """
+        cached = self._manifest_cache.get(manifest_url)
+        if cached is not None:
+            return copy.deepcopy(cached)
         try:
-            with urllib.request.urlopen(manifest_url, timeout=10) as response:
-                return json.loads(response.read().decode("utf-8"))
+            request = urllib.request.Request(manifest_url, headers={"User-Agent": _USER_AGENT})
+            data = json.loads(self._get(request)[2].decode("utf-8"))
+            self._manifest_cache[manifest_url] = data
+            return copy.deepcopy(data)
         except urllib.error.URLError as e:
             raise ConnectionError(f"Failed to fetch manifest: {e}")
         except json.JSONDecodeError as e: